@@ -19,10 +19,9 @@ def main():
     # Name headset capabilities to be used (see `fove.headset`)
     # (For efficiency, capabilities not requested will not be instanciated)
     caps = (
-        capi.ClientCapabilities.None_
-        + capi.ClientCapabilities.EyeTracking
-        + capi.ClientCapabilities.OrientationTracking
-        + capi.ClientCapabilities.EyesImage
+        capi.ClientCapabilities.EyeTracking
+        | capi.ClientCapabilities.OrientationTracking
+        | capi.ClientCapabilities.EyesImage
     )
 
     # Create headset objects etc. in an idimoatic python way.
@@ -40,10 +39,10 @@ def main():
         print(f"Version: {version.clientMajor}.{version.clientMinor}.{version.clientBuild}")
         print(f"Runtime: {version.runtimeMajor}.{version.runtimeMinor}.{version.runtimeBuild}")
         
-        while not compositor.isReady():
+        while not compositor.isReady().value:
             print("Compositor not ready, waiting...")
             time.sleep(1)
-        print(f"Compositor ready: {compositor.isReady()}")
+        print(f"Compositor ready: {compositor.isReady().value}")
         
         ### Main loop
         while True:
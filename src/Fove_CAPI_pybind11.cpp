@@ -82,9 +82,18 @@ PYBIND11_MODULE(capi, m)
 	defstruct_CalibrationOptions(m);
 	defstruct_HmdAdjustmentData(m);
 
+	defstruct_EyeFrameBundle(m);
+	defstruct_HeadsetStatus(m);
+	defstruct_SceneUpdateQueue(m);
+	defstruct_Matrix44Pair(m);
+	defstruct_ProfileList(m);
+
 	defstruct_Wrappers(m);
 
 	bind_CAPIs(m);
+
+	py::module fast = m.def_submodule("fast", "Allocation-free variants of the most frequently called getters, returning `(value, error)` tuples");
+	bind_FastCAPIs(fast);
 }
 
 } // namespace FovePython
@@ -57,12 +57,17 @@
 
 #include <cmath>
 #include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <iterator>
 #include <memory>
 #include <sstream>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <type_traits>
+#include <utility>
+#include <vector>
 
 #include "bindings.h"
 
@@ -398,6 +403,28 @@ For example, if no position tracking camera is attached, no position tracking wi
 			return (cap1 & cap2) == cap2; // cap1 contains cap2, note the order
 		},
 			 py::is_operator(), "Returns `True` if `cap2 in cap1`.");
+
+	// Not part of the C API: the sets of all eye tracking and all position tracking capabilities,
+	// computed once here rather than by chains of python operators at import time
+	m.attr("ALL_ET_CAPS") = py::cast(
+		Fove_ClientCapabilities::EyeTracking
+		| Fove_ClientCapabilities::GazeDepth
+		| Fove_ClientCapabilities::UserPresence
+		| Fove_ClientCapabilities::UserAttentionShift
+		| Fove_ClientCapabilities::UserIOD
+		| Fove_ClientCapabilities::UserIPD
+		| Fove_ClientCapabilities::EyeTorsion
+		| Fove_ClientCapabilities::EyeShape
+		| Fove_ClientCapabilities::PupilShape
+		| Fove_ClientCapabilities::EyesImage
+		| Fove_ClientCapabilities::EyeballRadius
+		| Fove_ClientCapabilities::IrisRadius
+		| Fove_ClientCapabilities::PupilRadius
+		| Fove_ClientCapabilities::GazedObjectDetection);
+	m.attr("ALL_POS_CAPS") = py::cast(
+		Fove_ClientCapabilities::OrientationTracking
+		| Fove_ClientCapabilities::PositionTracking
+		| Fove_ClientCapabilities::PositionImage);
 }
 
 void defenum_ErrorCode(py::module& m)
@@ -744,6 +771,21 @@ auto define_1D_buffer_protocol(Elem (&data)[Size])
 	};
 }
 
+// define buffer_protocol for a C double array type with element type Elem
+template <typename Elem, std::size_t Rows, std::size_t Cols,
+		  typename = typename std::enable_if<std::is_arithmetic<Elem>::value, Elem>::type>
+auto define_2D_buffer_protocol(Elem (&data)[Rows][Cols])
+{
+	return py::buffer_info{
+		reinterpret_cast<void*>(&data[0][0]),
+		sizeof(Elem),
+		py::format_descriptor<Elem>::format(),
+		2,                                  // ndims
+		{Rows, Cols},                       // dims
+		{sizeof(Elem) * Cols, sizeof(Elem)} // strides
+	};
+}
+
 namespace
 {
 bool operator==(const Fove_Quaternion& self, const Fove_Quaternion& other)
@@ -950,6 +992,12 @@ A vector that represents an position in 3D space.)")
 			return !(self == other);
 		},
 			 py::is_operator(), "Returns `True` if the two vectors are not the same.")
+		.def(
+			"__copy__", [](const Fove_Vec3& self) { return Fove_Vec3(self); },
+			"Returns a copy of the vector.")
+		.def(
+			"__deepcopy__", [](const Fove_Vec3& self, py::dict) { return Fove_Vec3(self); },
+			py::arg("memo"), "Returns a copy of the vector.")
 		.def("__add__", [](Fove_Vec3& self, Fove_Vec3& other) {
 			return Fove_Vec3{self.x + other.x, self.y + other.y, self.z + other.z};
 		},
@@ -995,6 +1043,12 @@ A vector that represents a position or orientation in 2D space, such as screen o
 			return !(self == other);
 		},
 			 py::is_operator(), "Returns `True` if the two vectors are not the same.")
+		.def(
+			"__copy__", [](const Fove_Vec2& self) { return Fove_Vec2(self); },
+			"Returns a copy of the vector.")
+		.def(
+			"__deepcopy__", [](const Fove_Vec2& self, py::dict) { return Fove_Vec2(self); },
+			py::arg("memo"), "Returns a copy of the vector.")
 		.def("__add__", [](Fove_Vec2& self, Fove_Vec2& other) {
 			return Fove_Vec2{self.x + other.x, self.y + other.y};
 		},
@@ -1059,18 +1113,29 @@ void defstruct_Vec2i(py::module& m)
 		.def("__repr__", repr<Fove_Vec2i>, "Returns a string representation of the vector.");
 }
 
-// TODO this should be mapped to a python type whose fields are numpy. how to do that automatically?
 void defstruct_Ray(py::module& m)
 {
-	py::class_<Fove_Ray>(m, "Ray",
+	assert_layout<Fove_Ray, float, 6>();
+
+	py::class_<Fove_Ray>(m, "Ray", py::buffer_protocol(),
 						 R"(Struct to represent a Ray
 
-Stores the start point and direction of a Ray)")
+Stores the start point and direction of a Ray
+
+This struct implements buffer_protocol, and thus can be converted
+to a numpy array of shape (2, 3), whose rows are the origin and the direction:
+r = fove.capi.Ray()
+a = numpy.array(r, copy=False)
+)")
 		.def(py::init<Fove_Vec3, Fove_Vec3>(),
 			 py::arg_v("origin", Fove_Vec3{0, 0, 0}, "Vec3(0, 0, 0)"),
 			 py::arg_v("direction", Fove_Vec3{0, 0, 1}, "Vec3(0, 0, 1)"))
 		.def_readwrite("origin", &Fove_Ray::origin, "The start point of the Ray")     // Fove_Vec3 {0,0,0}
 		.def_readwrite("direction", &Fove_Ray::direction, "The direction of the Ray") // Fove_Vec3 {0,0,1}
+		.def_buffer([](Fove_Ray& obj) {
+			using Arr2x3 = float(&)[2][3];
+			return define_2D_buffer_protocol(reinterpret_cast<Arr2x3>(obj));
+		})
 		.def(
 			"__eq__", [](const Fove_Ray& self, const Fove_Ray& other) {
 				return self == other;
@@ -1080,6 +1145,12 @@ Stores the start point and direction of a Ray)")
 			return !(self == other);
 		},
 			 py::is_operator(), "Returns `True` if the two rays are not the same.")
+		.def(
+			"__copy__", [](const Fove_Ray& self) { return Fove_Ray(self); },
+			"Returns a copy of the ray.")
+		.def(
+			"__deepcopy__", [](const Fove_Ray& self, py::dict) { return Fove_Ray(self); },
+			py::arg("memo"), "Returns a copy of the ray.")
 		.def("__repr__", repr<Fove_Ray>, "Returns a string representation of the ray.");
 }
 
@@ -1103,17 +1174,35 @@ It is returned by every update function so that you can know which frame the new
 			return !(self == other);
 		},
 			 py::is_operator(), "Returns `True` if the two frame timestamps are not the same.")
+		.def(
+			"__copy__", [](const Fove_FrameTimestamp& self) { return Fove_FrameTimestamp(self); },
+			"Returns a copy of the frame timestamp.")
+		.def(
+			"__deepcopy__", [](const Fove_FrameTimestamp& self, py::dict) { return Fove_FrameTimestamp(self); },
+			py::arg("memo"), "Returns a copy of the frame timestamp.")
 		.def("__repr__", repr<Fove_FrameTimestamp>, "Returns a string representation of the frame timestamps.");
 }
 
 // XXX we do not define __eq__ just yet, as the desired semantics is not so clear: should id and timestamp participate in equalities?
 void defstruct_Pose(py::module& m)
 {
-	py::class_<Fove_Pose>(m, "Pose",
+	// the buffer covers the float members following id and timestamp
+	static_assert(std::is_standard_layout<Fove_Pose>::value, "Struct not in a standard layout where one was expected.");
+	static_assert(offsetof(Fove_Pose, orientation) == 2 * sizeof(uint64_t), "Unexpected offset for the pose orientation.");
+	static_assert(offsetof(Fove_Pose, acceleration) + sizeof(Fove_Vec3) == offsetof(Fove_Pose, orientation) + 22 * sizeof(float),
+				  "Pose floats not packed where they were expected to be.");
+
+	py::class_<Fove_Pose>(m, "Pose", py::buffer_protocol(),
 						  R"(Struct to represent a combination of position and orientation of Fove Headset
 
 This structure is a combination of the Fove headset position and orientation in 3D space, collectively known as the "pose".
-In the future this may also contain acceleration information for the headset, and may also be used for controllers.)")
+In the future this may also contain acceleration information for the headset, and may also be used for controllers.
+
+This struct implements buffer_protocol as a float32 array of its 22 float members, without id and timestamp:
+the orientation (x, y, z, w), then the angular velocity, angular acceleration, position, standing position,
+velocity and acceleration (x, y, z) each, so that a pose can be used in numpy expressions without copy:
+a = numpy.asarray(pose)
+orientation, position = a[0:4], a[10:13])")
 		.def(py::init<uint64_t, uint64_t, Fove_Quaternion,
 					  Fove_Vec3, Fove_Vec3, Fove_Vec3, Fove_Vec3, Fove_Vec3, Fove_Vec3>(),
 			 py::arg("id") = 0,
@@ -1143,6 +1232,16 @@ In the future this may also contain acceleration information for the headset, an
 					   "The velocity of headset in 3D space") // Fove_Vec3 {}
 		.def_readwrite("acceleration", &Fove_Pose::acceleration,
 					   "The acceleration of headset in 3D space") // Fove_Vec3 {}
+		.def_buffer([](Fove_Pose& obj) {
+			using Arr22 = float(&)[22];
+			return define_1D_buffer_protocol(reinterpret_cast<Arr22>(obj.orientation));
+		})
+		.def(
+			"__copy__", [](const Fove_Pose& self) { return Fove_Pose(self); },
+			"Returns a copy of the pose.")
+		.def(
+			"__deepcopy__", [](const Fove_Pose& self, py::dict) { return Fove_Pose(self); },
+			py::arg("memo"), "Returns a copy of the pose.")
 		.def("__repr__", repr<Fove_Pose>, "Returns a string representation of the pose.");
 }
 
@@ -1163,6 +1262,9 @@ void defenum_Eye(py::module& m)
 )")
 		.value("Left", Fove_Eye::Left)
 		.value("Right", Fove_Eye::Right);
+	// Let the per-eye functions also take the plain integer value of the eye,
+	// the conversion only being attempted when the argument is not already a `capi.Eye`
+	py::implicitly_convertible<int, Fove_Eye>();
 }
 
 void defenum_EyeState(py::module& m)
@@ -1178,21 +1280,6 @@ void defenum_EyeState(py::module& m)
 		.value("Closed", Fove_EyeState::Closed);
 }
 
-// define buffer_protocol for a C double array type with element type Elem
-template <typename Elem, std::size_t Rows, std::size_t Cols,
-		  typename = typename std::enable_if<std::is_arithmetic<Elem>::value, Elem>::type>
-auto define_2D_buffer_protocol(Elem (&data)[Rows][Cols])
-{
-	return py::buffer_info{
-		reinterpret_cast<void*>(&data[0][0]),
-		sizeof(Elem),
-		py::format_descriptor<Elem>::format(),
-		2,                                  // ndims
-		{Rows, Cols},                       // dims
-		{sizeof(Elem) * Cols, sizeof(Elem)} // strides
-	};
-}
-
 using Python_Matrix44 = Obj<Fove_Matrix44>;
 void defstruct_Matrix44(py::module& m)
 {
@@ -1205,11 +1292,152 @@ m = fove.capi.Matrix44()
 a = numpy.array(m, copy=False)
 )")
 		.def(py::init<>())
+		.def(
+			"__copy__", [](const Python_Matrix44& self) { return Python_Matrix44(self); },
+			"Returns a copy of the matrix.")
+		.def(
+			"__deepcopy__", [](const Python_Matrix44& self, py::dict) { return Python_Matrix44(self); },
+			py::arg("memo"), "Returns a copy of the matrix.")
 		.def_buffer([](Python_Matrix44& obj) {
 			return define_2D_buffer_protocol(obj.val.mat);
 		});
 }
 
+// Not part of the C API: the left and right matrices written by the functions returning both,
+// stored contiguously so that they can be viewed as a single (2, 4, 4) array
+struct Matrix44Pair
+{
+	Python_Matrix44 left;
+	Python_Matrix44 right;
+};
+
+void defstruct_Matrix44Pair(py::module& m)
+{
+	assert_layout<Python_Matrix44, float, 16>();
+	assert_layout<Matrix44Pair, float, 32>();
+
+	py::class_<Matrix44Pair>(m, "Matrix44Pair", py::buffer_protocol(),
+							 R"(The left and right matrices written at once by the functions returning both
+
+It can be unpacked as `left, right = pair`, and implements buffer_protocol as a (2, 4, 4) float32 array,
+the left matrix first, so that both matrices can be used in a single numpy expression without copy:
+a = numpy.asarray(pair)
+)")
+		.def(py::init<>())
+		.def_readonly("left", &Matrix44Pair::left, "The matrix of the left eye")
+		.def_readonly("right", &Matrix44Pair::right, "The matrix of the right eye")
+		.def("__len__", [](const Matrix44Pair&) { return 2; })
+		.def(
+			"__getitem__", [](Matrix44Pair& self, int i) -> Python_Matrix44& {
+				if (i == 0 || i == -2)
+					return self.left;
+				if (i == 1 || i == -1)
+					return self.right;
+				throw py::index_error("Matrix44Pair index out of range");
+			},
+			py::return_value_policy::reference_internal)
+		.def(
+			"__copy__", [](const Matrix44Pair& self) { return Matrix44Pair(self); },
+			"Returns a copy of the matrices.")
+		.def(
+			"__deepcopy__", [](const Matrix44Pair& self, py::dict) { return Matrix44Pair(self); },
+			py::arg("memo"), "Returns a copy of the matrices.")
+		.def_buffer([](Matrix44Pair& obj) {
+			return py::buffer_info{
+				reinterpret_cast<void*>(&obj.left.val.mat[0][0]),
+				sizeof(float),
+				py::format_descriptor<float>::format(),
+				3,                                                    // ndims
+				{2, 4, 4},                                            // dims
+				{sizeof(float) * 16, sizeof(float) * 4, sizeof(float)} // strides
+			};
+		});
+}
+
+// Not part of the C API: the profile names listed by Headset_listProfiles,
+// stored back to back in a single string and only converted to python strings when accessed
+struct ProfileList
+{
+	std::string names;
+	std::vector<std::size_t> offsets{0}; // offsets[i] to offsets[i + 1] is the i-th name
+
+	std::size_t size() const { return offsets.size() - 1; }
+
+	py::str get(py::ssize_t i) const
+	{
+		const auto n = static_cast<py::ssize_t>(size());
+		if (i < 0)
+			i += n;
+		if (i < 0 || i >= n)
+			throw py::index_error("ProfileList index out of range");
+		return py::str(names.data() + offsets[i], offsets[i + 1] - offsets[i]);
+	}
+
+	py::list tolist() const
+	{
+		py::list list(size());
+		for (std::size_t i = 0; i < size(); ++i)
+			PyList_SET_ITEM(list.ptr(), i, get(static_cast<py::ssize_t>(i)).release().ptr());
+		return list;
+	}
+};
+
+void defstruct_ProfileList(py::module& m)
+{
+	py::class_<ProfileList>(m, "ProfileList",
+							R"(The names of the profiles listed by `Headset_listProfiles`
+
+It is a read-only sequence of str: the names are kept as a single UTF-8 string,
+and each name is only decoded when accessed, e.g. by `names[i]` or iterating over it.
+Slicing it and `tolist()` return a list of str, and it compares equal to any sequence of the same names,
+e.g. `names == []` if there is no profile.
+)")
+		.def(py::init<>())
+		.def("__len__", &ProfileList::size)
+		.def("__getitem__", &ProfileList::get)
+		.def("__getitem__", [](const ProfileList& self, const py::slice& slice) {
+			py::ssize_t start, stop, step, length;
+			if (!slice.compute(static_cast<py::ssize_t>(self.size()), &start, &stop, &step, &length))
+				throw py::error_already_set();
+			py::list list(length);
+			for (py::ssize_t i = 0; i < length; ++i, start += step)
+				PyList_SET_ITEM(list.ptr(), i, self.get(start).release().ptr());
+			return list;
+		})
+		.def(
+			"__iter__", [](const ProfileList& self) { return py::iter(self.tolist()); },
+			"Iterates over the names, decoding them all at once")
+		.def(
+			"__eq__", [](const ProfileList& self, const py::object& other) -> py::object {
+				if (py::isinstance<ProfileList>(other))
+				{
+					const auto& list = other.cast<const ProfileList&>();
+					return py::bool_(self.names == list.names && self.offsets == list.offsets);
+				}
+				// any sequence but a str, which is a sequence of its characters
+				if (!PySequence_Check(other.ptr()) || py::isinstance<py::str>(other) || py::isinstance<py::bytes>(other))
+					return py::reinterpret_borrow<py::object>(Py_NotImplemented);
+				const py::sequence seq = other.cast<py::sequence>();
+				if (seq.size() != self.size())
+					return py::bool_(false);
+				for (std::size_t i = 0; i < self.size(); ++i)
+					if (!self.get(static_cast<py::ssize_t>(i)).equal(seq[i]))
+						return py::bool_(false);
+				return py::bool_(true);
+			},
+			py::is_operator())
+		.def("tolist", &ProfileList::tolist, "Returns the names as a list of str")
+		.def(
+			"__copy__", [](const ProfileList& self) { return ProfileList(self); },
+			"Returns a copy of the names.")
+		.def(
+			"__deepcopy__", [](const ProfileList& self, py::dict) { return ProfileList(self); },
+			py::arg("memo"), "Returns a copy of the names.")
+		.def("__repr__", [](const ProfileList& self) {
+			return "ProfileList(" + std::string(py::repr(self.tolist())) + ")";
+		});
+}
+
 void defstruct_ProjectionParams(py::module& m)
 {
 	py::class_<Fove_ProjectionParams>(m, "ProjectionParams",
@@ -1225,6 +1453,12 @@ Values are given for a depth of 1 so that it's easy to multiply them by your nea
 		.def_readwrite("right", &Fove_ProjectionParams::right, "Right side (high-X)") // float +1
 		.def_readwrite("top", &Fove_ProjectionParams::top, "Top (high-Y)")            // float +1
 		.def_readwrite("bottom", &Fove_ProjectionParams::bottom, "Bottom (low-Y)")    // float -1
+		.def(
+			"__copy__", [](const Fove_ProjectionParams& self) { return Fove_ProjectionParams(self); },
+			"Returns a copy of the projection params.")
+		.def(
+			"__deepcopy__", [](const Fove_ProjectionParams& self, py::dict) { return Fove_ProjectionParams(self); },
+			py::arg("memo"), "Returns a copy of the projection params.")
 		.def("__repr__", repr<Fove_ProjectionParams>, "Returns a string representation of the projection params.");
 }
 
@@ -1773,16 +2007,28 @@ a = numpy.array(m, copy=False)
 
 void defstruct_PupilShape(py::module& m)
 {
-	py::class_<Fove_PupilShape>(m, "PupilShape", R"(Specity the shape of a pupil as an ellipse
+	assert_layout<Fove_PupilShape, float, 5>();
+
+	py::class_<Fove_PupilShape>(m, "PupilShape", py::buffer_protocol(), R"(Specity the shape of a pupil as an ellipse
 
-Coordinates are in eye-image pixels from (0,0) to (camerawidth, cameraheight), with (0,0) being the top left.)")
+Coordinates are in eye-image pixels from (0,0) to (camerawidth, cameraheight), with (0,0) being the top left.
+
+This struct implements buffer_protocol, and thus can be converted
+to a numpy array of the 5 floats `(center.x, center.y, size.x, size.y, angle)`:
+s = fove.capi.PupilShape()
+a = numpy.array(s, copy=False)
+)")
 		.def(py::init<Fove_Vec2, Fove_Vec2, float>(),
 			 py::arg_v("center", default_Vec2(), "Vec2()"),
 			 py::arg_v("size", default_Vec2(), "Vec2()"),
 			 py::arg("angle") = 0.0f)
 		.def_readwrite("center", &Fove_PupilShape::center, "The center of the ellipse")
 		.def_readwrite("size", &Fove_PupilShape::size, "The width and height of the ellipse")
-		.def_readwrite("angle", &Fove_PupilShape::angle, "A clockwise rotation around the center, in degrees");
+		.def_readwrite("angle", &Fove_PupilShape::angle, "A clockwise rotation around the center, in degrees")
+		.def_buffer([](Fove_PupilShape& obj) {
+			using Arr5 = float(&)[5];
+			return define_1D_buffer_protocol(reinterpret_cast<Arr5>(obj));
+		});
 }
 
 void defstruct_BitmapImage(py::module& m)
@@ -1797,7 +2043,49 @@ void defstruct_BitmapImage(py::module& m)
 					   R"(BMP data (including full header that contains size, format, etc)
 
 The height may be negative to specify a top-down bitmap.)") // Fove_Buffer {}
-		;
+		.def_property_readonly(
+			"pixels", [](const Fove_BitmapImage& self) {
+				// a BITMAPFILEHEADER (14 bytes) followed by at least a BITMAPINFOHEADER (40 bytes)
+				const auto* data = static_cast<const unsigned char*>(self.image.data);
+				if (!data || self.image.length < 54)
+					throw std::runtime_error("Incompatible buffer: too small for a BMP header");
+
+				const auto read = [data](std::size_t offset, auto value) {
+					std::memcpy(&value, data + offset, sizeof(value));
+					return value; // BMP headers are little endian, as are all the platforms of the FOVE runtime
+				};
+				const std::uint32_t pixelOffset = read(10, std::uint32_t{});
+				const std::int32_t width = read(18, std::int32_t{});
+				const std::int32_t height = read(22, std::int32_t{});
+				const std::uint16_t bitsPerPixel = read(28, std::uint16_t{});
+				const std::uint32_t compression = read(30, std::uint32_t{});
+
+				if (compression != 0 /* BI_RGB */ && compression != 3 /* BI_BITFIELDS */)
+					throw std::runtime_error("Incompatible bitmap: compressed images are not supported");
+				if (bitsPerPixel != 8 && bitsPerPixel != 24 && bitsPerPixel != 32)
+					throw std::runtime_error("Incompatible bitmap: expected 8, 24 or 32 bits per pixel! received:" + std::to_string(bitsPerPixel));
+
+				const py::ssize_t channels = bitsPerPixel / 8;
+				const py::ssize_t cols = width;
+				const py::ssize_t rows = height < 0 ? -static_cast<py::ssize_t>(height) : height;
+				const py::ssize_t rowStride = (cols * bitsPerPixel + 31) / 32 * 4; // rows are padded to 4 bytes
+				if (cols <= 0 || pixelOffset + rows * rowStride > static_cast<py::ssize_t>(self.image.length))
+					throw std::runtime_error("Incompatible bitmap: the pixel data does not fit in the buffer");
+
+				// a positive height is a bottom-up bitmap: start from its last row so that the view is always top-down
+				const bool bottomUp = height > 0;
+				const unsigned char* firstRow = data + pixelOffset + (bottomUp ? (rows - 1) * rowStride : 0);
+				return py::memoryview::from_buffer(firstRow,
+												   {rows, cols, channels},
+												   {bottomUp ? -rowStride : rowStride, channels, py::ssize_t{1}});
+			},
+			R"(A read-only view of the pixels of the image, of shape `height x width x channels`
+
+The view is top-down and its rows are not copied, so converting it with `numpy.asarray(image.pixels)` is O(1).
+Channels are in the BMP order, i.e. BGR(A).
+Like `image`, the view is only valid until the next call to the function that returned this image.
+
+\exception RuntimeError If the image is not an uncompressed 8, 24 or 32 bits per pixel bitmap)");
 }
 
 void defstruct_CalibrationTarget(py::module& m)
@@ -1909,7 +2197,13 @@ void defstruct_CalibrationData(py::module& m)
 		.def_readwrite("state", &CalibrationData::state, "The current state of the calibration")
 		.def_readwrite("stateInfo", &CalibrationData::state, "Human readable extra information about the current calibration state")
 		.def_readwrite("targetL", &CalibrationData::targetL, "The current calibration target to display for the left eye")
-		.def_readwrite("targetR", &CalibrationData::targetR, "The current calibration target to display for the right eye");
+		.def_readwrite("targetR", &CalibrationData::targetR, "The current calibration target to display for the right eye")
+		.def(
+			"__copy__", [](const CalibrationData& self) { return CalibrationData(self); },
+			"Returns a copy of the calibration data.")
+		.def(
+			"__deepcopy__", [](const CalibrationData& self, py::dict) { return CalibrationData(self); },
+			py::arg("memo"), "Returns a copy of the calibration data.");
 }
 
 void defstruct_HmdAdjustmentData(py::module& m)
@@ -1954,9 +2248,262 @@ void defstruct_CalibrationOptions(py::module& m)
 		.def_readwrite("eyeTorsion", &Fove_CalibrationOptions::eyeTorsion, "Whether to perform eye torsion calibration or not");
 }
 
+// Not part of the C API: the per-frame eye tracking data and headset pose, filled by a single call to `Headset_getEyeFrameBundle`
+// instead of one python/C crossing per getter.
+// Each field comes with the error code that the corresponding C API getter returned,
+// fields that were not requested keep their defaults and `Data_NoUpdate`.
+struct EyeFrameBundle
+{
+	Fove_Vec3 gazeVectorL = default_Vec3();
+	Fove_Vec3 gazeVectorR = default_Vec3();
+	Fove_Vec2 gazeScreenPositionL = default_Vec2();
+	Fove_Vec2 gazeScreenPositionR = default_Vec2();
+	Fove_Vec2 gazeScreenPositionCombined = default_Vec2();
+	Fove_Ray combinedGazeRay = Fove_Ray{{0, 0, 0}, {0, 0, 1}};
+	float combinedGazeDepth = 0.0f;
+	bool userShiftingAttention = false;
+	Fove_EyeState eyeStateL = Fove_EyeState::NotDetected;
+	Fove_EyeState eyeStateR = Fove_EyeState::NotDetected;
+	float pupilRadiusL = 0.0f;
+	float pupilRadiusR = 0.0f;
+	float irisRadiusL = 0.0f;
+	float irisRadiusR = 0.0f;
+	float eyeballRadiusL = 0.0f;
+	float eyeballRadiusR = 0.0f;
+	float eyeTorsionL = 0.0f;
+	float eyeTorsionR = 0.0f;
+	Fove_PupilShape pupilShapeL{};
+	Fove_PupilShape pupilShapeR{};
+	Python_EyeShape eyeShapeL{};
+	Python_EyeShape eyeShapeR{};
+	float userIPD = 0.0f;
+	float userIOD = 0.0f;
+	bool userPresent = false;
+	int gazedObjectId = fove_ObjectIdInvalid;
+	Fove_FrameTimestamp eyeTrackingTimestamp{};
+	Fove_Pose pose{};
+	Fove_FrameTimestamp poseTimestamp{};
+
+	Fove_ErrorCode gazeVectorLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode gazeVectorRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode gazeScreenPositionLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode gazeScreenPositionRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode gazeScreenPositionCombinedError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode combinedGazeRayError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode combinedGazeDepthError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode userShiftingAttentionError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeStateLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeStateRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode pupilRadiusLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode pupilRadiusRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode irisRadiusLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode irisRadiusRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeballRadiusLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeballRadiusRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTorsionLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTorsionRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode pupilShapeLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode pupilShapeRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeShapeLError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeShapeRError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode userIPDError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode userIODError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode userPresentError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode gazedObjectIdError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTrackingTimestampError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode poseError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode poseTimestampError = Fove_ErrorCode::Data_NoUpdate;
+};
+
+void defstruct_EyeFrameBundle(py::module& m)
+{
+	py::class_<EyeFrameBundle>(m, "EyeFrameBundle", R"(The eye tracking data of the currently cached eye frame
+
+Filled at once by `Headset_getEyeFrameBundle`. Each value has a matching `*Error` field
+holding the error code of the C API getter it was read from.
+Values that were not requested are left to their default, with `Data_NoUpdate` as error code.)")
+		.def(py::init<>())
+		.def_readonly("gazeVectorL", &EyeFrameBundle::gazeVectorL, "The gaze vector of the left eye")
+		.def_readonly("gazeVectorR", &EyeFrameBundle::gazeVectorR, "The gaze vector of the right eye")
+		.def_readonly("gazeScreenPositionL", &EyeFrameBundle::gazeScreenPositionL, "The 2D gaze position of the left eye on its screen")
+		.def_readonly("gazeScreenPositionR", &EyeFrameBundle::gazeScreenPositionR, "The 2D gaze position of the right eye on its screen")
+		.def_readonly("gazeScreenPositionCombined", &EyeFrameBundle::gazeScreenPositionCombined, "The 2D gaze position on a virtual screen in front of the user")
+		.def_readonly("combinedGazeRay", &EyeFrameBundle::combinedGazeRay, "The gaze ray resulting from the two eye gazes combined together")
+		.def_readonly("combinedGazeDepth", &EyeFrameBundle::combinedGazeDepth, "The gaze depth resulting from the two eye gazes combined together")
+		.def_readonly("userShiftingAttention", &EyeFrameBundle::userShiftingAttention, "Whether the user is shifting attention")
+		.def_readonly("eyeStateL", &EyeFrameBundle::eyeStateL, "The state of the left eye")
+		.def_readonly("eyeStateR", &EyeFrameBundle::eyeStateR, "The state of the right eye")
+		.def_readonly("pupilRadiusL", &EyeFrameBundle::pupilRadiusL, "The pupil radius of the left eye, in meters")
+		.def_readonly("pupilRadiusR", &EyeFrameBundle::pupilRadiusR, "The pupil radius of the right eye, in meters")
+		.def_readonly("irisRadiusL", &EyeFrameBundle::irisRadiusL, "The iris radius of the left eye, in meters")
+		.def_readonly("irisRadiusR", &EyeFrameBundle::irisRadiusR, "The iris radius of the right eye, in meters")
+		.def_readonly("eyeballRadiusL", &EyeFrameBundle::eyeballRadiusL, "The eyeball radius of the left eye, in meters")
+		.def_readonly("eyeballRadiusR", &EyeFrameBundle::eyeballRadiusR, "The eyeball radius of the right eye, in meters")
+		.def_readonly("eyeTorsionL", &EyeFrameBundle::eyeTorsionL, "The torsion of the left eye, in degrees")
+		.def_readonly("eyeTorsionR", &EyeFrameBundle::eyeTorsionR, "The torsion of the right eye, in degrees")
+		.def_readonly("pupilShapeL", &EyeFrameBundle::pupilShapeL, "The pupil shape of the left eye")
+		.def_readonly("pupilShapeR", &EyeFrameBundle::pupilShapeR, "The pupil shape of the right eye")
+		.def_readonly("eyeShapeL", &EyeFrameBundle::eyeShapeL, "The shape of the left eye")
+		.def_readonly("eyeShapeR", &EyeFrameBundle::eyeShapeR, "The shape of the right eye")
+		.def_readonly("userIPD", &EyeFrameBundle::userIPD, "The user IPD, in meters")
+		.def_readonly("userIOD", &EyeFrameBundle::userIOD, "The user IOD, in meters")
+		.def_readonly("userPresent", &EyeFrameBundle::userPresent, "Whether the user is wearing the headset")
+		.def_readonly("gazedObjectId", &EyeFrameBundle::gazedObjectId, "The ID of the gazable object currently gazed at, or `fove_ObjectIdInvalid`")
+		.def_readonly("eyeTrackingTimestamp", &EyeFrameBundle::eyeTrackingTimestamp, "The timestamp of the cached eye tracking data")
+		.def_readonly("pose", &EyeFrameBundle::pose, "The cached headset pose")
+		.def_readonly("poseTimestamp", &EyeFrameBundle::poseTimestamp, "The timestamp of the cached pose data")
+		.def_readonly("gazeVectorLError", &EyeFrameBundle::gazeVectorLError)
+		.def_readonly("gazeVectorRError", &EyeFrameBundle::gazeVectorRError)
+		.def_readonly("gazeScreenPositionLError", &EyeFrameBundle::gazeScreenPositionLError)
+		.def_readonly("gazeScreenPositionRError", &EyeFrameBundle::gazeScreenPositionRError)
+		.def_readonly("gazeScreenPositionCombinedError", &EyeFrameBundle::gazeScreenPositionCombinedError)
+		.def_readonly("combinedGazeRayError", &EyeFrameBundle::combinedGazeRayError)
+		.def_readonly("combinedGazeDepthError", &EyeFrameBundle::combinedGazeDepthError)
+		.def_readonly("userShiftingAttentionError", &EyeFrameBundle::userShiftingAttentionError)
+		.def_readonly("eyeStateLError", &EyeFrameBundle::eyeStateLError)
+		.def_readonly("eyeStateRError", &EyeFrameBundle::eyeStateRError)
+		.def_readonly("pupilRadiusLError", &EyeFrameBundle::pupilRadiusLError)
+		.def_readonly("pupilRadiusRError", &EyeFrameBundle::pupilRadiusRError)
+		.def_readonly("irisRadiusLError", &EyeFrameBundle::irisRadiusLError)
+		.def_readonly("irisRadiusRError", &EyeFrameBundle::irisRadiusRError)
+		.def_readonly("eyeballRadiusLError", &EyeFrameBundle::eyeballRadiusLError)
+		.def_readonly("eyeballRadiusRError", &EyeFrameBundle::eyeballRadiusRError)
+		.def_readonly("eyeTorsionLError", &EyeFrameBundle::eyeTorsionLError)
+		.def_readonly("eyeTorsionRError", &EyeFrameBundle::eyeTorsionRError)
+		.def_readonly("pupilShapeLError", &EyeFrameBundle::pupilShapeLError)
+		.def_readonly("pupilShapeRError", &EyeFrameBundle::pupilShapeRError)
+		.def_readonly("eyeShapeLError", &EyeFrameBundle::eyeShapeLError)
+		.def_readonly("eyeShapeRError", &EyeFrameBundle::eyeShapeRError)
+		.def_readonly("userIPDError", &EyeFrameBundle::userIPDError)
+		.def_readonly("userIODError", &EyeFrameBundle::userIODError)
+		.def_readonly("userPresentError", &EyeFrameBundle::userPresentError)
+		.def_readonly("gazedObjectIdError", &EyeFrameBundle::gazedObjectIdError)
+		.def_readonly("eyeTrackingTimestampError", &EyeFrameBundle::eyeTrackingTimestampError)
+		.def_readonly("poseError", &EyeFrameBundle::poseError)
+		.def_readonly("poseTimestampError", &EyeFrameBundle::poseTimestampError);
+}
+
+// Not part of the C API: the status flags of a headset, filled by a single call to `Headset_getStatus`
+// instead of one python/C crossing per flag.
+// Each flag comes with the error code that the corresponding C API function returned.
+struct HeadsetStatus
+{
+	bool eyeTrackingEnabled = false;
+	bool eyeTrackingCalibrated = false;
+	bool eyeTrackingCalibrating = false;
+	bool eyeTrackingCalibratedForGlasses = false;
+	bool hmdAdjustmentGuiVisible = false;
+	bool hmdAdjustmentGuiTimeout = false;
+	bool eyeTrackingReady = false;
+	bool userPresent = false;
+	bool positionReady = false;
+
+	Fove_ErrorCode eyeTrackingEnabledError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTrackingCalibratedError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTrackingCalibratingError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTrackingCalibratedForGlassesError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode hmdAdjustmentGuiVisibleError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode hmdAdjustmentGuiTimeoutError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode eyeTrackingReadyError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode userPresentError = Fove_ErrorCode::Data_NoUpdate;
+	Fove_ErrorCode positionReadyError = Fove_ErrorCode::Data_NoUpdate;
+};
+
+void defstruct_HeadsetStatus(py::module& m)
+{
+	py::class_<HeadsetStatus>(m, "HeadsetStatus", R"(The status flags of a headset
+
+Filled at once by `Headset_getStatus`. Each flag has a matching `*Error` field
+holding the error code of the C API function it was read from.)")
+		.def(py::init<>())
+		.def_readonly("eyeTrackingEnabled", &HeadsetStatus::eyeTrackingEnabled, "Whether eye tracking is running")
+		.def_readonly("eyeTrackingCalibrated", &HeadsetStatus::eyeTrackingCalibrated, "Whether the eye tracking system is calibrated")
+		.def_readonly("eyeTrackingCalibrating", &HeadsetStatus::eyeTrackingCalibrating, "Whether the eye tracking system is calibrating")
+		.def_readonly("eyeTrackingCalibratedForGlasses", &HeadsetStatus::eyeTrackingCalibratedForGlasses, "Whether the eye tracking system is calibrated for glasses")
+		.def_readonly("hmdAdjustmentGuiVisible", &HeadsetStatus::hmdAdjustmentGuiVisible, "Whether the headset adjustment GUI is visible")
+		.def_readonly("hmdAdjustmentGuiTimeout", &HeadsetStatus::hmdAdjustmentGuiTimeout, "Whether the headset adjustment GUI was hidden by timeout")
+		.def_readonly("eyeTrackingReady", &HeadsetStatus::eyeTrackingReady, "Whether eye tracking is actively tracking eyes")
+		.def_readonly("userPresent", &HeadsetStatus::userPresent, "Whether the user is wearing the headset")
+		.def_readonly("positionReady", &HeadsetStatus::positionReady, "Whether position tracking hardware has started")
+		.def_readonly("eyeTrackingEnabledError", &HeadsetStatus::eyeTrackingEnabledError)
+		.def_readonly("eyeTrackingCalibratedError", &HeadsetStatus::eyeTrackingCalibratedError)
+		.def_readonly("eyeTrackingCalibratingError", &HeadsetStatus::eyeTrackingCalibratingError)
+		.def_readonly("eyeTrackingCalibratedForGlassesError", &HeadsetStatus::eyeTrackingCalibratedForGlassesError)
+		.def_readonly("hmdAdjustmentGuiVisibleError", &HeadsetStatus::hmdAdjustmentGuiVisibleError)
+		.def_readonly("hmdAdjustmentGuiTimeoutError", &HeadsetStatus::hmdAdjustmentGuiTimeoutError)
+		.def_readonly("eyeTrackingReadyError", &HeadsetStatus::eyeTrackingReadyError)
+		.def_readonly("userPresentError", &HeadsetStatus::userPresentError)
+		.def_readonly("positionReadyError", &HeadsetStatus::positionReadyError)
+		.def_property_readonly(
+			"bits", [](const HeadsetStatus& self) {
+				unsigned int bits = 0;
+				unsigned int bit = 1;
+				for (const auto& flag : {
+						 std::make_pair(self.eyeTrackingEnabled, self.eyeTrackingEnabledError),
+						 std::make_pair(self.eyeTrackingCalibrated, self.eyeTrackingCalibratedError),
+						 std::make_pair(self.eyeTrackingCalibrating, self.eyeTrackingCalibratingError),
+						 std::make_pair(self.eyeTrackingCalibratedForGlasses, self.eyeTrackingCalibratedForGlassesError),
+						 std::make_pair(self.hmdAdjustmentGuiVisible, self.hmdAdjustmentGuiVisibleError),
+						 std::make_pair(self.hmdAdjustmentGuiTimeout, self.hmdAdjustmentGuiTimeoutError),
+						 std::make_pair(self.eyeTrackingReady, self.eyeTrackingReadyError),
+						 std::make_pair(self.userPresent, self.userPresentError),
+						 std::make_pair(self.positionReady, self.positionReadyError)})
+				{
+					if (flag.first && flag.second == Fove_ErrorCode::None)
+						bits |= bit;
+					bit <<= 1;
+				}
+				return bits;
+			},
+			R"(The flags packed in an int, a bit being set if its flag was read successfully and is true
+
+From the lowest bit: eyeTrackingEnabled, eyeTrackingCalibrated, eyeTrackingCalibrating, eyeTrackingCalibratedForGlasses,
+hmdAdjustmentGuiVisible, hmdAdjustmentGuiTimeout, eyeTrackingReady, userPresent, positionReady.)");
+}
+
+// Not part of the C API: pose updates of the scene objects, queued by the client during a frame
+// and applied at once by `Headset_flushSceneUpdates` instead of one python/C crossing per update.
+struct SceneUpdateQueue
+{
+	std::vector<std::pair<int, Fove_ObjectPose>> gazableObjects;
+	std::vector<std::pair<int, Fove_ObjectPose>> cameraObjects;
+};
+
+void defstruct_SceneUpdateQueue(py::module& m)
+{
+	py::class_<SceneUpdateQueue>(m, "SceneUpdateQueue", R"(Pose updates of gazable objects and cameras, to be applied at once
+
+Poses are copied when queued, and applied in order by `Headset_flushSceneUpdates`.)")
+		.def(py::init<>())
+		.def(
+			"updateGazableObject", [](SceneUpdateQueue& self, const int id, const Fove_ObjectPose& pose) {
+				self.gazableObjects.emplace_back(id, pose);
+			},
+			"Queues a pose update of a gazable object, see `Headset_updateGazableObject`.")
+		.def(
+			"updateCameraObject", [](SceneUpdateQueue& self, const int id, const Fove_ObjectPose& pose) {
+				self.cameraObjects.emplace_back(id, pose);
+			},
+			"Queues a pose update of a camera, see `Headset_updateCameraObject`.")
+		.def(
+			"clear", [](SceneUpdateQueue& self) {
+				self.gazableObjects.clear();
+				self.cameraObjects.clear();
+			},
+			"Drops all the queued updates.")
+		.def(
+			"__len__", [](const SceneUpdateQueue& self) {
+				return self.gazableObjects.size() + self.cameraObjects.size();
+			},
+			"Returns the number of queued updates.");
+}
+
 ////////////////////////////////////////////////////////////////
 // C APIs
 
+// The handles are passed to the bindings as these wrapper objects, not as raw addresses:
+// pybind11 gets the pointer out of one with a type check and a load, which is already the whole conversion,
+// while an integer address would need the same work to be converted back, and lose the type check
 using Headset = Obj<Fove_Headset*>;
 using Compositor = Obj<Fove_Compositor*>;
 
@@ -2097,6 +2644,48 @@ This is necessary as we use CalibrationState enum values as out variables, but p
 			"__ne__", [](const Fove_CalibrationState other, const Obj<Fove_CalibrationState>& self) { return self.val != other; }, py::is_operator());
 }
 
+namespace
+{
+// Shared by Headset_queryLicenses and Headset_queryLicensesInto
+Fove_ErrorCode queryLicenseInfos(Fove_Headset* headset, vector<Python_LicenseInfo>& outLicenses)
+{
+	size_t numLicenses = 0;
+	Fove_ErrorCode error = fove_Headset_queryLicenses(headset, nullptr, &numLicenses);
+	if (error != Fove_ErrorCode::None)
+		return error;
+
+	unique_ptr<Fove_LicenseInfo[]> licenses;
+	if (numLicenses > 0)
+	{
+		licenses = make_unique<Fove_LicenseInfo[]>(numLicenses);
+
+		error = fove_Headset_queryLicenses(headset, licenses.get(), &numLicenses);
+		if (error != Fove_ErrorCode::None)
+			return error;
+	}
+
+	outLicenses.resize(numLicenses);
+	for (size_t i = 0; i < numLicenses; ++i)
+	{
+		Python_LicenseInfo& out = outLicenses[i];
+		Fove_LicenseInfo& in = licenses[i];
+
+		// Fove::UUID uuid;
+		// for (size_t i2 = 0; i2 < 16; ++i2)
+		// 	uuid.bytes[i2] = in.uuid[i2];
+
+		// out.uuid = toString(uuid, false);
+		out.expirationYear = in.expirationYear;
+		out.expirationMonth = in.expirationMonth;
+		out.expirationDay = in.expirationDay;
+		out.licenseType = std::string(in.licenseType); // Null terminated
+		out.licensee = std::string(in.licensee);       // Null terminated
+	}
+
+	return Fove_ErrorCode::None;
+}
+} // namespace
+
 void bind_CAPIs(py::module& m)
 {
 	m.def("logText", &fove_logText,
@@ -2107,12 +2696,18 @@ void bind_CAPIs(py::module& m)
 )");
 
 	// Headset
+	// Functions that go through the runtime service release the GIL with
+	// `py::call_guard<py::gil_scoped_release>()`, so that other python threads can run meanwhile.
+	// They must not touch any python object while doing so.
+	// The getters only reading the data cached by the last fetch keep the GIL,
+	// as releasing and taking it back would cost more than the call itself.
 	// XXX doc changed from CAPI
 	// - "A pointer" -> "Fove_Headset" object
 	m.def(
 		"createHeadset", [](const Fove_ClientCapabilities capabilities, Headset& outHeadset) {
 			return fove_createHeadset(capabilities, outHeadset);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Creates and returns an Fove_Headset object, which is the entry point to the entire API
 
 The result headset should be destroyed using `Headset_destroy` when no longer needed.
@@ -2123,12 +2718,27 @@ The result headset should be destroyed using `Headset_destroy` when no longer ne
 
 	m.def(
 		"Headset_destroy", [](Headset& headset) {
-			return fove_Headset_destroy(headset);
+			const Fove_ErrorCode err = fove_Headset_destroy(headset);
+			// forget the destroyed handle, so that `Headset_isValid` no longer reports it as usable
+			headset.val = nullptr;
+			return err;
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Frees resources used by a headset object, including memory and sockets
 
 Upon return, this headset pointer, and any research headsets from it, should no longer be used.
 \see createHeadset
+)");
+
+	m.def(
+		"Headset_isValid", [](const Headset& headset) {
+			return headset.val != nullptr;
+		},
+		R"(Returns whether the headset object holds a headset created by `createHeadset` and not destroyed yet
+
+This is not part of the FOVE C API.
+\see createHeadset
+\see Headset_destroy
 )");
 
 	m.def(
@@ -2154,6 +2764,7 @@ Upon return, this headset pointer, and any research headsets from it, should no
 		"Headset_checkSoftwareVersions", [](Headset& headset) {
 			return fove_Headset_checkSoftwareVersions(headset);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Checks whether the client can run against the installed version of the FOVE SDK
 
 This makes a blocking call to the runtime.
@@ -2182,6 +2793,7 @@ Otherwise returns an error representing why this can't be determined
 			outVersions.tooOldHeadsetConnected = versions.tooOldHeadsetConnected;
 			return ret;
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Writes out information about the current software versions
 
 Allows you to get detailed information about the client and runtime versions.
@@ -2192,40 +2804,14 @@ This makes a blocking call to the runtime.
 
 	m.def(
 		"Headset_queryLicenses", [](Headset& headset, Fove_ErrorCode& error) -> vector<Python_LicenseInfo> {
-			size_t numLicenses = 0;
-			error = fove_Headset_queryLicenses(headset, nullptr, &numLicenses);
-			if (error != Fove_ErrorCode::None)
-				return {};
-
-			unique_ptr<Fove_LicenseInfo[]> licenses;
-			if (numLicenses > 0)
-			{
-				licenses = make_unique<Fove_LicenseInfo[]>(numLicenses);
-
-				error = fove_Headset_queryLicenses(headset, licenses.get(), &numLicenses);
-				if (error != Fove_ErrorCode::None)
-					return {};
-			}
-
 			vector<Python_LicenseInfo> outLicenses;
-			outLicenses.resize(numLicenses);
-			for (size_t i = 0; i < numLicenses; ++i)
+			Fove_ErrorCode err;
 			{
-				Python_LicenseInfo& out = outLicenses[i];
-				Fove_LicenseInfo& in = licenses[i];
-
-				// Fove::UUID uuid;
-				// for (size_t i2 = 0; i2 < 16; ++i2)
-				// 	uuid.bytes[i2] = in.uuid[i2];
-
-				// out.uuid = toString(uuid, false);
-				out.expirationYear = in.expirationYear;
-				out.expirationMonth = in.expirationMonth;
-				out.expirationDay = in.expirationDay;
-				out.licenseType = std::string(in.licenseType); // Null terminated
-				out.licensee = std::string(in.licensee);       // Null terminated
+				// `error` is a python object, only written back once the GIL is held again
+				py::gil_scoped_release release;
+				err = queryLicenseInfos(headset, outLicenses);
 			}
-
+			error = err;
 			return outLicenses;
 		},
 		R"(Returns information about any licenses currently activated
@@ -2237,6 +2823,33 @@ As soon as a license expires or is otherwise deactivated, it will no longer be r
 
 Usually you do not need to call this function directly.
 To check if a feature is available, simply use the feature, and see if you get a `License_FeatureAccessDenied` error.
+)");
+
+	m.def(
+		"Headset_queryLicensesInto", [](Headset& headset, py::list outLicenses) {
+			vector<Python_LicenseInfo> licenses;
+			Fove_ErrorCode error;
+			{
+				// the list is only filled once the GIL is held again
+				py::gil_scoped_release release;
+				error = queryLicenseInfos(headset, licenses);
+			}
+
+			// clear the list in place, so that the caller's references to it stay valid
+			if (PyList_SetSlice(outLicenses.ptr(), 0, PY_SSIZE_T_MAX, nullptr) != 0)
+				throw py::error_already_set();
+			for (Python_LicenseInfo& license : licenses)
+				outLicenses.append(py::cast(std::move(license)));
+			return error;
+		},
+		R"(Writes out information about any licenses currently activated into the given list
+
+This is not part of the FOVE C API. It is the same as `Headset_queryLicenses`,
+but the list is cleared and filled in place instead of being created on each call,
+and the error code is returned.
+
+\param outLicenses The list to fill with `LicenseInfo` objects
+\return #Fove_ErrorCode_None if the call succeeded
 )");
 
 	// Note: this is treated somewhat specially as pybind11 does not support C arrays directly
@@ -2250,6 +2863,7 @@ To check if a feature is available, simply use the feature, and see if you get a
 			outHardwareInfo.modelName = std::string(info.modelName);
 			return ret;
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Writes out information about the hardware information
 
 Allows you to get serial number, manufacturer, and model name of the headset.
@@ -2259,6 +2873,7 @@ Allows you to get serial number, manufacturer, and model name of the headset.
 		"Headset_registerCapabilities", [](Headset& headset, Fove_ClientCapabilities caps) {
 			return fove_Headset_registerCapabilities(headset, caps);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Registers a client capability, enabling the required hardware as needed
 
 Usually you provide the required capabilities at the creation of the headset
@@ -2273,6 +2888,7 @@ But you can add and remove capabilities anytime while the object is alive.
 		"Headset_registerPassiveCapabilities", [](Headset& headset, Fove_ClientCapabilities caps) {
 			return fove_Headset_registerPassiveCapabilities(headset, caps);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Registers passive capabilities for this client
 
 	The difference between active capabilties (those registered with `fove_Headset_registerCapabilities`) is that
@@ -2300,6 +2916,7 @@ But you can add and remove capabilities anytime while the object is alive.
 		"Headset_unregisterCapabilities", [](Headset& headset, Fove_ClientCapabilities caps) {
 			return fove_Headset_unregisterCapabilities(headset, caps);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Unregisters passive capabilities previously registered by this client
 	Removes passive capabilities previously added by `fove_registerPassiveCapabilities`.
 
@@ -2317,6 +2934,7 @@ But you can add and remove capabilities anytime while the object is alive.
 		"Headset_unregisterPassiveCapabilities", [](Headset& headset, Fove_ClientCapabilities caps) {
 			return fove_Headset_unregisterPassiveCapabilities(headset, caps);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Unregisters a client capability previously registered
 \param caps A set of capabilities to unregister. Unregistering an not-existing capability is a no-op
 \return #Fove_ErrorCode_None if the capability has been properly unregistered
@@ -2326,6 +2944,7 @@ But you can add and remove capabilities anytime while the object is alive.
 		"Headset_waitForProcessedEyeFrame", [](Headset& headset) {
 			return fove_Headset_waitForProcessedEyeFrame(headset);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Waits for next eye camera frame to be processed
 
 Allows you to sync your eye tracking loop to the actual eye-camera loop.
@@ -2344,6 +2963,7 @@ Eye tracking should be enabled by registering the `Fove_ClientCapabilities_EyeTr
 		"Headset_fetchEyeTrackingData", [](Headset& headset, Fove_FrameTimestamp* out) {
 			return fove_Headset_fetchEyeTrackingData(headset, out);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Fetch the latest eye tracking data from the runtime service
 
 This function updates a local cache of eye tracking data, which other getters will fetch from.
@@ -2398,6 +3018,7 @@ Eye tracking should be enabled by registering the `Fove_ClientCapabilities_EyeTr
 		"Headset_fetchEyesImage", [](Headset& headset, Fove_FrameTimestamp* out) {
 			return fove_Headset_fetchEyesImage(headset, out);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Fetch the latest eyes camera image from the runtime service
 
 This function updates a local cache of eyes image, that can be retrieved through `fove_Headset_getEyesImage`.
@@ -2420,6 +3041,35 @@ Eyes image capability should be enabled by registering `Fove_ClientCapabilities_
 \see    fove_Headset_getEyesImage
 \see    fove_Headset_fetchEyeTrackingData
 \see    fove_Headset_waitForProcessedEyeFrame
+)");
+
+	m.def(
+		"Headset_waitAndFetchFrame", [](Headset& headset, Fove_FrameTimestamp* eyeTrackingOut, Fove_FrameTimestamp* eyesImageOut) {
+			Fove_ErrorCode err = fove_Headset_waitForProcessedEyeFrame(headset);
+			if (err != Fove_ErrorCode::None)
+				return err;
+			err = fove_Headset_fetchEyeTrackingData(headset, eyeTrackingOut);
+			if (eyesImageOut)
+			{
+				const Fove_ErrorCode imageErr = fove_Headset_fetchEyesImage(headset, eyesImageOut);
+				if (err == Fove_ErrorCode::None)
+					err = imageErr;
+			}
+			return err;
+		},
+		py::call_guard<py::gil_scoped_release>(),
+		R"(Waits for the next eye frame to be processed, then fetches its eye tracking data and eyes image
+
+Not part of the C API: this is the sequence `fove_Headset_waitForProcessedEyeFrame`,
+`fove_Headset_fetchEyeTrackingData` and `fove_Headset_fetchEyesImage` done in a single call.
+
+\param eyeTrackingOut A pointer to write the frame timestamp of the fetched eye tracking data. If null, the timestamp is not written.
+\param eyesImageOut A pointer to write the frame timestamp of the fetched eyes image. If null, the eyes image is not fetched.
+\return The error of `fove_Headset_waitForProcessedEyeFrame` if it failed, in which case nothing is fetched,
+        otherwise the first error of the fetch calls, or #Fove_ErrorCode_None if all of them succeeded
+\see    fove_Headset_waitForProcessedEyeFrame
+\see    fove_Headset_fetchEyeTrackingData
+\see    fove_Headset_fetchEyesImage
 )");
 
 	m.def(
@@ -2475,6 +3125,22 @@ Basically returns the timestamp returned by the last call to `fove_Headset_fetch
 		#Fove_ErrorCode_API_NullInPointer if both outVector is `nullptr`
 )");
 
+	m.def(
+		"Headset_getGazeVectors", [](Headset& headset, Fove_Vec3& outLeft, Fove_Vec3& outRight) {
+			const Fove_ErrorCode errLeft = fove_Headset_getGazeVector(headset, Fove_Eye::Left, &outLeft);
+			const Fove_ErrorCode errRight = fove_Headset_getGazeVector(headset, Fove_Eye::Right, &outRight);
+			return errLeft != Fove_ErrorCode::None ? errLeft : errRight;
+		},
+		R"(Writes out the gaze vectors of both eyes
+
+Not part of the C API: this is `Headset_getGazeVector` for the left then the right eye, in a single call.
+
+\param outLeft  The left eye gaze vector to write to
+\param outRight  The right eye gaze vector to write to
+\return The error of the left eye if it is not #Fove_ErrorCode_None, and the error of the right eye otherwise,
+        see `Headset_getGazeVector`
+)");
+
 	m.def(
 		"Headset_getGazeVectorRaw", [](Headset& headset, Fove_Eye eye, Fove_Vec3& out) {
 			return fove_Headset_getGazeVectorRaw(headset, eye, &out);
@@ -2616,6 +3282,234 @@ This can be used to ignore eye data during large eye motions when the user is no
 		#Fove_ErrorCode_API_NullInPointer if `outIsShiftingAttention` is `nullptr`
 )");
 
+	m.def(
+		"Headset_getEyeFrameBundle", [](Headset& headset, Fove_ClientCapabilities caps, EyeFrameBundle& out) {
+			const auto requested = [caps](Fove_ClientCapabilities cap) {
+				return (caps & cap) != Fove_ClientCapabilities::None;
+			};
+
+			if (requested(Fove_ClientCapabilities::EyeTracking))
+			{
+				out.gazeVectorLError = fove_Headset_getGazeVector(headset, Fove_Eye::Left, &out.gazeVectorL);
+				out.gazeVectorRError = fove_Headset_getGazeVector(headset, Fove_Eye::Right, &out.gazeVectorR);
+				out.gazeScreenPositionLError = fove_Headset_getGazeScreenPosition(headset, Fove_Eye::Left, &out.gazeScreenPositionL);
+				out.gazeScreenPositionRError = fove_Headset_getGazeScreenPosition(headset, Fove_Eye::Right, &out.gazeScreenPositionR);
+				out.gazeScreenPositionCombinedError = fove_Headset_getGazeScreenPositionCombined(headset, &out.gazeScreenPositionCombined);
+				out.combinedGazeRayError = fove_Headset_getCombinedGazeRay(headset, &out.combinedGazeRay);
+				out.eyeStateLError = fove_Headset_getEyeState(headset, Fove_Eye::Left, &out.eyeStateL);
+				out.eyeStateRError = fove_Headset_getEyeState(headset, Fove_Eye::Right, &out.eyeStateR);
+				out.eyeTrackingTimestampError = fove_Headset_getEyeTrackingDataTimestamp(headset, &out.eyeTrackingTimestamp);
+			}
+			if (requested(Fove_ClientCapabilities::GazeDepth))
+				out.combinedGazeDepthError = fove_Headset_getCombinedGazeDepth(headset, &out.combinedGazeDepth);
+			if (requested(Fove_ClientCapabilities::UserAttentionShift))
+				out.userShiftingAttentionError = fove_Headset_isUserShiftingAttention(headset, &out.userShiftingAttention);
+			if (requested(Fove_ClientCapabilities::PupilRadius))
+			{
+				out.pupilRadiusLError = fove_Headset_getPupilRadius(headset, Fove_Eye::Left, &out.pupilRadiusL);
+				out.pupilRadiusRError = fove_Headset_getPupilRadius(headset, Fove_Eye::Right, &out.pupilRadiusR);
+			}
+			if (requested(Fove_ClientCapabilities::IrisRadius))
+			{
+				out.irisRadiusLError = fove_Headset_getIrisRadius(headset, Fove_Eye::Left, &out.irisRadiusL);
+				out.irisRadiusRError = fove_Headset_getIrisRadius(headset, Fove_Eye::Right, &out.irisRadiusR);
+			}
+			if (requested(Fove_ClientCapabilities::EyeballRadius))
+			{
+				out.eyeballRadiusLError = fove_Headset_getEyeballRadius(headset, Fove_Eye::Left, &out.eyeballRadiusL);
+				out.eyeballRadiusRError = fove_Headset_getEyeballRadius(headset, Fove_Eye::Right, &out.eyeballRadiusR);
+			}
+			if (requested(Fove_ClientCapabilities::EyeTorsion))
+			{
+				out.eyeTorsionLError = fove_Headset_getEyeTorsion(headset, Fove_Eye::Left, &out.eyeTorsionL);
+				out.eyeTorsionRError = fove_Headset_getEyeTorsion(headset, Fove_Eye::Right, &out.eyeTorsionR);
+			}
+			if (requested(Fove_ClientCapabilities::PupilShape))
+			{
+				out.pupilShapeLError = fove_Headset_getPupilShape(headset, Fove_Eye::Left, &out.pupilShapeL);
+				out.pupilShapeRError = fove_Headset_getPupilShape(headset, Fove_Eye::Right, &out.pupilShapeR);
+			}
+			if (requested(Fove_ClientCapabilities::EyeShape))
+			{
+				out.eyeShapeLError = fove_Headset_getEyeShape(headset, Fove_Eye::Left, out.eyeShapeL);
+				out.eyeShapeRError = fove_Headset_getEyeShape(headset, Fove_Eye::Right, out.eyeShapeR);
+			}
+			if (requested(Fove_ClientCapabilities::UserIPD))
+				out.userIPDError = fove_Headset_getUserIPD(headset, &out.userIPD);
+			if (requested(Fove_ClientCapabilities::UserIOD))
+				out.userIODError = fove_Headset_getUserIOD(headset, &out.userIOD);
+			if (requested(Fove_ClientCapabilities::UserPresence))
+				out.userPresentError = fove_Headset_isUserPresent(headset, &out.userPresent);
+			if (requested(Fove_ClientCapabilities::GazedObjectDetection))
+				out.gazedObjectIdError = fove_Headset_getGazedObjectId(headset, &out.gazedObjectId);
+			if (requested(Fove_ClientCapabilities::OrientationTracking | Fove_ClientCapabilities::PositionTracking))
+			{
+				out.poseError = fove_Headset_getPose(headset, &out.pose);
+				out.poseTimestampError = fove_Headset_getPoseDataTimestamp(headset, &out.poseTimestamp);
+			}
+
+			// report the first failure, if any, so that a single check is enough in the common case.
+			// Values whose capability is not registered are skipped, so that requesting more than
+			// what is registered does not hide the status of the rest.
+			bool anyRegistered = false;
+			for (const Fove_ErrorCode err : {out.gazeVectorLError, out.gazeVectorRError,
+											 out.gazeScreenPositionLError, out.gazeScreenPositionRError,
+											 out.gazeScreenPositionCombinedError, out.combinedGazeRayError,
+											 out.eyeStateLError, out.eyeStateRError,
+											 out.combinedGazeDepthError, out.userShiftingAttentionError,
+											 out.pupilRadiusLError, out.pupilRadiusRError,
+											 out.irisRadiusLError, out.irisRadiusRError,
+											 out.eyeballRadiusLError, out.eyeballRadiusRError,
+											 out.eyeTorsionLError, out.eyeTorsionRError,
+											 out.pupilShapeLError, out.pupilShapeRError,
+											 out.eyeShapeLError, out.eyeShapeRError,
+											 out.userIPDError, out.userIODError, out.userPresentError,
+											 out.gazedObjectIdError, out.eyeTrackingTimestampError,
+											 out.poseError, out.poseTimestampError})
+			{
+				if (err == Fove_ErrorCode::API_NotRegistered)
+					continue;
+				anyRegistered = true;
+				if (err != Fove_ErrorCode::None)
+					return err;
+			}
+			return anyRegistered ? Fove_ErrorCode::None : Fove_ErrorCode::API_NotRegistered;
+		},
+		R"(Writes out the eye tracking data of the currently cached eye frame at once
+
+This is not part of the FOVE C API. It is equivalent to calling, for each capability in `caps`, the getters of that capability:
+- `EyeTracking`: `fove_Headset_getGazeVector`, `fove_Headset_getGazeScreenPosition`, `fove_Headset_getEyeState` (for both eyes),
+  `fove_Headset_getGazeScreenPositionCombined`, `fove_Headset_getCombinedGazeRay` and `fove_Headset_getEyeTrackingDataTimestamp`
+- `GazeDepth`: `fove_Headset_getCombinedGazeDepth`
+- `UserAttentionShift`: `fove_Headset_isUserShiftingAttention`
+- `PupilRadius`, `IrisRadius`, `EyeballRadius`, `EyeTorsion`, `PupilShape`, `EyeShape`:
+  `fove_Headset_getPupilRadius`, `fove_Headset_getIrisRadius`, `fove_Headset_getEyeballRadius`,
+  `fove_Headset_getEyeTorsion`, `fove_Headset_getPupilShape`, `fove_Headset_getEyeShape` (for both eyes)
+- `UserIPD`, `UserIOD`, `UserPresence`: `fove_Headset_getUserIPD`, `fove_Headset_getUserIOD`, `fove_Headset_isUserPresent`
+- `GazedObjectDetection`: `fove_Headset_getGazedObjectId`
+- `OrientationTracking` or `PositionTracking`: `fove_Headset_getPose` and `fove_Headset_getPoseDataTimestamp`
+
+and writing each result along with its error code into `outBundle`.
+Other capabilities in `caps` are ignored.
+
+\param caps The capabilities whose data should be read
+\param outBundle The bundle to write the eye tracking data to
+\return #Fove_ErrorCode_None if all the getters succeeded,
+        or the first error code returned by a getter otherwise (see the `*Error` fields of the bundle for details).
+        Getters returning #Fove_ErrorCode_API_NotRegistered are not taken into account,
+        unless none of the requested capabilities is registered.
+)");
+
+	m.def(
+		"Headset_getStatus", [](Headset& headset, HeadsetStatus& out) {
+			out.eyeTrackingEnabledError = fove_Headset_isEyeTrackingEnabled(headset, &out.eyeTrackingEnabled);
+			out.eyeTrackingCalibratedError = fove_Headset_isEyeTrackingCalibrated(headset, &out.eyeTrackingCalibrated);
+			out.eyeTrackingCalibratingError = fove_Headset_isEyeTrackingCalibrating(headset, &out.eyeTrackingCalibrating);
+			out.eyeTrackingCalibratedForGlassesError = fove_Headset_isEyeTrackingCalibratedForGlasses(headset, &out.eyeTrackingCalibratedForGlasses);
+			out.hmdAdjustmentGuiVisibleError = fove_Headset_isHmdAdjustmentGuiVisible(headset, &out.hmdAdjustmentGuiVisible);
+			out.hmdAdjustmentGuiTimeoutError = fove_Headset_hasHmdAdjustmentGuiTimeout(headset, &out.hmdAdjustmentGuiTimeout);
+			out.eyeTrackingReadyError = fove_Headset_isEyeTrackingReady(headset, &out.eyeTrackingReady);
+			out.userPresentError = fove_Headset_isUserPresent(headset, &out.userPresent);
+			out.positionReadyError = fove_Headset_isPositionReady(headset, &out.positionReady);
+
+			// as for `Headset_getEyeFrameBundle`, flags whose capability is not registered are skipped
+			bool anyRegistered = false;
+			for (const Fove_ErrorCode err : {out.eyeTrackingEnabledError, out.eyeTrackingCalibratedError,
+											 out.eyeTrackingCalibratingError, out.eyeTrackingCalibratedForGlassesError,
+											 out.hmdAdjustmentGuiVisibleError, out.hmdAdjustmentGuiTimeoutError,
+											 out.eyeTrackingReadyError, out.userPresentError, out.positionReadyError})
+			{
+				if (err == Fove_ErrorCode::API_NotRegistered)
+					continue;
+				anyRegistered = true;
+				if (err != Fove_ErrorCode::None)
+					return err;
+			}
+			return anyRegistered ? Fove_ErrorCode::None : Fove_ErrorCode::API_NotRegistered;
+		},
+		R"(Writes out all the status flags of the headset at once
+
+This is not part of the FOVE C API. It is equivalent to calling
+`fove_Headset_isEyeTrackingEnabled`, `fove_Headset_isEyeTrackingCalibrated`, `fove_Headset_isEyeTrackingCalibrating`,
+`fove_Headset_isEyeTrackingCalibratedForGlasses`, `fove_Headset_isHmdAdjustmentGuiVisible`,
+`fove_Headset_hasHmdAdjustmentGuiTimeout`, `fove_Headset_isEyeTrackingReady`, `fove_Headset_isUserPresent`
+and `fove_Headset_isPositionReady`, and writing each result along with its error code into `outStatus`.
+
+\param outStatus The status to write the flags to
+\return #Fove_ErrorCode_None if all the functions succeeded,
+        or the first error code returned by a function otherwise (see the `*Error` fields of the status for details).
+        Functions returning #Fove_ErrorCode_API_NotRegistered are not taken into account,
+        unless all of them do.
+)");
+
+	m.def(
+		"Headset_writeGazeRow", [](Headset& headset, py::buffer buffer, std::size_t row) {
+			/* Request a writable buffer descriptor from Python */
+			py::buffer_info info = buffer.request(true);
+
+			if (info.format != py::format_descriptor<float>::format())
+				throw std::runtime_error("Incompatible format: expected a float array! received:" + info.format);
+
+			if (info.ndim != 2)
+				throw std::runtime_error("Incompatible buffer dimension!");
+
+			if (info.shape[1] != 8)
+				throw std::runtime_error("Gaze rows should be composed of 8 components!");
+
+			if (info.strides[1] != sizeof(float))
+				throw std::runtime_error("Col stride should be 1 float");
+
+			if (row >= static_cast<std::size_t>(info.shape[0]))
+				throw py::index_error("Row index out of range");
+
+			float* const out = reinterpret_cast<float*>(static_cast<char*>(info.ptr) + row * info.strides[0]);
+
+			Fove_Vec3 gazeL = default_Vec3();
+			Fove_Vec3 gazeR = default_Vec3();
+			float depth = 0.0f;
+			bool shifting = false;
+			const Fove_ErrorCode errors[] = {
+				fove_Headset_getGazeVector(headset, Fove_Eye::Left, &gazeL),
+				fove_Headset_getGazeVector(headset, Fove_Eye::Right, &gazeR),
+				fove_Headset_getCombinedGazeDepth(headset, &depth),
+				fove_Headset_isUserShiftingAttention(headset, &shifting),
+			};
+
+			out[0] = gazeL.x;
+			out[1] = gazeL.y;
+			out[2] = gazeL.z;
+			out[3] = gazeR.x;
+			out[4] = gazeR.y;
+			out[5] = gazeR.z;
+			out[6] = depth;
+			out[7] = shifting ? 1.0f : 0.0f;
+
+			// the gaze depth and attention shift are optional columns: as in Headset_getEyeFrameBundle,
+			// they do not fail the row when their capability is not registered
+			for (std::size_t i = 0; i < std::size(errors); ++i)
+			{
+				if (i >= 2 && errors[i] == Fove_ErrorCode::API_NotRegistered)
+					continue;
+				if (errors[i] != Fove_ErrorCode::None)
+					return errors[i];
+			}
+			return Fove_ErrorCode::None;
+		},
+		R"(Writes out the gaze data of the currently cached eye frame into a row of a float buffer
+
+This is not part of the FOVE C API. The row is filled with
+`[gazeL.x, gazeL.y, gazeL.z, gazeR.x, gazeR.y, gazeR.z, combinedGazeDepth, userShiftingAttention]`,
+so that the gaze data of many frames can be processed at once, e.g. with numpy.
+Values whose getter failed are written as 0, and so are the combined gaze depth and user attention shift columns
+when `Fove_ClientCapabilities_GazeDepth` and `Fove_ClientCapabilities_UserAttentionShift` are not registered.
+
+\param buffer A writable float32 buffer of shape (N, 8), such as `numpy.zeros((N, 8), dtype=numpy.float32)`
+\param row The index of the row to write, in [0, N)
+\return #Fove_ErrorCode_None if all the getters succeeded,
+        or the first error code returned by a getter otherwise.
+        #Fove_ErrorCode_API_NotRegistered is not taken into account for the gaze depth and attention shift columns.
+)");
+
 	m.def(
 		"Headset_getEyeState", [](Headset& headset, Fove_Eye eye, Obj<Fove_EyeState>& out) {
 			return fove_Headset_getEyeState(headset, eye, out);
@@ -2986,6 +3880,7 @@ The image data buffer is invalidated upon the next call to this function.
 		"Headset_startHmdAdjustmentProcess", [](Headset& headset, bool lazy) {
 			return fove_Headset_startHmdAdjustmentProcess(headset, lazy);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Start the HMD adjustment process. Doing this will display the HMD adjustment GUI.
 
 `Fove_ClientCapabilities_EyeTracking` should be registered to use this function.
@@ -3000,6 +3895,7 @@ The image data buffer is invalidated upon the next call to this function.
 		"Headset_tickHmdAdjustmentProcess", [](Headset& headset, float deltaTime, bool isVisible, Fove_HmdAdjustmentData& data) {
 			return fove_Headset_tickHmdAdjustmentProcess(headset, deltaTime, isVisible, &data);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Tick the current HMD adjustment process and retrieve data information to render the current HMD positioning state
 
 This function is how the client declares to the FOVE system that it is available to render the HMD adjustment process.
@@ -3029,6 +3925,7 @@ before the HMD adjustment processes is marked as completed by the `IsHmdAdjustme
 		"Headset_startEyeTrackingCalibration", [](Headset& headset, const Fove_CalibrationOptions& options) {
 			return fove_Headset_startEyeTrackingCalibration(headset, &options);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Starts eye tracking calibration
 
 `Fove_ClientCapabilities_EyeTracking` should be registered to use this function.
@@ -3044,6 +3941,7 @@ before the HMD adjustment processes is marked as completed by the `IsHmdAdjustme
 		"Headset_stopEyeTrackingCalibration", [](Headset& headset) {
 			return fove_Headset_stopEyeTrackingCalibration(headset);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Stops eye tracking calibration if it's running, does nothing if it's not running.
 
 `Fove_ClientCapabilities_EyeTracking` should be registered to use this function.
@@ -3101,6 +3999,7 @@ Note that it is perfectly fine not to call this function, in which case the Fove
 			};
 			return fove_Headset_tickEyeTrackingCalibration(headset, deltaTime, isVisible, callback, &data);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Tick the current calibration process and retrieve data information to render the current calibration state.
 
 \param deltaTime The time elapsed since the last rendered frame
@@ -3153,6 +4052,7 @@ To use this function, you need to register the `Fove_ClientCapabilities_GazedObj
 		"Headset_registerGazableObject", [](Headset& headset, const Fove_GazableObject& gazableObj) {
 			return fove_Headset_registerGazableObject(headset, &gazableObj);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Registers an object in the 3D world
 
 Registering 3D world objects allows FOVE software to identify which objects are being gazed at.
@@ -3177,6 +4077,7 @@ Connection to the service is not required for object registration, thus you can
 		"Headset_updateGazableObject", [](Headset& headset, const int id, const Fove_ObjectPose& pose) {
 			return fove_Headset_updateGazableObject(headset, id, &pose);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Update a previously registered 3D object pose.
 
 \param objectId     Id of the object passed to fove_Headset_registerGazableObject()
@@ -3192,6 +4093,7 @@ Connection to the service is not required for object registration, thus you can
 		"Headset_removeGazableObject", [](Headset& headset, const int id) {
 			return fove_Headset_removeGazableObject(headset, id);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Removes a previously registered 3D object from the scene.
 
 Because of the asynchronous nature of the FOVE system, this object may still be referenced in future frames for a very short period of time.
@@ -3207,6 +4109,7 @@ Because of the asynchronous nature of the FOVE system, this object may still be
 		"Headset_registerCameraObject", [](Headset& headset, const Fove_CameraObject& cameraObj) {
 			return fove_Headset_registerCameraObject(headset, &cameraObj);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Registers an camera in the 3D world
 
 Registering 3D world objects and camera allows FOVE software to identify which objects are being gazed at.
@@ -3233,6 +4136,7 @@ Connection to the service is not required for object registration, thus you can
 		"Headset_updateCameraObject", [](Headset& headset, const int id, const Fove_ObjectPose& pose) {
 			return fove_Headset_updateCameraObject(headset, id, &pose);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Update the pose of a registered camera
 
 \param cameraId     Id of the camera passed to fove_Headset_registerCameraObject()
@@ -3247,6 +4151,7 @@ Connection to the service is not required for object registration, thus you can
 		"Headset_removeCameraObject", [](Headset& headset, const int id) {
 			return fove_Headset_removeCameraObject(headset, id);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Removes a previously registered camera from the scene.
 
 \param cameraId     Id of the camera passed to fove_Headset_registerCameraObject()
@@ -3254,12 +4159,51 @@ Connection to the service is not required for object registration, thus you can
                     #Fove_ErrorCode_API_InvalidArgument is returned if the object was not already registered
 \see                fove_Headset_registerCameraObject
 \see                fove_Headset_updateCameraObject
+)");
+
+	m.def(
+		"Headset_flushSceneUpdates", [](Headset& headset, SceneUpdateQueue& queue) {
+			// the queue is only touched with the GIL held: its updates are moved out of it first,
+			// so that the updates queued by other threads during the flush are kept for the next one
+			std::vector<std::pair<int, Fove_ObjectPose>> gazableObjects;
+			std::vector<std::pair<int, Fove_ObjectPose>> cameraObjects;
+			gazableObjects.swap(queue.gazableObjects);
+			cameraObjects.swap(queue.cameraObjects);
+
+			py::gil_scoped_release release;
+			// apply everything even after a failure, so that one stale id does not hold back the others
+			Fove_ErrorCode firstErr = Fove_ErrorCode::None;
+			for (const auto& update : gazableObjects)
+			{
+				const Fove_ErrorCode err = fove_Headset_updateGazableObject(headset, update.first, &update.second);
+				if (firstErr == Fove_ErrorCode::None)
+					firstErr = err;
+			}
+			for (const auto& update : cameraObjects)
+			{
+				const Fove_ErrorCode err = fove_Headset_updateCameraObject(headset, update.first, &update.second);
+				if (firstErr == Fove_ErrorCode::None)
+					firstErr = err;
+			}
+			return firstErr;
+		},
+		R"(Applies and clears all the pose updates of a scene update queue
+
+This is not part of the FOVE C API. It is equivalent to calling `fove_Headset_updateGazableObject`
+and `fove_Headset_updateCameraObject` for each queued update, in order.
+
+\param queue        The queued updates, emptied before they are applied, so that it can be refilled meanwhile
+\return             #Fove_ErrorCode_None if all the updates succeeded
+                    or the first error code returned by an update otherwise, the other updates being applied anyway
+\see                fove_Headset_updateGazableObject
+\see                fove_Headset_updateCameraObject
 )");
 
 	m.def(
 		"Headset_tareOrientationSensor", [](Headset& headset) {
 			return fove_Headset_tareOrientationSensor(headset);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Tares the orientation of the headset
 
 Any or both of `Fove_ClientCapabilities_OrientationTracking` and `Fove_ClientCapabilities_PositionTracking`
@@ -3290,6 +4234,7 @@ should be registered to use this function.
 		"Headset_tarePositionSensors", [](Headset& headset) {
 			return fove_Headset_tarePositionSensors(headset);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Tares the position of the headset
 
 `Fove_ClientCapabilities_PositionTracking` should be registered to use this function.
@@ -3303,6 +4248,7 @@ should be registered to use this function.
 		"Headset_fetchPoseData", [](Headset& headset, Fove_FrameTimestamp* out) {
 			return fove_Headset_fetchPoseData(headset, out);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Fetch the latest pose data, and cache it locally
 
 This function caches the headset pose for later retrieval by `fove_Headset_getPose`.
@@ -3328,6 +4274,7 @@ throughout all your update loop code.
 		"Headset_fetchPositionImage", [](Headset& headset, Fove_FrameTimestamp* out) {
 			return fove_Headset_fetchPositionImage(headset, out);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Fetch the latest position camera image, and cache it locally
 
 This function caches the position camera image for later retrieval by `fove_Headset_getPositionImage`.
@@ -3431,6 +4378,11 @@ both to `nullptr` is considered invalid and will return `Fove_ErrorCode::API_Nul
         #Fove_ErrorCode_Data_NoUpdate if no valid data has been returned by the service yet
 		#Fove_ErrorCode_API_NullInPointer if both `outLeftMat` and `outRightMat` are `nullptr`
 )");
+	m.def(
+		"Headset_getProjectionMatricesLH", [](Headset& headset, const float zNear, const float zFar, Matrix44Pair& outMats) {
+			return fove_Headset_getProjectionMatricesLH(headset, zNear, zFar, outMats.left, outMats.right);
+		},
+		"Same as above, but writes both matrices into a `Matrix44Pair`");
 
 	m.def(
 		"Headset_getProjectionMatricesRH", [](Headset& headset, const float zNear, const float zFar, Python_Matrix44& outLeftMat, Python_Matrix44& outRightMat) {
@@ -3450,6 +4402,11 @@ both to `nullptr` is considered invalid and will return `Fove_ErrorCode::API_Nul
         #Fove_ErrorCode_Data_NoUpdate if no valid data has been returned by the service yet
 		#Fove_ErrorCode_API_NullInPointer if both `outLeftMat` and `outRightMat` are `nullptr`
 )");
+	m.def(
+		"Headset_getProjectionMatricesRH", [](Headset& headset, const float zNear, const float zFar, Matrix44Pair& outMats) {
+			return fove_Headset_getProjectionMatricesRH(headset, zNear, zFar, outMats.left, outMats.right);
+		},
+		"Same as above, but writes both matrices into a `Matrix44Pair`");
 
 	m.def(
 		"Headset_getRawProjectionValues", [](Headset& headset, Fove_ProjectionParams& outLeft, Fove_ProjectionParams& outRight) {
@@ -3483,6 +4440,11 @@ This is simply a translation matrix that returns +/- IOD/2
         #Fove_ErrorCode_Data_NoUpdate if no valid data has been returned by the service yet
 		#Fove_ErrorCode_API_NullInPointer if both `outLeft` and `outRight` are `nullptr`
 )");
+	m.def(
+		"Headset_getEyeToHeadMatrices", [](Headset& headset, Matrix44Pair& outMats) {
+			return fove_Headset_getEyeToHeadMatrices(headset, outMats.left, outMats.right);
+		},
+		"Same as above, but writes both matrices into a `Matrix44Pair`");
 
 	m.def(
 		"Headset_getRenderIOD", [](Headset& headset, Obj<float>& outIOD) {
@@ -3502,10 +4464,13 @@ We recommend calling this each frame when doing stereoscopic rendering.
 		#Fove_ErrorCode_API_NullInPointer if `outIOD` is `nullptr`
 )");
 
+	// The profile names are taken as `const std::string&`: pybind11 reads them through PyUnicode_AsUTF8AndSize,
+	// which caches the UTF-8 encoding in the str object itself, so passing the same name again is not re-encoded
 	m.def(
 		"Headset_createProfile", [](Headset& headset, const std::string& profileName) {
 			return fove_Headset_createProfile(headset, profileName.c_str());
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Creates a new profile
 
 The FOVE system keeps a set of profiles so that different users on the same system can store data, such as calibrations, separately.
@@ -3530,6 +4495,7 @@ This function creates a new profile, but does not add any data or switch to it.
 		"Headset_renameProfile", [](Headset& headset, const std::string& oldName, const std::string& newName) {
 			return fove_Headset_renameProfile(headset, oldName.c_str(), newName.c_str());
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Renames an existing profile
 
 This function renames an existing profile. This works on the current profile as well.
@@ -3552,6 +4518,7 @@ This function renames an existing profile. This works on the current profile as
 		"Headset_deleteProfile", [](Headset& headset, const std::string& profileName) {
 			return fove_Headset_deleteProfile(headset, profileName.c_str());
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Deletes an existing profile
 
 This function deletes an existing profile.
@@ -3578,7 +4545,13 @@ In such a case, it is undefined whether any existing profile data loaded into me
 				auto vectorPtr = reinterpret_cast<std::vector<std::string>*>(data);
 				vectorPtr->push_back(val);
 			};
-			err = fove_Headset_listProfiles(headset, callback, &ret);
+			Fove_ErrorCode error;
+			{
+				// `err` is a python object, only written back once the GIL is held again
+				py::gil_scoped_release release;
+				error = fove_Headset_listProfiles(headset, callback, &ret);
+			}
+			err = error;
 			return ret;
 		},
 		R"(Lists all existing profiles
@@ -3593,11 +4566,26 @@ In such a case, it is undefined whether any existing profile data loaded into me
 \see fove_Headset_setCurrentProfile
 \see fove_Headset_queryCurrentProfile
 \see fove_Headset_queryProfileDataPath)");
+	m.def(
+		"Headset_listProfiles", [](Headset& headset, ProfileList& outProfileNames) {
+			ProfileList list;
+			auto callback = [](const char* val, void* data) {
+				auto listPtr = reinterpret_cast<ProfileList*>(data);
+				listPtr->names += val;
+				listPtr->offsets.push_back(listPtr->names.size());
+			};
+			const Fove_ErrorCode err = fove_Headset_listProfiles(headset, callback, &list);
+			outProfileNames = std::move(list);
+			return err;
+		},
+		py::call_guard<py::gil_scoped_release>(),
+		"Same as above, but writes the names into a `ProfileList` and returns the error code");
 
 	m.def(
 		"Headset_setCurrentProfile", [](Headset& headset, const std::string& profileName) {
 			return fove_Headset_setCurrentProfile(headset, profileName.c_str());
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Sets the current profile
 
 When changing profile, the FOVE system will load up data, such as calibration data, if it is available.
@@ -3626,6 +4614,7 @@ Please note that no-ops are OK but you should check for #Fove_ErrorCode_Profile_
 			};
 			return fove_Headset_queryCurrentProfile(headset, callback, &profileName.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Gets the current profile
 
 \param profileName The name of the current profile
@@ -3647,6 +4636,7 @@ Please note that no-ops are OK but you should check for #Fove_ErrorCode_Profile_
 			};
 			return fove_Headset_queryProfileDataPath(headset, profileName.c_str(), callback, &dataPath.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Gets the data folder for a given profile
 
 Allows you to retrieve a filesytem directory where third party apps can write data associated with this profile. This directory will be created before return.
@@ -3676,6 +4666,7 @@ They will need to test for profile name changes and deletions manually in that c
 		"Headset_hasAccessToFeature", [](Headset& headset, const std::string& featureName, Obj<bool>& hasAccess) {
 			return fove_Headset_hasAccessToFeature(headset, featureName.c_str(), &hasAccess.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Returns whether the Headset has access to the given feature.
 
 If the provided feature name doesn't exist, then `false` and `#Fove_ErrorCode_None` are returned.
@@ -3691,6 +4682,7 @@ If the provided feature name doesn't exist, then `false` and `#Fove_ErrorCode_No
 		"Headset_activateLicense", [](Headset& headset, const std::string& licenseKey) {
 			return fove_Headset_activateLicense(headset, licenseKey.c_str());
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Returns whether the license is activated successfully
 
 \param licenseKey
@@ -3702,6 +4694,7 @@ If the provided feature name doesn't exist, then `false` and `#Fove_ErrorCode_No
 		"Headset_deactivateLicense", [](Headset& headset, const std::string& licenseData) {
 			return fove_Headset_deactivateLicense(headset, licenseData.c_str());
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Returns whether the license is deactivated successfully
 
 \param licenseData The license information used for deactivation, can be empty or a guid or a license key
@@ -3714,6 +4707,7 @@ If the provided feature name doesn't exist, then `false` and `#Fove_ErrorCode_No
 		"Headset_createCompositor", [](Headset& headset, Compositor& outCompositor) {
 			return fove_Headset_createCompositor(headset, outCompositor);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Returns a compositor interface from the given headset
 
 Each call to this function creates a new object. The object should be destroyed with Compositor_destroy
@@ -3725,6 +4719,7 @@ It is ok for the compositor to outlive the headset passed in.
 		"Compositor_destroy", [](Compositor& compositor) {
 			return fove_Compositor_destroy(compositor);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Frees resources used by the compositor object, including memory and sockets
 
 Upon return, this compositor pointer should no longer be used.
@@ -3734,6 +4729,7 @@ Upon return, this compositor pointer should no longer be used.
 		"Compositor_createLayer", [](Compositor& compositor, const Fove_CompositorLayerCreateInfo& layerInfo, Fove_CompositorLayer& outLayer) {
 			return fove_Compositor_createLayer(compositor, &layerInfo, &outLayer);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Create a layer for this client.
 
 This function create a layer upon which frames may be submitted to the compositor by this client.
@@ -3754,6 +4750,7 @@ This is a feature we would like to add in the future.
 		"Compositor_submit", [](Compositor& compositor, const Fove_CompositorLayerSubmitInfo& submitInfo, const std::size_t layerCount) {
 			return fove_Compositor_submit(compositor, &submitInfo, layerCount);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Submit a frame to the compositor
 
 This function takes the feed from your game engine to the compositor for output.
@@ -3765,6 +4762,7 @@ This function takes the feed from your game engine to the compositor for output.
 		"Compositor_waitForRenderPose", [](Compositor& compositor, Fove_Pose& outPose) {
 			return fove_Compositor_waitForRenderPose(compositor, &outPose);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Wait for the next pose to use for rendering purposes
 
 All compositor clients should use this function as the sole means of limiting their frame rate.
@@ -3795,21 +4793,51 @@ In general, a client's main loop should look like:
 		"Compositor_isReady", [](Compositor& compositor, Obj<bool>& outIsReady) {
 			return fove_Compositor_isReady(compositor, outIsReady);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Returns true if we are connected to a running compositor and ready to submit frames for compositing)");
 
 	m.def(
 		"Compositor_queryAdapterId", [](Compositor& compositor, Fove_AdapterId& outAdapterId) {
 			return fove_Compositor_queryAdapterId(compositor, &outAdapterId);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Returns the ID of the GPU currently attached to the headset.
 
 For systems with multiple GPUs, submitted textures to the compositor must from the same GPU that the compositor is using
 )");
 
+	m.def(
+		"Compositor_probe", [](Compositor& compositor, Obj<bool>& outIsReady, Fove_AdapterId& outAdapterId, Fove_Pose& outPose) {
+			outIsReady.val = false;
+			Fove_ErrorCode err = fove_Compositor_isReady(compositor, outIsReady);
+			if (err != Fove_ErrorCode::None || !outIsReady.val)
+				return err;
+			err = fove_Compositor_queryAdapterId(compositor, &outAdapterId);
+			if (err != Fove_ErrorCode::None)
+				return err;
+			return fove_Compositor_getLastRenderPose(compositor, &outPose);
+		},
+		py::call_guard<py::gil_scoped_release>(),
+		R"(Checks whether the compositor is ready, and gets its adapter ID and last render pose if it is
+
+Not part of the C API: this is `Compositor_isReady`, followed by `Compositor_queryAdapterId`
+and `Compositor_getLastRenderPose` when the compositor is ready, in a single call,
+for the loops polling a compositor until it can be used.
+It does not wait for a new pose, see `Compositor_waitForRenderPose` for that.
+
+\param outIsReady Whether the compositor is ready, false when the call fails
+\param outAdapterId The ID of the GPU used by the compositor, only written if it is ready
+\param outPose The last cached render pose, only written if the compositor is ready
+\return The first error returned by the underlying calls, #Fove_ErrorCode_None if they all succeeded
+\see Compositor_isReady
+\see Compositor_queryAdapterId
+\see Compositor_getLastRenderPose)");
+
 	m.def(
 		"Config_getValue_bool", [](const char* key, Obj<bool>& outValue) {
 			return fove_Config_getValue_bool(key, &outValue.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Get the value of the provided key from the FOVE config
 
 \param key The key name of the value to retrieve, null-terminated and in UTF-8
@@ -3823,6 +4851,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 		"Config_getValue_int", [](const char* key, Obj<int>& outValue) {
 			return fove_Config_getValue_int(key, &outValue.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Get the value of the provided key from the FOVE config
 
 \param key The key name of the value to retrieve, null-terminated and in UTF-8
@@ -3836,6 +4865,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 		"Config_getValue_float", [](const char* key, Obj<float>& outValue) {
 			return fove_Config_getValue_float(key, &outValue.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Get the value of the provided key from the FOVE config
 
 \param key The key name of the value to retrieve, null-terminated and in UTF-8
@@ -3853,6 +4883,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 			};
 			return fove_Config_getValue_string(key, callback, &outValue.val);
 		},
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Get the value of the provided key from the FOVE config
 
 \param key The key name of the value to retrieve, null-terminated and in UTF-8
@@ -3866,6 +4897,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 
 	m.def(
 		"Config_setValue_bool", &fove_Config_setValue_bool,
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Set the value of the provided key to the FOVE config
 
 \param key The key name of the value to set, null-terminated and in UTF-8
@@ -3879,6 +4911,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 
 	m.def(
 		"Config_setValue_int", &fove_Config_setValue_int,
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Set the value of the provided key to the FOVE config
 
 \param key The key name of the value to set, null-terminated and in UTF-8
@@ -3892,6 +4925,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 
 	m.def(
 		"Config_setValue_float", &fove_Config_setValue_float,
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Set the value of the provided key to the FOVE config
 
 \param key The key name of the value to set, null-terminated and in UTF-8
@@ -3905,6 +4939,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 
 	m.def(
 		"Config_setValue_string", &fove_Config_setValue_string,
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Set the value of the provided key to the FOVE config
 
 \param key The key name of the value to set, null-terminated and in UTF-8
@@ -3918,6 +4953,7 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 
 	m.def(
 		"Config_clearValue", &fove_Config_clearValue,
+		py::call_guard<py::gil_scoped_release>(),
 		R"(Reset the value of the provided key to its default value
 
 \param key The key name of the value to reset, null-terminated and in UTF-8
@@ -3927,4 +4963,269 @@ For systems with multiple GPUs, submitted textures to the compositor must from t
 	        #Fove_ErrorCode_Config_DoesntExist if the provided key doesn't exist)");
 }
 
+////////////////////////////////////////////////////////////////
+// Fast C APIs
+//
+// Variants of the most frequently called getters that do not take an out-parameter object,
+// but return a `(value, error)` tuple whose value is made of plain python objects.
+// They are meant for per-frame loops, where the allocation of the capi structs and wrappers
+// would dominate the cost of the call.
+
+namespace
+{
+py::tuple toTuple(const Fove_Vec3& v)
+{
+	return py::make_tuple(v.x, v.y, v.z);
+}
+py::tuple toTuple(const Fove_Vec2& v)
+{
+	return py::make_tuple(v.x, v.y);
+}
+py::tuple toTuple(const Fove_Ray& ray)
+{
+	return py::make_tuple(toTuple(ray.origin), toTuple(ray.direction));
+}
+py::tuple toTuple(const Fove_FrameTimestamp& ts)
+{
+	return py::make_tuple(ts.id, ts.timestamp);
+}
+} // namespace
+
+void bind_FastCAPIs(py::module& m)
+{
+	m.def(
+		"Headset_fetchEyeTrackingData", [](Headset& headset) {
+			Fove_FrameTimestamp out{0, 0};
+			Fove_ErrorCode err;
+			{
+				// the tuple is built with the GIL, only the fetch itself runs without it
+				py::gil_scoped_release release;
+				err = fove_Headset_fetchEyeTrackingData(headset, &out);
+			}
+			return py::make_tuple(toTuple(out), err);
+		},
+		"Same as `capi.Headset_fetchEyeTrackingData`, but returns `((id, timestamp), error)`");
+
+	m.def(
+		"Headset_getGazeVector", [](Headset& headset, Fove_Eye eye) {
+			Fove_Vec3 out = default_Vec3();
+			const Fove_ErrorCode err = fove_Headset_getGazeVector(headset, eye, &out);
+			return py::make_tuple(toTuple(out), err);
+		},
+		"Same as `capi.Headset_getGazeVector`, but returns `((x, y, z), error)`");
+
+	m.def(
+		"Headset_getGazeScreenPosition", [](Headset& headset, Fove_Eye eye) {
+			Fove_Vec2 out = default_Vec2();
+			const Fove_ErrorCode err = fove_Headset_getGazeScreenPosition(headset, eye, &out);
+			return py::make_tuple(toTuple(out), err);
+		},
+		"Same as `capi.Headset_getGazeScreenPosition`, but returns `((x, y), error)`");
+
+	m.def(
+		"Headset_getGazeScreenPositionCombined", [](Headset& headset) {
+			Fove_Vec2 out = default_Vec2();
+			const Fove_ErrorCode err = fove_Headset_getGazeScreenPositionCombined(headset, &out);
+			return py::make_tuple(toTuple(out), err);
+		},
+		"Same as `capi.Headset_getGazeScreenPositionCombined`, but returns `((x, y), error)`");
+
+	m.def(
+		"Headset_getCombinedGazeRay", [](Headset& headset) {
+			Fove_Ray out{{0, 0, 0}, {0, 0, 1}};
+			const Fove_ErrorCode err = fove_Headset_getCombinedGazeRay(headset, &out);
+			return py::make_tuple(toTuple(out), err);
+		},
+		"Same as `capi.Headset_getCombinedGazeRay`, but returns `(((ox, oy, oz), (dx, dy, dz)), error)`");
+
+	m.def(
+		"Headset_getCombinedGazeDepth", [](Headset& headset) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getCombinedGazeDepth(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getCombinedGazeDepth`, but returns `(depth, error)`");
+
+	m.def(
+		"Headset_isUserShiftingAttention", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isUserShiftingAttention(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isUserShiftingAttention`, but returns `(isShifting, error)`");
+
+	m.def(
+		"Headset_getEyeState", [](Headset& headset, Fove_Eye eye) {
+			Fove_EyeState out = Fove_EyeState::NotDetected;
+			const Fove_ErrorCode err = fove_Headset_getEyeState(headset, eye, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getEyeState`, but returns `(state, error)`");
+
+	m.def(
+		"Headset_isEyeTrackingReady", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isEyeTrackingReady(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isEyeTrackingReady`, but returns `(isReady, error)`");
+
+	m.def(
+		"Headset_isUserPresent", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isUserPresent(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isUserPresent`, but returns `(isPresent, error)`");
+
+	m.def(
+		"Headset_getUserIPD", [](Headset& headset) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getUserIPD(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getUserIPD`, but returns `(ipd, error)`");
+
+	m.def(
+		"Headset_getUserIOD", [](Headset& headset) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getUserIOD(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getUserIOD`, but returns `(iod, error)`");
+
+	m.def(
+		"Headset_getPupilRadius", [](Headset& headset, Fove_Eye eye) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getPupilRadius(headset, eye, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getPupilRadius`, but returns `(radius, error)`");
+
+	m.def(
+		"Headset_getEyeTorsion", [](Headset& headset, Fove_Eye eye) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getEyeTorsion(headset, eye, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getEyeTorsion`, but returns `(angle, error)`");
+
+	m.def(
+		"Headset_getGazedObjectId", [](Headset& headset) {
+			int out = fove_ObjectIdInvalid;
+			const Fove_ErrorCode err = fove_Headset_getGazedObjectId(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getGazedObjectId`, but returns `(objectId, error)`");
+
+	m.def(
+		"Headset_fetchPoseData", [](Headset& headset) {
+			Fove_FrameTimestamp out{0, 0};
+			Fove_ErrorCode err;
+			{
+				// the tuple is built with the GIL, only the fetch itself runs without it
+				py::gil_scoped_release release;
+				err = fove_Headset_fetchPoseData(headset, &out);
+			}
+			return py::make_tuple(toTuple(out), err);
+		},
+		"Same as `capi.Headset_fetchPoseData`, but returns `((id, timestamp), error)`");
+
+	m.def(
+		"Headset_isHardwareConnected", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isHardwareConnected(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isHardwareConnected`, but returns `(isConnected, error)`");
+
+	m.def(
+		"Headset_isMotionReady", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isMotionReady(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isMotionReady`, but returns `(isReady, error)`");
+
+	m.def(
+		"Headset_isEyeTrackingEnabled", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isEyeTrackingEnabled(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isEyeTrackingEnabled`, but returns `(isEnabled, error)`");
+
+	m.def(
+		"Headset_isEyeTrackingCalibrated", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isEyeTrackingCalibrated(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isEyeTrackingCalibrated`, but returns `(isCalibrated, error)`");
+
+	m.def(
+		"Headset_isEyeTrackingCalibrating", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isEyeTrackingCalibrating(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isEyeTrackingCalibrating`, but returns `(isCalibrating, error)`");
+
+	m.def(
+		"Headset_isEyeTrackingCalibratedForGlasses", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isEyeTrackingCalibratedForGlasses(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isEyeTrackingCalibratedForGlasses`, but returns `(isCalibratedForGlasses, error)`");
+
+	m.def(
+		"Headset_isHmdAdjustmentGuiVisible", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isHmdAdjustmentGuiVisible(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isHmdAdjustmentGuiVisible`, but returns `(isVisible, error)`");
+
+	m.def(
+		"Headset_hasHmdAdjustmentGuiTimeout", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_hasHmdAdjustmentGuiTimeout(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_hasHmdAdjustmentGuiTimeout`, but returns `(hasTimeout, error)`");
+
+	m.def(
+		"Headset_isPositionReady", [](Headset& headset) {
+			bool out = false;
+			const Fove_ErrorCode err = fove_Headset_isPositionReady(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_isPositionReady`, but returns `(isReady, error)`");
+
+	m.def(
+		"Headset_getIrisRadius", [](Headset& headset, Fove_Eye eye) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getIrisRadius(headset, eye, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getIrisRadius`, but returns `(radius, error)`");
+
+	m.def(
+		"Headset_getEyeballRadius", [](Headset& headset, Fove_Eye eye) {
+			float out = 0.0f;
+			const Fove_ErrorCode err = fove_Headset_getEyeballRadius(headset, eye, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getEyeballRadius`, but returns `(radius, error)`");
+
+	m.def(
+		"Headset_getRenderIOD", [](Headset& headset) {
+			float out = -1.0f;
+			const Fove_ErrorCode err = fove_Headset_getRenderIOD(headset, &out);
+			return py::make_tuple(out, err);
+		},
+		"Same as `capi.Headset_getRenderIOD`, but returns `(iod, error)`");
+}
+
 } // namespace FovePython
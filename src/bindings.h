@@ -73,6 +73,13 @@ void defstruct_CalibrationData(py::module&);
 void defstruct_CalibrationOptions(py::module&);
 void defstruct_HmdAdjustmentData(py::module&);
 
+void defstruct_EyeFrameBundle(py::module&);
+void defstruct_HeadsetStatus(py::module&);
+void defstruct_SceneUpdateQueue(py::module&);
+void defstruct_Matrix44Pair(py::module&);
+void defstruct_ProfileList(py::module&);
+
 void bind_CAPIs(py::module&);
+void bind_FastCAPIs(py::module&);
 
 } // namespace FovePython
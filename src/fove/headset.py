@@ -22,9 +22,14 @@
 # # For Python 3.11+, just from typing import Self
 from __future__ import annotations  # python 3.7+ only
 
-from typing import Generic, List, Optional, Tuple, Type, TypeVar
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import deepcopy
+from operator import itemgetter
+from typing import Callable, Generic, List, Optional, Tuple, Type, TypeVar
 from types import TracebackType
 import logging
+import threading
 import time
 
 logger = logging.getLogger(__name__)
@@ -32,9 +37,52 @@ logger = logging.getLogger(__name__)
 # FIXME
 from . import capi
 
+# Tuple-returning variants of the hot getters, used where they return the same values as `capi`
+_fast = capi.fast
+
+# Integer values of `capi.Eye`, compared to `int(eye)` which is much cheaper than comparing the enums
+_LEFT = int(capi.Eye.Left)
+_RIGHT = int(capi.Eye.Right)
+
+# Aliases of the capi names used by the per-frame getters,
+# sparing them the lookup of the attribute on the `capi` module at each call
+_EyesImage = capi.ClientCapabilities.EyesImage
+_EyeFrameBundle = capi.EyeFrameBundle
+_HeadsetStatus = capi.HeadsetStatus
+_EyeShape = capi.EyeShape
+_PupilShape = capi.PupilShape
+_Headset_waitForProcessedEyeFrame = capi.Headset_waitForProcessedEyeFrame
+_Headset_fetchEyeTrackingData = capi.Headset_fetchEyeTrackingData
+_Headset_waitAndFetchFrame = capi.Headset_waitAndFetchFrame
+_Headset_getEyeFrameBundle = capi.Headset_getEyeFrameBundle
+_Headset_getStatus = capi.Headset_getStatus
+_Headset_writeGazeRow = capi.Headset_writeGazeRow
+_Headset_getGazeVector = capi.Headset_getGazeVector
+_Headset_getGazeScreenPosition = capi.Headset_getGazeScreenPosition
+_Headset_getGazeScreenPositionCombined = capi.Headset_getGazeScreenPositionCombined
+_Headset_getCombinedGazeRay = capi.Headset_getCombinedGazeRay
+_Headset_getEyesImage = capi.Headset_getEyesImage
+_Headset_getEyeShape = capi.Headset_getEyeShape
+_Headset_getPupilShape = capi.Headset_getPupilShape
+_Headset_getPose = capi.Headset_getPose
+_Headset_fetchPoseData = capi.Headset_fetchPoseData
+_Headset_updateGazableObject = capi.Headset_updateGazableObject
+_Headset_updateCameraObject = capi.Headset_updateCameraObject
+
 T = TypeVar("T")
 
 
+# Returns the integer value of `eye`, a `capi.Eye` or its plain integer value
+#
+# Raises a `ValueError` if it is neither `capi.Eye.Left` nor `capi.Eye.Right`,
+# which would otherwise be passed unchecked to the C API and to the per-eye buffers.
+def _eyeIndex(eye) -> int:
+    e = int(eye)
+    if e != _LEFT and e != _RIGHT:
+        raise ValueError("Invalid eye: {}".format(eye))
+    return e
+
+
 # Note: This sort of leaks capi types to clients,
 # but python2 does not come with class Enum by default
 # List of capabilities usable by clients
@@ -98,51 +146,358 @@ T = TypeVar("T")
 #     EyeBlink = capi.ClientCapabilities.EyeBlink
 
 
+# Properties of a result, as a bit set
+_ACCEPTABLE = 0b001
+_VALID = 0b010
+_RELIABLE = 0b100
+
+# Integer value of `capi.ErrorCode.None_`
+_NO_ERROR = int(capi.ErrorCode.None_)
+_NotRegistered = capi.ErrorCode.API_NotRegistered
+_Unreliable = capi.ErrorCode.Data_Unreliable
+# Value of `fove_ObjectIdInvalid`, the ID when no object is gazed at
+_OBJECT_ID_INVALID = -1
+
+# Properties of a result for each error code value, error codes that are not listed have none
+_ERR_BITS = {
+    _NO_ERROR: _ACCEPTABLE | _VALID | _RELIABLE,
+    int(capi.ErrorCode.Data_LowAccuracy): _ACCEPTABLE | _VALID,
+    int(capi.ErrorCode.Data_Unreliable): _ACCEPTABLE,
+}
+
+
+# Exception raised by the getters of a headset created with `raiseOnError=True` when a call fails
+#
+# @see Headset.__init__
+class FoveError(RuntimeError):
+    # Creates an exception for the given error code
+    def __init__(self, error: capi.ErrorCode) -> None:
+        super().__init__(str(error))
+        # The error code returned by the FOVE API call
+        self.error = error
+
+
+# A plain (value, error) pair
+#
+# For code that only needs the value and the error code, without the `Result` predicates,
+# e.g. to store them along with other named tuples.
+ResultTuple = namedtuple("ResultTuple", ("value", "error"))
+
+
 # Class containing a FOVE API call result value as well as the operation
 # error code status
-class Result(Generic[T]):
+#
+# A Result is created on every API call, so it is a `(value, error)` tuple:
+# creating one does not go through a python `__init__`, and it can be unpacked as in
+# `value, err = headset.getCombinedGazeRay()`.
+class Result(tuple, Generic[T]):
+    __slots__ = ()
+
     # Create a new Result object from a value and error code
-    def __init__(self, value: T, error=capi.ErrorCode.None_) -> None:
-        self._value = value
-        self._error = error
+    def __new__(cls, value: T, error=capi.ErrorCode.None_) -> Result[T]:
+        return tuple.__new__(cls, (value, error))
+
+    # Used by copy and pickle to recreate the Result: the arguments of `Result.__new__`,
+    # rather than the one tuple that `tuple.__getnewargs__` would pass as the value
+    def __getnewargs__(self):
+        return (self[0], self[1])
+
+    # The predicates below compare plain ints rather than going through the enum comparison
 
     def __bool__(self) -> bool:
-        return self.isAcceptable()
+        return (_ERR_BITS.get(int(self[1]), 0) & _ACCEPTABLE) != 0
 
     def __str__(self) -> str:
-        return (self._value if self.succeeded() else self._error).__str__()
+        return str(self[0]) if int(self[1]) == _NO_ERROR else str(self[1])
 
     def isAcceptable(self) -> bool:
-        return (
-            self.error == capi.ErrorCode.None_
-            or self.error == capi.ErrorCode.Data_LowAccuracy
-            or self.error == capi.ErrorCode.Data_Unreliable
-        )
+        return (_ERR_BITS.get(int(self[1]), 0) & _ACCEPTABLE) != 0
 
     # True if value contains valid data
     def isValid(self) -> bool:
-        return (
-            self.error == capi.ErrorCode.None_
-            or self.error == capi.ErrorCode.Data_LowAccuracy
-        )
+        return (_ERR_BITS.get(int(self[1]), 0) & _VALID) != 0
 
     # True if value contains valid and accurate data
     def isReliable(self) -> bool:
-        return self.error == capi.ErrorCode.None_
+        return int(self[1]) == _NO_ERROR
 
     # True if the API call succedeed
     def succeeded(self) -> bool:
-        return self.error == capi.ErrorCode.None_
+        return int(self[1]) == _NO_ERROR
 
     # The error code returned by the FOVE API call
-    @property
-    def error(self) -> capi.ErrorCode:
-        return self._error
+    error = property(itemgetter(1))
 
     # The value return by the FOVE API call
-    @property
-    def value(self) -> T:
-        return self._value
+    value = property(itemgetter(0))
+
+    # Returns a new Result holding a copy of the value
+    #
+    # Some `Headset` getters write their value into a buffer that is reused by the next call
+    # of the same getter, so that the value of their Result is only valid until then.
+    # Use this to keep such a value for longer, e.g. to compare it with the one of the next frame.
+    def copy(self) -> Result[T]:
+        return Result(deepcopy(self[0]), self[1])
+
+    # Returns the value and the error code as a `ResultTuple`
+    def asTuple(self) -> ResultTuple:
+        return ResultTuple(self[0], self[1])
+
+    # Returns a numpy array viewing the value, without copying it
+    #
+    # This is meant for values implementing the buffer protocol,
+    # such as `capi.Vec2`, `capi.Vec3`, `capi.Quaternion`, `capi.Ray` (as a 2x3 array of origin and direction),
+    # `capi.EyeShape`, `capi.PupilShape`, `capi.Matrix44Pair` (as a 2x4x4 array of the left and right matrices)
+    # or `capi.Pose` (as its 22 floats, from the orientation quaternion to the acceleration),
+    # so that vector math can run on them directly rather than through their `x`, `y`, `z` attributes.
+    # The array shares the memory of the value: it is only valid as long as the value is,
+    # see `Result.copy` for values written into a reused buffer.
+    # Requires numpy to be installed.
+    def asNumpy(self):
+        import numpy as np
+
+        return np.asarray(self[0])
+
+
+_Caps = capi.ClientCapabilities
+# Bits of the capabilities checked by the hand-written getters, see `_fastGetter`
+_GAZE_DEPTH = int(_Caps.GazeDepth)
+_USER_ATTENTION_SHIFT = int(_Caps.UserAttentionShift)
+_EYE_SHAPE = int(_Caps.EyeShape)
+_PUPIL_SHAPE = int(_Caps.PupilShape)
+# The capabilities whose data is not meaningful while the user is not wearing the headset,
+# see the `presenceGating` parameter of `Headset.__init__`
+_PRESENCE_GATED = int(
+    _Caps.GazeDepth
+    | _Caps.UserAttentionShift
+    | _Caps.EyeTorsion
+    | _Caps.EyeShape
+    | _Caps.PupilShape
+    | _Caps.EyeballRadius
+    | _Caps.IrisRadius
+    | _Caps.PupilRadius
+    | _Caps.GazedObjectDetection
+)
+# All the eye tracking related capabilities
+ET_CAPS = capi.ALL_ET_CAPS
+# All the headset pose related capabilities
+POS_CAPS = capi.ALL_POS_CAPS
+# The capabilities read by `Headset.getEyeFrameBundle` by default
+_FRAME_CAPS = ET_CAPS | POS_CAPS
+
+
+# Options used by `Headset.startEyeTrackingCalibration` when none are given, only read by the C API
+_DEFAULT_CALIBRATION_OPTIONS = capi.CalibrationOptions()
+
+
+# Out-parameter buffers reused by the `Headset` getters instead of allocating new ones on each call
+#
+# @see _CompositorOutBuffers for those of the `Compositor`
+# Scalar values are unwrapped before being returned, so a single buffer per type is enough.
+# Struct values are returned as is, so they get one buffer per getter (and per eye)
+# and are overwritten by the next call to the same getter: use `Result.copy` to keep them.
+#
+# As a `threading.local`, each thread gets its own set of buffers, created on its first call,
+# so that a value returned to one thread is never overwritten by a call made from another one.
+class _OutBuffers(threading.local):
+    def __init__(self) -> None:
+        self.boolBuf = capi.Bool(False)
+        self.eyeTrackingTimestampBuf = capi.FrameTimestamp()
+        self.eyesImageTimestampBuf = capi.FrameTimestamp()
+        self.poseTimestampBuf = capi.FrameTimestamp()
+        # indexed by `capi.Eye`
+        self.gazeVectorBufs = (capi.Vec3(), capi.Vec3())
+        self.gazeVectorsBufs = (capi.Vec3(), capi.Vec3())
+        self.gazeScreenPositionBufs = (capi.Vec2(), capi.Vec2())
+        self.gazeScreenPositionCombinedBuf = capi.Vec2()
+        self.combinedGazeRayBuf = capi.Ray()
+        self.calibrationDataBuf = capi.CalibrationData()
+        # the images only refer to the pixels owned by the C API, these are not copied either
+        self.eyesImageBuf = capi.BitmapImage()
+        self.positionImageBuf = capi.BitmapImage()
+        self.poseBuf = capi.Pose()
+        # (left, right) pairs
+        self.projectionMatricesLHBufs = capi.Matrix44Pair()
+        self.projectionMatricesRHBufs = capi.Matrix44Pair()
+        self.rawProjectionValuesBufs = (capi.ProjectionParams(), capi.ProjectionParams())
+        self.eyeToHeadMatricesBufs = capi.Matrix44Pair()
+
+
+# Out-parameter buffers reused by the `Compositor` getters, per thread as well
+class _CompositorOutBuffers(threading.local):
+    def __init__(self) -> None:
+        self.boolBuf = capi.Bool(False)
+
+
+# Factories for the `Headset` getters that merely forward to a capi function
+#
+# Each returns a method calling `cfunc` on the headset handle and wrapping its output in a `Result`,
+# so that these getters share a single implementation and the out-parameter buffers of the headset.
+# They build the Result with `_newResult(Result, (value, error))`, which skips the python `Result.__new__`
+# and is about twice as fast as `Result(value, error)`.
+
+_newResult = tuple.__new__
+
+
+# For getters writing a timestamp out-parameter, into the `_OutBuffers` buffer named `bufName`
+def _timestampGetter(cfunc, bufName: str):
+    def getter(self: Headset) -> Result[capi.FrameTimestamp]:
+        timestamp = getattr(self._buffers, bufName)
+        return _newResult(Result, (timestamp, cfunc(self._headset, timestamp)))
+
+    return getter
+
+
+# For `capi.fast` getters, which directly return a (value, error) tuple
+#
+# When the getter requires the capability `cap`, the returned method checks it against the capabilities
+# registered through the headset first: when it is not, it returns `default` with `API_NotRegistered`
+# right away, as the service would, without calling into the C API.
+# The same goes with `Data_Unreliable` when the data of `cap` is withheld as the user is not present.
+def _fastGetter(cfunc, cap: Optional[capi.ClientCapabilities] = None, default=None):
+    if cap is None:
+
+        def getter(self: Headset) -> Result:
+            return _newResult(Result, cfunc(self._headset))
+
+        return getter
+
+    capBit = int(cap)
+
+    def guardedGetter(self: Headset) -> Result:
+        if not self._available & capBit:
+            return self._unavailable(capBit, default)
+        return _newResult(Result, cfunc(self._headset))
+
+    return guardedGetter
+
+
+# For per-eye `capi.fast` getters
+def _fastEyeGetter(cfunc, cap: Optional[capi.ClientCapabilities] = None, default=None):
+    if cap is None:
+
+        def getter(self: Headset, eye: capi.Eye) -> Result:
+            return _newResult(Result, cfunc(self._headset, _eyeIndex(eye)))
+
+        return getter
+
+    capBit = int(cap)
+
+    def guardedGetter(self: Headset, eye: capi.Eye) -> Result:
+        e = _eyeIndex(eye)
+        if not self._available & capBit:
+            return self._unavailable(capBit, default)
+        return _newResult(Result, cfunc(self._headset, e))
+
+    return guardedGetter
+
+
+# For functions taking no argument besides the headset and only returning an error code
+def _noArgCall(cfunc):
+    def call(self: Headset) -> Result[None]:
+        return _newResult(Result, (None, cfunc(self._headset)))
+
+    return call
+
+
+# For getters whose value is also in `capi.EyeFrameBundle` as `field`
+#
+# The returned method reads the value from the bundle of `Headset.getEyeFrameBundle` when there is one
+# for the current eye frame, and calls `getter` otherwise.
+# When given, the capability `cap` of the value has to be available for the bundle to be used, as in `_fastGetter`:
+# otherwise `getter` is called, so that it returns the error of the unavailable (e.g. presence gated) capability.
+def _bundledGetter(getter, field: str, cap: Optional[capi.ClientCapabilities] = None):
+    errField = field + "Error"
+    capBit = -1 if cap is None else int(cap)
+
+    def bundledGetter(self: Headset) -> Result:
+        bundle = self._eyeFrameBundle
+        if bundle is not None and self._available & capBit:
+            return _newResult(Result, (getattr(bundle, field), getattr(bundle, errField)))
+        return getter(self)
+
+    return bundledGetter
+
+
+# For per-eye getters whose values are also in `capi.EyeFrameBundle`, as `field` suffixed with L and R
+def _bundledEyeGetter(getter, field: str, cap: Optional[capi.ClientCapabilities] = None):
+    fieldL, fieldR = field + "L", field + "R"
+    errFieldL, errFieldR = fieldL + "Error", fieldR + "Error"
+    capBit = -1 if cap is None else int(cap)
+
+    def bundledGetter(self: Headset, eye: capi.Eye) -> Result:
+        bundle = self._eyeFrameBundle
+        if bundle is not None and self._available & capBit:
+            if _eyeIndex(eye) == _LEFT:
+                return _newResult(Result, (getattr(bundle, fieldL), getattr(bundle, errFieldL)))
+            return _newResult(Result, (getattr(bundle, fieldR), getattr(bundle, errFieldR)))
+        return getter(self, eye)
+
+    return bundledGetter
+
+
+# For status getters whose flag is also in `capi.HeadsetStatus` as `field`
+#
+# The returned method reads the flag from the status of `Headset.getStatus` when there is one
+# that is not older than `_STATUS_TTL`, and calls `getter` otherwise.
+def _statusGetter(getter, field: str):
+    errField = field + "Error"
+
+    def statusGetter(self: Headset) -> Result[bool]:
+        status = self._status
+        if status is not None and _monotonic() < self._statusExpiry:
+            return _newResult(Result, (getattr(status, field), getattr(status, errField)))
+        return getter(self)
+
+    return statusGetter
+
+
+# How long the status flags read by `Headset.getStatus` are reused at most, in seconds, about one frame
+#
+# The status is also reset by the fetches, this bounds its age for the clients that do not fetch on each frame.
+_STATUS_TTL = 0.01
+
+# How long the user measurements (IPD, IOD, iris and eyeball radii) are reused, in seconds
+#
+# These only change when the user or the headset adjustment changes, so polling them each frame
+# would mostly fetch the same values again. The calls that may change them also clear the cache.
+_MEASUREMENT_TTL = 0.5
+_monotonic = time.monotonic
+
+
+# For getters of user measurements, whose successful result is reused for `_MEASUREMENT_TTL` seconds
+def _cachedGetter(getter, key: str):
+    def cachedGetter(self: Headset) -> Result:
+        cache = self._measurementCache
+        now = _monotonic()
+        cached = cache.get(key)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        result = getter(self)
+        if result.succeeded():
+            cache[key] = (now + _MEASUREMENT_TTL, result)
+        return result
+
+    return cachedGetter
+
+
+# For per-eye getters of user measurements
+def _cachedEyeGetter(getter, key: str):
+    keyL, keyR = key + "L", key + "R"
+
+    def cachedGetter(self: Headset, eye: capi.Eye) -> Result:
+        cache = self._measurementCache
+        cacheKey = keyL if _eyeIndex(eye) == _LEFT else keyR
+        now = _monotonic()
+        cached = cache.get(cacheKey)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        result = getter(self, eye)
+        if result.succeeded():
+            cache[cacheKey] = (now + _MEASUREMENT_TTL, result)
+        return result
+
+    return cachedGetter
 
 
 # Class that manages accesses to headsets
@@ -154,36 +509,49 @@ class Result(Generic[T]):
 # would be as follows:
 #
 # @code
-# with Headset(ClientCapabilities.EyeTracking + ClientCapabilities.OrientationTracking) as headset:
+# with Headset(ClientCapabilities.EyeTracking | ClientCapabilities.OrientationTracking) as headset:
 #     # use headset
 #     pass
 # @endcode
+#
+# A headset may be used from several threads without locking:
+# all the functions of the FOVE C API are thread safe, the out-parameter buffers are per thread,
+# and the rest of the state (cached eye frame bundle and status, measurement cache, scene update queue)
+# is only ever replaced or updated by single operations done while holding the GIL.
+# Getters of different threads thus never wait for one another.
 class Headset(object):
-    Caps = capi.ClientCapabilities
-    ET_CAPS = (
-        Caps.None_
-        + Caps.EyeTracking
-        + Caps.GazeDepth
-        + Caps.UserPresence
-        + Caps.UserAttentionShift
-        + Caps.UserIOD
-        + Caps.UserIPD
-        + Caps.EyeTorsion
-        + Caps.EyeShape
-        + Caps.PupilShape
-        + Caps.EyesImage
-        + Caps.EyeballRadius
-        + Caps.IrisRadius
-        + Caps.PupilRadius
-        + Caps.GazedObjectDetection
+    # A Headset is used from per-frame loops, so avoid a per-instance __dict__.
+    # Every attribute set in `Headset.__init__` has to be listed here.
+    __slots__ = (
+        "_caps",
+        "_active",
+        "_passive",
+        "_registered",
+        "_available",
+        "_presenceGating",
+        "_userAbsent",
+        "_reuse",
+        "_headset",
+        "_eyeFrameBundle",
+        "_status",
+        "_statusExpiry",
+        "_buffers",
+        "_measurementCache",
+        "_sceneUpdates",
+        "_sceneUpdatesPending",
+        "_gazeBuffer",
+        "_gazeBufferRow",
+        "_gazedObjectCallback",
+        "_lastGazedObject",
+        "_fetchHooks",
+        "_executor",
+        "__weakref__",
     )
 
-    POS_CAPS = (
-        Caps.None_
-        + Caps.OrientationTracking
-        + Caps.PositionTracking
-        + Caps.PositionImage
-    )
+    # Kept for compatibility, prefer `capi.ClientCapabilities`
+    Caps = _Caps
+    ET_CAPS = ET_CAPS
+    POS_CAPS = POS_CAPS
 
     # Defines a headset with the given capabilities
     #
@@ -193,35 +561,126 @@ class Headset(object):
     # instead of manually calling them.
     #
     # @param capabilities The desired capabilities (EyeTrackign, OrientationTracking, etc.)
-    # For multiple capabilities, use arithmetic operators as in:
-    # `ClientCapabilities.EyeTracking + ClientCapabilities.PositionTracking`.
+    # For multiple capabilities, combine them with the bitwise or operator as in:
+    # `ClientCapabilities.EyeTracking | ClientCapabilities.PositionTracking`.
+    # (`+` is also supported, but `|` is the flag set semantics.)
+    # @param reuse If True, `Headset.__exit__` keeps the headset alive so that the next `Headset.__enter__`
+    # reuses it instead of creating a new one; call `Headset.close` to destroy it eventually.
+    # @param presenceGating If True, each fetch of the eye tracking data also checks whether the user is present
+    # (when `capi.ClientCapabilities.UserPresence` is registered), and while they are not, the getters of
+    # the per-user eye data (gaze depth, attention shift, eye torsion, eye and pupil shapes, pupil, iris and eyeball radii,
+    # gazed object) return `capi.ErrorCode.Data_Unreliable` without calling into the C API.
+    # @param raiseOnError If True, the functions returning a `Result` return its value directly instead,
+    # and raise a `FoveError` when the error code is not `capi.ErrorCode.None_`.
+    # The headset is then an instance of a subclass of `Headset` implementing this,
+    # which is why this is not supported by the subclasses of `Headset`.
+    # @exception TypeError If `raiseOnError` is True for a subclass of `Headset`
     # @see Headset.__enter__
-    def __init__(self, capabilities: capi.ClientCapabilities) -> None:
+    def __new__(cls, *args, raiseOnError: bool = False, **kwargs) -> Headset:
+        if raiseOnError:
+            if cls is Headset:
+                cls = _RaisingHeadset
+            elif not issubclass(cls, _RaisingHeadset):
+                raise TypeError("raiseOnError is not supported by the subclass %s of Headset" % cls.__name__)
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        capabilities: capi.ClientCapabilities,
+        reuse: bool = False,
+        presenceGating: bool = False,
+        *,
+        raiseOnError: bool = False,
+    ) -> None:
         # Capabilities that the user intends to use
         self._caps: capi.ClientCapabilities = capabilities
+        # The capabilities registered through this headset, actively and passively, as int bit sets,
+        # and their union checked by the getters before calling into the C API.
+        # Capabilities registered on the underlying handle through `capi` directly are not tracked.
+        self._active: int = 0
+        self._passive: int = 0
+        self._registered: int = 0
+        # The registered capabilities whose getters may call into the C API, that is without the gated ones
+        # while the user is known to be absent
+        self._available: int = 0
+        # Whether to withhold the per-user eye data while the user is absent, and whether they were at the last fetch
+        self._presenceGating: bool = presenceGating
+        self._userAbsent: bool = False
+        # Whether the headset is kept alive across `with` blocks
+        self._reuse: bool = reuse
         # A Fove_Headset object where the address of the newly created headset
         # will be written upon success
         self._headset: capi.Fove_Headset = capi.Fove_Headset()
+        # The eye tracking data of the currently cached eye frame, read at once by `Headset.getEyeFrameBundle`.
+        # Reset by `Headset.fetchEyeTrackingData` as it may no longer match the cache.
+        self._eyeFrameBundle: Optional[capi.EyeFrameBundle] = None
+        # The status flags read at once by `Headset.getStatus`, reset along with `_eyeFrameBundle`,
+        # by `Headset.fetchPoseData` and by the calls changing the calibration state,
+        # and only used until `_statusExpiry`, a time of `time.monotonic`.
+        self._status: Optional[capi.HeadsetStatus] = None
+        self._statusExpiry: float = 0.0
+
+        # Out-parameter buffers reused by the getters, one set per thread
+        self._buffers = _OutBuffers()
+        # The user measurement results reused by their getters, as (expiry time, result) by measurement.
+        # Cleared by the calls that may change these measurements, like the calibration.
+        self._measurementCache: dict = {}
+        # Object and camera pose updates queued by `Headset.queueGazableObjectUpdate` and `Headset.queueCameraObjectUpdate`,
+        # and whether there is any, sparing a call to check the queue on each fetch
+        self._sceneUpdates: capi.SceneUpdateQueue = capi.SceneUpdateQueue()
+        self._sceneUpdatesPending: bool = False
+
+        # Ring buffer attached by `Headset.attachGazeBuffer`, and the next row to write in it
+        self._gazeBuffer = None
+        self._gazeBufferRow: int = 0
+
+        # Function set by `Headset.setGazedObjectCallback`, and the gazed object it was last called with
+        self._gazedObjectCallback: Optional[Callable[[int], None]] = None
+        self._lastGazedObject: int = _OBJECT_ID_INVALID
+        # Whether there is anything to do after a successful fetch, sparing the checks when there is not
+        self._fetchHooks: bool = presenceGating
+
+        # Worker thread of `Headset.callAsync`, created on its first call
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     # Creates and tries to connect to the headset.
     #
     # The result headset should be destroyed using `Headset.__exit__` when no longer needed,
     # but consider using the `with` statement instead of manually calling it.
     #
+    # If the headset was kept alive by a previous `Headset.__exit__` (see the `reuse` parameter
+    # of `Headset.__init__`), it is reused as is: the capabilities are registered again
+    # instead of going through a new connection to the service.
+    #
     # @return A Headset object where the handle to the newly created headset is written upon success
     # @exception RuntimeError When failed to create a headset
     # @see Headset.__exit__
     def __enter__(self) -> Headset:
-        logger.debug("Creating headset: {}".format(self._caps))
+        # Formatting the capabilities walks the flag names, only do it when it gets logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if capi.Headset_isValid(self._headset):
+            if debug:
+                logger.debug("Reusing headset: %s", self._caps)
+            err = capi.Headset_registerCapabilities(self._headset, self._caps)
+            if err != capi.ErrorCode.None_:
+                raise RuntimeError("Failed to register capabilities: {}".format(err))
+            self._setRegistered(self._active | int(self._caps), self._passive)
+            return self
+        if debug:
+            logger.debug("Creating headset: %s", self._caps)
         err = capi.createHeadset(self._caps, self._headset)
         if err != capi.ErrorCode.None_:
             raise RuntimeError("Failed to create headset: {}".format(err))
+        self._setRegistered(int(self._caps), 0)
         return self
 
     # Frees resources used by a headset object, including memory and sockets
     #
-    # Upon return, this headset instance should no longer be used.
+    # Upon return, this headset instance should no longer be used,
+    # unless it was defined with `reuse=True`, in which case the headset is kept alive
+    # for the next `Headset.__enter__`.
     # @see Headset.__enter__
+    # @see Headset.close
     def __exit__(
         self,
         _e_type: Optional[Type[BaseException]],
@@ -229,38 +688,51 @@ class Headset(object):
         _traceback: Optional[TracebackType],
     ) -> bool:
         if _e_type is not None:
-            logger.error("Headset: exception raised: {}".format(_e_val))
-        if self._headset is not None:
+            logger.error("Headset: exception raised: %s", _e_val)
+        if not self._reuse:
+            self.close()
+        return True if _e_type is None else False
+
+    # Frees resources used by a headset object, including memory and sockets
+    #
+    # This is done by `Headset.__exit__`, unless the headset was defined with `reuse=True`.
+    # Does nothing if the headset is not alive.
+    # @see Headset.__exit__
+    def close(self) -> None:
+        # finishes the pending asynchronous calls while the headset is still alive
+        executor = self._executor
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait=True)
+        if capi.Headset_isValid(self._headset):
             capi.Headset_destroy(self._headset)
+            self._eyeFrameBundle = None
+            self._status = None
+            self._measurementCache.clear()
+            self._userAbsent = False
+            self._setRegistered(0, 0)
+            self._lastGazedObject = _OBJECT_ID_INVALID
             logger.debug("Destroyed headset")
-        return True if _e_type is None else False
 
     # Checks whether the headset is connected or not.
     #
     # @return Whether an HMD is known to be connected, and the call success status
     # @see Headset.createHeadset
-    def isHardwareConnected(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isHardwareConnected(self._headset, b)
-        return Result(b.val, err)
+    isHardwareConnected = _fastGetter(_fast.Headset_isHardwareConnected)
 
     # Checks if motion tracking hardware has started
     #
     # @return Whether motion tracking hardware has started, and the call success status
-    def isMotionReady(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isMotionReady(self._headset, b)
-        return Result(b.val, err)
+    isMotionReady = _fastGetter(_fast.Headset_isMotionReady)
 
     # Checks whether the client can run against the installed version of the FOVE SDK.
     #
     # This makes a blocking call to the runtime.
+    # Other python threads keep running while it waits, as the GIL is released.
     #
     # @return capi.ErrorCode.None_ if this client is compatible with the installed FOVE service,
     # or an error indicating the problem otherwise
-    def checkSoftwareVersions(self) -> Result[None]:
-        err = capi.Headset_checkSoftwareVersions(self._headset)
-        return Result(None, err)
+    checkSoftwareVersions = _noArgCall(capi.Headset_checkSoftwareVersions)
 
     # Gets the information about the current software versions.
     #
@@ -269,6 +741,7 @@ class Headset(object):
     # `Headset.checkSoftwareVersions` to ensure that the client and runtime are compatible.
     #
     # This makes a blocking call to the runtime.
+    # Other python threads keep running while it waits, as the GIL is released.
     #
     # @return information about the current software versions, and the call success status
     def querySoftwareVersions(self) -> Result[capi.Versions]:
@@ -288,9 +761,21 @@ class Headset(object):
     #
     # @return information about the currently activated licenses, and the call success status
     def queryLicenses(self) -> Result[List[capi.LicenseInfo]]:
-        err = capi.ErrorCode.UnknownError
-        list = capi.Headset_queryLicenses(self._headset, err)
-        return Result(list, err)
+        # not through capi.Headset_queryLicenses, which writes its error code into the enum value it is given
+        licenses: List[capi.LicenseInfo] = []
+        err = capi.Headset_queryLicensesInto(self._headset, licenses)
+        return Result(licenses, err)
+
+    # Writes information about any licenses currently activated into the given list
+    #
+    # Same as `Headset.queryLicenses`, but the given list is cleared and filled in place,
+    # so that code polling the licenses can keep reusing the same list.
+    #
+    # @param out The list to fill with the currently activated licenses
+    # @return The given list, and the call success status
+    def queryLicensesInto(self, out: List[capi.LicenseInfo]) -> Result[List[capi.LicenseInfo]]:
+        err = capi.Headset_queryLicensesInto(self._headset, out)
+        return Result(out, err)
 
     # Gets the information about the hardware information
     #
@@ -310,7 +795,7 @@ class Headset(object):
     #
     # @return capi.ErrorCode.None if the call succeeded
     def hasAccessToFeature(self, featureName: str) -> Result[bool]:
-        b = capi.Bool(False)
+        b = self._buffers.boolBuf
         err = capi.Headset_hasAccessToFeature(self._headset, featureName, b)
         return Result(b.val, err)
 
@@ -343,6 +828,8 @@ class Headset(object):
     # @returncapi.ErrorCode.License_FeatureAccessDenied if your license doesn't offer access to this capability
     def registerCapabilities(self, caps: capi.ClientCapabilities) -> Result[None]:
         err = capi.Headset_registerCapabilities(self._headset, caps)
+        if err == capi.ErrorCode.None_:
+            self._setRegistered(self._active | int(caps), self._passive)
         return Result(None, err)
     
     # Registers a passive client capability, enabling the required hardware as needed
@@ -365,6 +852,8 @@ class Headset(object):
     # @returncapi.ErrorCode.License_FeatureAccessDenied if your license doesn't offer access to this capability
     def registerPassiveCapabilities(self, caps: capi.ClientCapabilities) -> Result[None]:
         err = capi.Headset_registerPassiveCapabilities(self._headset, caps)
+        if err == capi.ErrorCode.None_:
+            self._setRegistered(self._active, self._passive | int(caps))
         return Result(None, err)
 
     # Unregisters a client capability previously registered
@@ -374,6 +863,8 @@ class Headset(object):
     # @returncapi.ErrorCode.Connect_NotConnected if not connected to the service
     def unregisterCapabilities(self, caps: capi.ClientCapabilities) -> Result[None]:
         err = capi.Headset_unregisterCapabilities(self._headset, caps)
+        if err == capi.ErrorCode.None_:
+            self._setRegistered(self._active & ~int(caps), self._passive)
         return Result(None, err)
 
     # Unregisters a passive client capability previously registered
@@ -383,8 +874,21 @@ class Headset(object):
     # @returncapi.ErrorCode.Connect_NotConnected if not connected to the service
     def unregisterPassiveCapabilities(self, caps: capi.ClientCapabilities) -> Result[None]:
         err = capi.Headset_unregisterPassiveCapabilities(self._headset, caps)
+        if err == capi.ErrorCode.None_:
+            self._setRegistered(self._active, self._passive & ~int(caps))
         return Result(None, err)
 
+    # Records the capabilities registered through this headset and updates the available ones, see `Headset.__init__`
+    def _setRegistered(self, active: int, passive: int) -> None:
+        self._active = active
+        self._passive = passive
+        self._registered = active | passive
+        self._available = self._registered & ~_PRESENCE_GATED if self._userAbsent else self._registered
+
+    # The result of a getter of the capability `capBit` that is not in `_available`
+    def _unavailable(self, capBit: int, default) -> Result:
+        return _newResult(Result, (default, _NotRegistered if not self._registered & capBit else _Unreliable))
+
     # Waits for next eye camera frame to be processed
     #
     # Allows you to sync your eye tracking loop to the actual eye-camera loop.
@@ -393,6 +897,7 @@ class Headset(object):
     # and finally get the desired eye tracking data using the getters.
     #
     # Eye tracking should be enabled by registering the `Fove_ClientCapabilities_EyeTracking` before calling this function.
+    # Other python threads keep running while it waits, as the GIL is released.
     #
     # @return capi.ErrorCode.None_ if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
@@ -400,9 +905,7 @@ class Headset(object):
     #
     # @see Headset.fetchEyeTrackingData
     # @see HeadsetfetchEyesImage
-    def waitForProcessedEyeFrame(self) -> Result[None]:
-        err = capi.Headset_waitForProcessedEyeFrame(self._headset)
-        return Result(None, err)
+    waitForProcessedEyeFrame = _noArgCall(_Headset_waitForProcessedEyeFrame)
 
     # Fetch the latest eye tracking related data from runtime service
     #
@@ -412,14 +915,22 @@ class Headset(object):
     #
     # Eye tracking should be enabled by registering the `capi.ClientCapabilities.EyeTracking` before calling this function.
     #
+    # Pose updates queued with `Headset.queueGazableObjectUpdate` or `Headset.queueCameraObjectUpdate` are applied first.
+    #
     # @return The latest Eye Frame timestamp, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     def fetchEyeTrackingData(self) -> Result[capi.FrameTimestamp]:
-        timestamp = capi.FrameTimestamp()
-        err = capi.Headset_fetchEyeTrackingData(self._headset, timestamp)
-        return Result(timestamp, err)
+        if self._sceneUpdatesPending:
+            self._flushPendingSceneUpdates()
+        timestamp = self._buffers.eyeTrackingTimestampBuf
+        err = _Headset_fetchEyeTrackingData(self._headset, timestamp)
+        self._eyeFrameBundle = None
+        self._status = None
+        if self._fetchHooks and int(err) == _NO_ERROR:
+            self._afterFetch()
+        return _newResult(Result, (timestamp, err))
 
     # Fetch the latest eyes camera image from the runtime service
     #
@@ -443,10 +954,36 @@ class Headset(object):
     # @see Headset.getEyesImage
     # @see Headset.fetchEyeTrackingData
     # @see Headset.waitForProcessedEyeFrame
-    def fetchEyesImage(self) -> Result[capi.FrameTimestamp]:
-        timestamp = capi.FrameTimestamp()
-        err = capi.Headset_fetchEyesImage(self._headset, timestamp)
-        return Result(timestamp, err)
+    fetchEyesImage = _timestampGetter(capi.Headset_fetchEyesImage, "eyesImageTimestampBuf")
+
+    # Waits for the next eye frame to be processed, then fetches its data
+    #
+    # This does `Headset.waitForProcessedEyeFrame`, `Headset.fetchEyeTrackingData`
+    # and, if `capi.ClientCapabilities.EyesImage` was given to the constructor, `Headset.fetchEyesImage`
+    # in a single call, which is the preferred way to run an eye tracking loop synchronized with the eye cameras.
+    # The GIL is released while waiting.
+    #
+    # The timestamps are written into the same buffers as the individual fetch functions.
+    # As for `Headset.fetchEyeTrackingData`, queued pose updates are applied first.
+    #
+    # @return The timestamps of the fetched eye tracking data and eyes image (None if not fetched), and the call status:
+    # - capi.ErrorCode.None if all the calls succeeded
+    # - the error of the wait if it failed, in which case nothing is fetched
+    # - the first error of the fetch calls otherwise
+    # @see Headset.waitForProcessedEyeFrame
+    # @see Headset.fetchEyeTrackingData
+    # @see Headset.fetchEyesImage
+    def waitAndFetchFrame(self) -> Result[Tuple[capi.FrameTimestamp, Optional[capi.FrameTimestamp]]]:
+        eyeTrackingTimestamp = self._buffers.eyeTrackingTimestampBuf
+        eyesImageTimestamp = self._buffers.eyesImageTimestampBuf if self._caps & _EyesImage else None
+        if self._sceneUpdatesPending:
+            self._flushPendingSceneUpdates()
+        err = _Headset_waitAndFetchFrame(self._headset, eyeTrackingTimestamp, eyesImageTimestamp)
+        self._eyeFrameBundle = None
+        self._status = None
+        if self._fetchHooks and int(err) == _NO_ERROR:
+            self._afterFetch()
+        return _newResult(Result, ((eyeTrackingTimestamp, eyesImageTimestamp), err))
 
     # Writes out the eye frame timestamp of the cached eyes image
     #
@@ -460,10 +997,7 @@ class Headset(object):
     # - capi.ErrorCode_API_NotRegistered if the required capability has not been registered prior to this call\n
     # - capi.ErrorCode_API_NullInPointer if outTimestamp is null
     # @see Headset.fetchEyesImage
-    def getEyeTrackingDataTimestamp(self) -> Result[capi.FrameTimestamp]:
-        timestamp = capi.FrameTimestamp()
-        err = capi.Headset_getEyeTrackingDataTimestamp(self._headset, timestamp)
-        return Result(timestamp, err)
+    getEyeTrackingDataTimestamp = _timestampGetter(capi.Headset_getEyeTrackingDataTimestamp, "eyeTrackingTimestampBuf")
 
     # Writes out the eye frame timestamp of the cached eyes image
     #
@@ -477,10 +1011,71 @@ class Headset(object):
     # - capi.ErrorCode_API_NotRegistered if the required capability has not been registered prior to this call\n
     # - capi.ErrorCode_API_NullInPointer if outTimestamp is null
     # @see Headset.fetchEyesImage
-    def getEyesImageTimestamp(self) -> Result[capi.FrameTimestamp]:
-        timestamp = capi.FrameTimestamp()
-        err = capi.Headset_getEyesImageTimestamp(self._headset, timestamp)
-        return Result(timestamp, err)
+    getEyesImageTimestamp = _timestampGetter(capi.Headset_getEyesImageTimestamp, "eyesImageTimestampBuf")
+
+    # Gets all the eye tracking data of the currently cached eye frame at once
+    #
+    # This reads the gaze vectors, the gaze screen positions, the combined gaze ray and depth,
+    # the attention shift status, the eye states, the pupil, iris and eyeball radii, the eye torsions,
+    # the pupil and eye shapes, the user IPD and IOD, the user presence, the gazed object,
+    # as well as the cached headset pose and the timestamps of the eye tracking and pose data with a single call to the FOVE API,
+    # so prefer it over the individual getters when several of them are needed per frame.
+    #
+    # When reading everything (`caps` is None), the individual eye tracking getters read their value
+    # from the bundle returned here until the next call to `Headset.fetchEyeTrackingData`.
+    # `Headset.getPose` does not, as the pose is updated by `Headset.fetchPoseData` instead.
+    #
+    # Each field of the bundle comes with its own error code (e.g. `gazeVectorL` and `gazeVectorLError`)
+    # that is the one the corresponding individual getter would have returned.
+    #
+    # @param caps The capabilities whose data should be read, or None to read everything
+    # @return The eye tracking data of the current eye frame, and the call success status:
+    # - capi.ErrorCode.None if all the data of the registered capabilities could be read
+    # - capi.ErrorCode.API_NotRegistered if none of the requested capabilities is registered
+    # - otherwise the first error code among the bundle fields
+    # @see Headset.fetchEyeTrackingData
+    def getEyeFrameBundle(self, caps: Optional[capi.ClientCapabilities] = None) -> Result[capi.EyeFrameBundle]:
+        bundle = _EyeFrameBundle()
+        if caps is None:
+            err = _Headset_getEyeFrameBundle(self._headset, _FRAME_CAPS, bundle)
+            self._eyeFrameBundle = bundle
+        else:
+            err = _Headset_getEyeFrameBundle(self._headset, caps, bundle)
+        return _newResult(Result, (bundle, err))
+
+    # Attaches a ring buffer to be filled by `Headset.writeGazeRow`
+    #
+    # Each row of the buffer receives the gaze data of one eye frame, laid out as
+    # `[gazeL.x, gazeL.y, gazeL.z, gazeR.x, gazeR.y, gazeR.z, combinedGazeDepth, userShiftingAttention]`,
+    # so that a window of frames can be post-processed with vectorized expressions,
+    # e.g. `numpy.arctan2(buffer[:, 0], buffer[:, 2])` for the horizontal angle of the left gaze.
+    #
+    # @param buffer A writable float32 buffer of shape (N, 8), such as `numpy.zeros((N, 8), dtype=numpy.float32)`,
+    # or None to detach the current buffer
+    # @see Headset.writeGazeRow
+    def attachGazeBuffer(self, buffer) -> None:
+        self._gazeBuffer = buffer
+        self._gazeBufferRow = 0
+
+    # Writes the gaze data of the currently cached eye frame into the next row of the attached buffer
+    #
+    # Rows are written in order and wrap around at the end of the buffer.
+    # The gaze depth and attention shift columns are written as 0 when their capability is not registered,
+    # without failing the row.
+    #
+    # @return The index of the written row, and the call success status:
+    # - capi.ErrorCode.None if all the gaze data of the registered capabilities could be read
+    # - capi.ErrorCode.API_NullInPointer if no buffer is attached
+    # - otherwise the first error code returned by the underlying getters
+    # @exception RuntimeError If the attached buffer does not have the expected type or shape
+    # @see Headset.attachGazeBuffer
+    def writeGazeRow(self) -> Result[int]:
+        if self._gazeBuffer is None:
+            return _newResult(Result, (-1, capi.ErrorCode.API_NullInPointer))
+        row = self._gazeBufferRow
+        err = _Headset_writeGazeRow(self._headset, self._gazeBuffer, row)
+        self._gazeBufferRow = (row + 1) % len(self._gazeBuffer)
+        return _newResult(Result, (row, err))
 
     # Gets the gaze vector of an individual eye
     #
@@ -495,9 +1090,36 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def getGazeVector(self, eye: capi.Eye) -> Result[capi.Vec3]:
-        vec = capi.Vec3()
-        err = capi.Headset_getGazeVector(self._headset, eye, vec)
-        return Result(vec, err)
+        e = _eyeIndex(eye)
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            if e == _LEFT:
+                return _newResult(Result, (bundle.gazeVectorL, bundle.gazeVectorLError))
+            return _newResult(Result, (bundle.gazeVectorR, bundle.gazeVectorRError))
+        vec = self._buffers.gazeVectorBufs[e]
+        err = _Headset_getGazeVector(self._headset, e, vec)
+        return _newResult(Result, (vec, err))
+
+    # Gets the gaze vectors of both eyes
+    #
+    # This is `Headset.getGazeVector` for the left then the right eye, in a single call into the C API.
+    # As the error codes of both eyes are returned as one, the left one takes precedence:
+    # it is the error of the left eye when it is not `capi.ErrorCode.None_`, and the error of the right eye otherwise.
+    # Use `Headset.getGazeVector` (or `Headset.getEyeFrameBundle`) when the error of each eye matters.
+    #
+    # The vectors are written into a buffer reused by the next call to this function, use `Result.copy` to keep them.
+    #
+    # @return The left & right 3D gaze vectors, and the call success status, see `Headset.getGazeVector`
+    def getGazeVectors(self) -> Result[Tuple[capi.Vec3, capi.Vec3]]:
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            err = bundle.gazeVectorLError
+            if int(err) == _NO_ERROR:
+                err = bundle.gazeVectorRError
+            return _newResult(Result, ((bundle.gazeVectorL, bundle.gazeVectorR), err))
+        vecs = self._buffers.gazeVectorsBufs
+        err = capi.Headset_getGazeVectors(self._headset, vecs[0], vecs[1])
+        return _newResult(Result, (vecs, err))
 
     # Gets the user's 2D gaze position on the screens seen through the HMD's lenses
     #
@@ -523,9 +1145,15 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def getGazeScreenPosition(self, eye: capi.Eye) -> Result[capi.Vec2]:
-        vec = capi.Vec2()
-        err = capi.Headset_getGazeScreenPosition(self._headset, eye, vec)
-        return Result(vec, err)
+        e = _eyeIndex(eye)
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            if e == _LEFT:
+                return _newResult(Result, (bundle.gazeScreenPositionL, bundle.gazeScreenPositionLError))
+            return _newResult(Result, (bundle.gazeScreenPositionR, bundle.gazeScreenPositionRError))
+        vec = self._buffers.gazeScreenPositionBufs[e]
+        err = _Headset_getGazeScreenPosition(self._headset, e, vec)
+        return _newResult(Result, (vec, err))
 
     # Gets the user's 2D gaze position on a virtual screen in front of the user.
     #
@@ -552,9 +1180,14 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def getGazeScreenPositionCombined(self) -> Result[capi.Vec2]:
-        vec = capi.Vec2()
-        err = capi.Headset_getGazeScreenPositionCombined(self._headset, vec)
-        return Result(vec, err)
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            return _newResult(
+                Result, (bundle.gazeScreenPositionCombined, bundle.gazeScreenPositionCombinedError)
+            )
+        vec = self._buffers.gazeScreenPositionCombinedBuf
+        err = _Headset_getGazeScreenPositionCombined(self._headset, vec)
+        return _newResult(Result, (vec, err))
 
     # Get eyes gaze ray resulting from the two eye gazes combined together
     #
@@ -570,9 +1203,12 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def getCombinedGazeRay(self) -> Result[capi.Ray]:
-        ray = capi.Ray()
-        err = capi.Headset_getCombinedGazeRay(self._headset, ray)
-        return Result(ray, err)
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            return _newResult(Result, (bundle.combinedGazeRay, bundle.combinedGazeRayError))
+        ray = self._buffers.combinedGazeRayBuf
+        err = _Headset_getCombinedGazeRay(self._headset, ray)
+        return _newResult(Result, (ray, err))
 
     # Get eyes gaze depth resulting from the two eye gazes combined together
     #
@@ -586,9 +1222,13 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def getCombinedGazeDepth(self) -> Result[float]:
-        depth = capi.Float()
-        err = capi.Headset_getCombinedGazeDepth(self._headset, depth)
-        return Result(depth.val, err)
+        if not self._available & _GAZE_DEPTH:
+            return self._unavailable(_GAZE_DEPTH, 0.0)
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            return _newResult(Result, (bundle.combinedGazeDepth, bundle.combinedGazeDepthError))
+        value, err = _fast.Headset_getCombinedGazeDepth(self._headset)
+        return _newResult(Result, (value, err))
 
     # Get whether the user is shifting its attention between objects or looking at something specific (fixation or pursuit).
     #
@@ -604,9 +1244,13 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def isUserShiftingAttention(self) -> Result[bool]:
-        b = capi.Bool()
-        err = capi.Headset_isUserShiftingAttention(self._headset, b)
-        return Result(b.val, err)
+        if not self._available & _USER_ATTENTION_SHIFT:
+            return self._unavailable(_USER_ATTENTION_SHIFT, False)
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            return _newResult(Result, (bundle.userShiftingAttention, bundle.userShiftingAttentionError))
+        value, err = _fast.Headset_isUserShiftingAttention(self._headset)
+        return _newResult(Result, (value, err))
 
     # Get the state of an individual eye
     #
@@ -620,10 +1264,7 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def getEyeState(self, eye: capi.Eye) -> Result[capi.EyeState]:
-        b = capi.EyeStateObj()
-        err = capi.Headset_getEyeState(self._headset, eye, b)
-        return Result(b.val, err)
+    getEyeState = _bundledEyeGetter(_fastEyeGetter(_fast.Headset_getEyeState), "eyeState")
 
     # Checks if eye tracking hardware has started
     #
@@ -631,10 +1272,7 @@ class Headset(object):
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def isEyeTrackingEnabled(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isEyeTrackingEnabled(self._headset, b)
-        return Result(b.val, err)
+    isEyeTrackingEnabled = _statusGetter(_fastGetter(_fast.Headset_isEyeTrackingEnabled), "eyeTrackingEnabled")
 
     # Checks if eye tracking has been calibrated
     #
@@ -645,10 +1283,7 @@ class Headset(object):
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def isEyeTrackingCalibrated(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isEyeTrackingCalibrated(self._headset, b)
-        return Result(b.val, err)
+    isEyeTrackingCalibrated = _statusGetter(_fastGetter(_fast.Headset_isEyeTrackingCalibrated), "eyeTrackingCalibrated")
 
     # Checks if eye tracking is in the process of calibration
     #
@@ -659,10 +1294,7 @@ class Headset(object):
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def isEyeTrackingCalibrating(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isEyeTrackingCalibrating(self._headset, b)
-        return Result(b.val, err)
+    isEyeTrackingCalibrating = _statusGetter(_fastGetter(_fast.Headset_isEyeTrackingCalibrating), "eyeTrackingCalibrating")
 
     # Check whether the eye tracking system is currently calibrated for glasses.
     #
@@ -677,10 +1309,7 @@ class Headset(object):
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Uncalibrated if the eye tracking system is currently uncalibrated
-    def isEyeTrackingCalibratedForGlasses(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isEyeTrackingCalibratedForGlasses(self._headset, b)
-        return Result(b.val, err)
+    isEyeTrackingCalibratedForGlasses = _statusGetter(_fastGetter(_fast.Headset_isEyeTrackingCalibratedForGlasses), "eyeTrackingCalibratedForGlasses")
 
     # Check whether or not the GUI that asks the user to adjust their headset is being displayed
     #
@@ -691,10 +1320,7 @@ class Headset(object):
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def isHmdAdjustmentGuiVisible(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isHmdAdjustmentGuiVisible(self._headset, b)
-        return Result(b.val, err)
+    isHmdAdjustmentGuiVisible = _statusGetter(_fastGetter(_fast.Headset_isHmdAdjustmentGuiVisible), "hmdAdjustmentGuiVisible")
 
     # Check whether the GUI that asks the user to adjust their headset was hidden by timeout
     #
@@ -705,10 +1331,7 @@ class Headset(object):
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def hasHmdAdjustmentGuiTimeout(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_hasHmdAdjustmentGuiTimeout(self._headset, b)
-        return Result(b.val, err)
+    hasHmdAdjustmentGuiTimeout = _statusGetter(_fastGetter(_fast.Headset_hasHmdAdjustmentGuiTimeout), "hmdAdjustmentGuiTimeout")
 
     # Checks if eye tracking is actively tracking an eye - or eyes.
     #
@@ -721,10 +1344,7 @@ class Headset(object):
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def isEyeTrackingReady(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isEyeTrackingReady(self._headset, b)
-        return Result(b.val, err)
+    isEyeTrackingReady = _statusGetter(_fastGetter(_fast.Headset_isEyeTrackingReady), "eyeTrackingReady")
 
     # Checks whether the user is wearing the headset or not
     #
@@ -739,17 +1359,42 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def isUserPresent(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isUserPresent(self._headset, b)
-        return Result(b.val, err)
+    isUserPresent = _statusGetter(_bundledGetter(_fastGetter(_fast.Headset_isUserPresent, _Caps.UserPresence, False), "userPresent", _Caps.UserPresence), "userPresent")
+
+    # Gets all the status flags of the headset at once
+    #
+    # This reads the flags of `Headset.isEyeTrackingEnabled`, `Headset.isEyeTrackingCalibrated`,
+    # `Headset.isEyeTrackingCalibrating`, `Headset.isEyeTrackingCalibratedForGlasses`,
+    # `Headset.isHmdAdjustmentGuiVisible`, `Headset.hasHmdAdjustmentGuiTimeout`, `Headset.isEyeTrackingReady`,
+    # `Headset.isUserPresent` and `Headset.isPositionReady` with a single call to the FOVE API.
+    # Until the next call to `Headset.fetchEyeTrackingData` or `Headset.fetchPoseData`, or to a function
+    # starting or stopping the calibration, and for at most about a frame (`_STATUS_TTL`),
+    # these getters read their flag from the status returned here.
+    #
+    # Each flag of the status comes with its own error code (e.g. `eyeTrackingReady` and `eyeTrackingReadyError`),
+    # and `bits` packs the successfully read flags into an int.
+    #
+    # @return The status of the headset, and the call success status:
+    # - capi.ErrorCode.None if all the flags of the registered capabilities could be read
+    # - capi.ErrorCode.API_NotRegistered if none of the flags has its capability registered
+    # - otherwise the first error code among the status flags
+    def getStatus(self) -> Result[capi.HeadsetStatus]:
+        status = _HeadsetStatus()
+        err = _Headset_getStatus(self._headset, status)
+        self._status = status
+        self._statusExpiry = _monotonic() + _STATUS_TTL
+        return Result(status, err)
 
     # Returns the eyes camera image
     #
     # The eyes image is synchronized with and fetched at the same as the gaze
     # during the call to `fetchEyeTrackingData`.
     #
-    # The image data buffer is invalidated upon the next call to this function.
+    # The image data buffer is invalidated upon the next call to this function,
+    # and so is the returned `capi.BitmapImage` object, which is reused.
+    # Its pixels can be viewed without copy as a `height x width x channels` array
+    # with `numpy.asarray(result.value.pixels)`, and copied into an existing array
+    # with `numpy.copyto(out, result.value.pixels)` when they need to outlive that buffer.
     # `capi.ClientCapabilities.EyesImage` should be registered to use this function.
     #
     # @return The Eye camera image, and the call success status:
@@ -759,13 +1404,14 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreadable if the data couldn't be read properly from memory
     def getEyesImage(self) -> Result[capi.BitmapImage]:
-        b = capi.BitmapImage()
-        err = capi.Headset_getEyesImage(self._headset, b)
+        b = self._buffers.eyesImageBuf
+        err = _Headset_getEyesImage(self._headset, b)
         return Result(b, err)
 
     # Returns the user IPD (Inter Pupillary Distance), in meters
     #
     # `capi.ClientCapabilities.UserIPD` should be registered to use this function.
+    # A successful result is reused for half a second, or until the calibration is started or stopped.
     #
     # @return The user IPD value, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
@@ -774,14 +1420,12 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def getUserIPD(self) -> Result[float]:
-        b = capi.Float()
-        err = capi.Headset_getUserIPD(self._headset, b)
-        return Result(b.val, err)
+    getUserIPD = _bundledGetter(_cachedGetter(_fastGetter(_fast.Headset_getUserIPD, _Caps.UserIPD, 0.0), "userIPD"), "userIPD", _Caps.UserIPD)
 
     # Returns the user IOD (Inter Occular Distance), in meters
     #
     # `capi.ClientCapabilities.UserIOD` should be registered to use this function.
+    # A successful result is reused for half a second, or until the calibration is started or stopped.
     #
     # @return The user IOD value, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
@@ -790,10 +1434,7 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def getUserIOD(self) -> Result[float]:
-        b = capi.Float()
-        err = capi.Headset_getUserIOD(self._headset, b)
-        return Result(b.val, err)
+    getUserIOD = _bundledGetter(_cachedGetter(_fastGetter(_fast.Headset_getUserIOD, _Caps.UserIOD, 0.0), "userIOD"), "userIOD", _Caps.UserIOD)
 
     # Returns the user pupils radius, in meters
     #
@@ -807,14 +1448,12 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def getPupilRadius(self, eye: capi.Eye) -> Result[float]:
-        b = capi.Float()
-        err = capi.Headset_getPupilRadius(self._headset, eye, b)
-        return Result(b.val, err)
+    getPupilRadius = _bundledEyeGetter(_fastEyeGetter(_fast.Headset_getPupilRadius, _Caps.PupilRadius, 0.0), "pupilRadius", _Caps.PupilRadius)
 
     # Returns the user iris radius, in meters
     #
     # `capi.ClientCapabilities.IrisRadius` should be registered to use this function.
+    # A successful result is reused for half a second, or until the calibration is started or stopped.
     #
     # @param eye Specify which eye to get the value for
     # @return The iris radius of the specified eye, and the call success status:
@@ -824,14 +1463,12 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def getIrisRadius(self, eye: capi.Eye) -> Result[float]:
-        b = capi.Float()
-        err = capi.Headset_getIrisRadius(self._headset, eye, b)
-        return Result(b.val, err)
+    getIrisRadius = _bundledEyeGetter(_cachedEyeGetter(_fastEyeGetter(_fast.Headset_getIrisRadius, _Caps.IrisRadius, 0.0), "irisRadius"), "irisRadius", _Caps.IrisRadius)
 
     # Returns the user eyeballs radius, in meters
     #
     # `capi.ClientCapabilities.EyeballRadius` should be registered to use this function.
+    # A successful result is reused for half a second, or until the calibration is started or stopped.
     #
     # @param eye Specify which eye to get the value for
     # @return The eyeball radius of the specified eye, and the call success status:
@@ -841,10 +1478,7 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
-    def getEyeballRadius(self, eye: capi.Eye) -> Result[float]:
-        b = capi.Float()
-        err = capi.Headset_getEyeballRadius(self._headset, eye, b)
-        return Result(b.val, err)
+    getEyeballRadius = _bundledEyeGetter(_cachedEyeGetter(_fastEyeGetter(_fast.Headset_getEyeballRadius, _Caps.EyeballRadius, 0.0), "eyeballRadius"), "eyeballRadius", _Caps.EyeballRadius)
 
     # Returns the user eye torsion, in degrees
     #
@@ -860,13 +1494,12 @@ class Headset(object):
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     # - capi.ErrorCode.API_NullInPointer if both `outAngle` is `nullptr`
     # - capi.ErrorCode.License_FeatureAccessDenied if the current license is not sufficient for this feature
-    def getEyeTorsion(self, eye: capi.Eye) -> Result[float]:
-        b = capi.Float()
-        err = capi.Headset_getEyeTorsion(self._headset, eye, b)
-        return Result(b.val, err)
+    getEyeTorsion = _bundledEyeGetter(_fastEyeGetter(_fast.Headset_getEyeTorsion, _Caps.EyeTorsion, 0.0), "eyeTorsion", _Caps.EyeTorsion)
 
     # Returns the outline shape of the specified user eye in the Eyes camera image.
     #
+    # The shape views as a 12x2 float32 array of outline points, e.g. with `result.asNumpy()`.
+    #
     # `capi.ClientCapabilities.EyeShape` should be registered to use this function.
     #
     # @param eye Specify which eye to get the value for
@@ -880,12 +1513,22 @@ class Headset(object):
     # - capi.ErrorCode.API_NullInPointer if both `outShape` is `nullptr`
     # - capi.ErrorCode.License_FeatureAccessDenied if the current license is not sufficient for this feature
     def getEyeShape(self, eye: capi.Eye) -> Result[capi.EyeShape]:
-        b = capi.EyeShape()
-        err = capi.Headset_getEyeShape(self._headset, eye, b)
-        return Result(b, err)
+        e = _eyeIndex(eye)
+        if not self._available & _EYE_SHAPE:
+            return self._unavailable(_EYE_SHAPE, _EyeShape())
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            if e == _LEFT:
+                return _newResult(Result, (bundle.eyeShapeL, bundle.eyeShapeLError))
+            return _newResult(Result, (bundle.eyeShapeR, bundle.eyeShapeRError))
+        b = _EyeShape()
+        err = _Headset_getEyeShape(self._headset, e, b)
+        return _newResult(Result, (b, err))
 
     # Returns the pupil ellipse of the specified user eye in the Eyes camera image.
     #
+    # The ellipse views as the float32 array `(center.x, center.y, size.x, size.y, angle)`, e.g. with `result.asNumpy()`.
+    #
     # `capi.ClientCapabilities.PupilShape` should be registered to use this function.
     #
     # @param eye Specify which eye to get the value for
@@ -898,9 +1541,17 @@ class Headset(object):
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     # - capi.ErrorCode.License_FeatureAccessDenied if the current license is not sufficient for this feature
     def getPupilShape(self, eye: capi.Eye) -> Result[capi.PupilShape]:
-        b = capi.PupilShape()
-        err = capi.Headset_getPupilShape(self._headset, eye, b)
-        return Result(b, err)
+        e = _eyeIndex(eye)
+        if not self._available & _PUPIL_SHAPE:
+            return self._unavailable(_PUPIL_SHAPE, _PupilShape())
+        bundle = self._eyeFrameBundle
+        if bundle is not None:
+            if e == _LEFT:
+                return _newResult(Result, (bundle.pupilShapeL, bundle.pupilShapeLError))
+            return _newResult(Result, (bundle.pupilShapeR, bundle.pupilShapeRError))
+        b = _PupilShape()
+        err = _Headset_getPupilShape(self._headset, e, b)
+        return _newResult(Result, (b, err))
 
     # Starts eye tracking calibration
     #
@@ -912,11 +1563,13 @@ class Headset(object):
     # @return capi.ErrorCode.Connect_NotConnected if not connected to the service
     # @return capi.ErrorCode.License_FeatureAccessDenied if any of the enabled options require a license beyond what is active on this machine
     def startEyeTrackingCalibration(
-        self, options: Optional[capi.CalibrationOptions]
+        self, options: Optional[capi.CalibrationOptions] = None
     ) -> Result[None]:
-        if not options:
-            options = capi.CalibrationOptions()
+        if options is None:
+            options = _DEFAULT_CALIBRATION_OPTIONS
         err = capi.Headset_startEyeTrackingCalibration(self._headset, options)
+        self._measurementCache.clear()
+        self._status = None
         return Result(None, err)
 
     # Stops eye tracking calibration if it's running, does nothing if it's not running
@@ -928,6 +1581,8 @@ class Headset(object):
     # @return capi.ErrorCode.Connect_NotConnected if not connected to the service
     def stopEyeTrackingCalibration(self) -> Result[None]:
         err = capi.Headset_stopEyeTrackingCalibration(self._headset)
+        self._measurementCache.clear()
+        self._status = None
         return Result(None, err)
 
     # Get the state of the currently running calibration process
@@ -962,6 +1617,9 @@ class Headset(object):
     #
     # Note that it is perfectly fine not to call this function, in which case the Fove service will automatically render the calibration process for you.
     #
+    # The calibration data is written into a buffer reused across calls, as this is called on every rendered frame:
+    # it is overwritten by the next call to this function, use `Result.copy` to keep it.
+    #
     # @return The current calibration data, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
@@ -971,7 +1629,7 @@ class Headset(object):
     def tickEyeTrackingCalibration(
         self, deltaTime: float, isVisible: bool
     ) -> Result[capi.CalibrationData]:
-        s = capi.CalibrationData()
+        s = self._buffers.calibrationDataBuf
         err = capi.Headset_tickEyeTrackingCalibration(
             self._headset, deltaTime, isVisible, s
         )
@@ -993,10 +1651,58 @@ class Headset(object):
     # @see Headset.updateGazableObject
     # @see Headset.removeGazableObject
     # @see Headset.Fove_GazeConvergenceData
-    def getGazedObjectId(self) -> Result[int]:
-        s = capi.Int()
-        err = capi.Headset_getGazedObjectId(self._headset, s)
-        return Result(s.val, err)
+    # @see Headset.setGazedObjectCallback
+    getGazedObjectId = _bundledGetter(
+        _fastGetter(_fast.Headset_getGazedObjectId, _Caps.GazedObjectDetection, _OBJECT_ID_INVALID),
+        "gazedObjectId",
+        _Caps.GazedObjectDetection,
+    )
+
+    # Sets a function to be called when the gazed object changes
+    #
+    # The gazed object usually stays the same for many eye frames, so rather than comparing
+    # the result of `Headset.getGazedObjectId` on each frame, the callback is only called when it differs
+    # from the previous one, with the ID of the newly gazed object (`fove_ObjectIdInvalid` when none).
+    # The check is done by `Headset.fetchEyeTrackingData` and `Headset.waitAndFetchFrame` on successful fetches,
+    # and the callback is called from the thread that fetched.
+    #
+    # `capi.ClientCapabilities.GazedObjectDetection` should be registered for the callback to be called.
+    #
+    # @param callback The function to call with the ID of the gazed object, or None to remove the current one
+    def setGazedObjectCallback(self, callback: Optional[Callable[[int], None]]) -> None:
+        self._lastGazedObject = _OBJECT_ID_INVALID
+        self._gazedObjectCallback = callback
+        self._fetchHooks = self._presenceGating or callback is not None
+
+    # Updates what depends on the newly fetched eye frame
+    def _afterFetch(self) -> None:
+        if self._presenceGating:
+            self._checkUserPresence()
+        if self._gazedObjectCallback is not None:
+            self._checkGazedObject()
+
+    # Withholds or restores the per-user eye data, depending on whether the user is present in the newly fetched eye frame
+    #
+    # The user is only considered absent when the service says so,
+    # the data are not withheld if the presence is unknown (e.g. `capi.ClientCapabilities.UserPresence` not registered).
+    def _checkUserPresence(self) -> None:
+        present, err = Headset.isUserPresent(self)
+        absent = int(err) == _NO_ERROR and not present
+        if absent != self._userAbsent:
+            self._userAbsent = absent
+            self._setRegistered(self._active, self._passive)
+            # the cached measurements (e.g. iris radius) are withheld as well, and may be of another user afterwards
+            self._measurementCache.clear()
+
+    # Calls the gazed object callback if the gazed object of the newly fetched eye frame is not the previous one
+    def _checkGazedObject(self) -> None:
+        objectId, err = Headset.getGazedObjectId(self)
+        if int(err) != _NO_ERROR or objectId == self._lastGazedObject:
+            return
+        self._lastGazedObject = objectId
+        callback = self._gazedObjectCallback
+        if callback is not None:
+            callback(objectId)
 
     # Registers an object in the 3D world
     #
@@ -1028,7 +1734,7 @@ class Headset(object):
     # @see Headset.registerCameraObject
     # @see Headset.removeGazableObject
     def updateGazableObject(self, objectId: int, pose: capi.ObjectPose) -> Result[None]:
-        err = capi.Headset_updateGazableObject(self._headset, objectId, pose)
+        err = _Headset_updateGazableObject(self._headset, objectId, pose)
         return Result(None, err)
 
     # Removes a previously registered 3D object from the scene.
@@ -1044,6 +1750,21 @@ class Headset(object):
         err = capi.Headset_removeGazableObject(self._headset, objectId)
         return Result(None, err)
 
+    # Queues a pose update of a previously registered 3D object
+    #
+    # Unlike `Headset.updateGazableObject`, the update is only applied upon the next call to `Headset.flushSceneUpdates`,
+    # or to the functions fetching eye tracking data, together with the other queued updates.
+    # This is meant for scenes updating many objects per frame.
+    # The pose is copied, so the same object may be reused for the next update.
+    #
+    # @param objectId     Id of the object passed to registerGazableObject()
+    # @param pose         the updated pose of the object
+    # @see Headset.flushSceneUpdates
+    # @see Headset.updateGazableObject
+    def queueGazableObjectUpdate(self, objectId: int, pose: capi.ObjectPose) -> None:
+        self._sceneUpdates.updateGazableObject(objectId, pose)
+        self._sceneUpdatesPending = True
+
     # Registers an camera in the 3D world
     #
     # Registering 3D world objects and camera allows FOVE software to identify which objects are being gazed at.
@@ -1075,7 +1796,7 @@ class Headset(object):
     # @see Headset.registerCameraObject
     # @see Headset.removeCameraObject
     def updateCameraObject(self, cameraId: int, pose: capi.ObjectPose) -> Result[None]:
-        err = capi.Headset_updateCameraObject(self._headset, cameraId, pose)
+        err = _Headset_updateCameraObject(self._headset, cameraId, pose)
         return Result(None, err)
 
     # Removes a previously registered camera from the scene.
@@ -1089,6 +1810,41 @@ class Headset(object):
         err = capi.Headset_removeCameraObject(self._headset, cameraId)
         return Result(None, err)
 
+    # Queues a pose update of a registered camera
+    #
+    # As for `Headset.queueGazableObjectUpdate`, the update is applied upon the next flush.
+    #
+    # @param cameraId     Id of the camera passed to registerCameraObject()
+    # @param pose         the updated pose of the camera
+    # @see Headset.flushSceneUpdates
+    # @see Headset.updateCameraObject
+    def queueCameraObjectUpdate(self, cameraId: int, pose: capi.ObjectPose) -> None:
+        self._sceneUpdates.updateCameraObject(cameraId, pose)
+        self._sceneUpdatesPending = True
+
+    # Applies all the queued object and camera pose updates at once
+    #
+    # This is done automatically by `Headset.fetchEyeTrackingData` and `Headset.waitAndFetchFrame`,
+    # call it directly to apply the updates at another point of the frame.
+    #
+    # @return capi.ErrorCode.None if all the updates succeeded
+    # @return the first error code returned by an update otherwise, e.g. capi.ErrorCode.API_InvalidArgument
+    # if an object was not registered. The other updates are applied anyway.
+    # @see Headset.queueGazableObjectUpdate
+    # @see Headset.queueCameraObjectUpdate
+    def flushSceneUpdates(self) -> Result[None]:
+        # cleared before flushing: the flush takes the queued updates out of the queue before releasing the GIL,
+        # so an update queued by another thread during the flush stays queued, and sets the flag again
+        self._sceneUpdatesPending = False
+        err = capi.Headset_flushSceneUpdates(self._headset, self._sceneUpdates)
+        return Result(None, err)
+
+    # Flushes the queued scene updates before a fetch, which only has its own status to return
+    def _flushPendingSceneUpdates(self) -> None:
+        err = Headset.flushSceneUpdates(self).error
+        if err != capi.ErrorCode.None_:
+            logger.error("Failed to apply the queued scene updates: %s", err)
+
     # Tares the orientation of the headset
     #
     # Any or both of `capi.ClientCapabilities.OrientationTracking` and `capi.ClientCapabilities.PositionTracking`
@@ -1099,6 +1855,7 @@ class Headset(object):
     # @return capi.ErrorCode.Connect_NotConnected if not connected to the service
     def tareOrientationSensor(self) -> Result[None]:
         err = capi.Headset_tareOrientationSensor(self._headset)
+        self._measurementCache.clear()
         return Result(None, err)
 
     # Writes out whether position tracking hardware has started and returns whether it was successful
@@ -1110,10 +1867,7 @@ class Headset(object):
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def isPositionReady(self) -> Result[bool]:
-        b = capi.Bool(False)
-        err = capi.Headset_isPositionReady(self._headset, b)
-        return Result(b.val, err)
+    isPositionReady = _statusGetter(_fastGetter(_fast.Headset_isPositionReady), "positionReady")
 
     # Tares the position of the headset
     #
@@ -1122,9 +1876,7 @@ class Headset(object):
     # @return capi.ErrorCode.None if the call succeeded
     # @return capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # @return capi.ErrorCode.Connect_NotConnected if not connected to the service
-    def tarePositionSensors(self) -> Result[None]:
-        err = capi.Headset_tarePositionSensors(self._headset)
-        return Result(None, err)
+    tarePositionSensors = _noArgCall(capi.Headset_tarePositionSensors)
 
     # Fetch the latest headset pose related data from runtime service
     #
@@ -1141,12 +1893,15 @@ class Headset(object):
     # - capi.ErrorCode.API_NotRegistered if the required capability has not been registered prior to this call
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     def fetchPoseData(self) -> Result[capi.FrameTimestamp]:
-        b = capi.FrameTimestamp()
-        err = capi.Headset_fetchPoseData(self._headset, b)
-        return Result(b, err)
+        # the flags read by `Headset.getStatus`, such as whether the position is ready, may have changed
+        self._status = None
+        timestamp = self._buffers.poseTimestampBuf
+        return _newResult(Result, (timestamp, _Headset_fetchPoseData(self._headset, timestamp)))
 
     # Writes out the pose of the head-mounted display
     #
+    # The pose is written into a buffer reused by the next call to this function, use `Result.copy` to keep it.
+    #
     # @return The Headset pose, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
@@ -1155,16 +1910,18 @@ class Headset(object):
     # - capi.ErrorCode.Data_Unreliable if the returned data is too unreliable to be used
     # - capi.ErrorCode.Data_LowAccuracy if the returned data is of low accuracy
     def getPose(self) -> Result[capi.Pose]:
-        pose = capi.Pose()
-        err = capi.Headset_getPose(self._headset, pose)
-        return Result(pose, err)
+        pose = self._buffers.poseBuf
+        err = _Headset_getPose(self._headset, pose)
+        return _newResult(Result, (pose, err))
 
     # Returns the position camera image
     #
     # The position image is synchronized with and fetched at the same as the pose
     # during the call to `fetchPoseData`.
     #
-    # The image data buffer is invalidated upon the next call to this function.
+    # The image data buffer is invalidated upon the next call to this function,
+    # and so is the returned `capi.BitmapImage` object, which is reused.
+    # As for `Headset.getEyesImage`, `result.value.pixels` views its pixels without copy.
     # `capi.ClientCapabilities.PositionImage` should be registered to use this function.
     #
     # @return The position camera image, and the call success status:
@@ -1174,7 +1931,7 @@ class Headset(object):
     # - capi.ErrorCode.Data_NoUpdate if the capability is registered but no valid data has been returned by the service yet
     # - capi.ErrorCode.Data_Unreadable if the data couldn't be read properly from memory
     def getPositionImage(self) -> Result[capi.BitmapImage]:
-        i = capi.BitmapImage()
+        i = self._buffers.positionImageBuf
         err = capi.Headset_getPositionImage(self._headset, i)
         return Result(i, err)
 
@@ -1189,18 +1946,19 @@ class Headset(object):
     #
     # @param zNear        The near plane in float, Range: from 0 to zFar
     # @param zFar         The far plane in float, Range: from zNear to infinity
+    # The matrices are written into a buffer reused by the next call to this function, use `Result.copy` to keep them.
+    # They unpack as `left, right = result.value`, and `result.asNumpy()` views both as a single 2x4x4 float32 array.
+    #
     # @return The 4x4 projection left & right matrices (left-handed), and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
     def getProjectionMatricesLH(
         self, zNear: float, zFar: float
-    ) -> Result[Tuple[capi.Matrix44, capi.Matrix44]]:
-        lMat, rMat = capi.Matrix44(), capi.Matrix44()
-        err = capi.Headset_getProjectionMatricesLH(
-            self._headset, zNear, zFar, lMat, rMat
-        )
-        return Result((lMat, rMat), err)
+    ) -> Result[capi.Matrix44Pair]:
+        mats = self._buffers.projectionMatricesLHBufs
+        err = capi.Headset_getProjectionMatricesLH(self._headset, zNear, zFar, mats)
+        return Result(mats, err)
 
     # Gets the valoues of passed-in right-handed 4x4 projection matrices
     #
@@ -1213,18 +1971,19 @@ class Headset(object):
     #
     # @param zNear        The near plane in float, Range: from 0 to zFar
     # @param zFar         The far plane in float, Range: from zNear to infinity
+    # The matrices are written into a buffer reused by the next call to this function, use `Result.copy` to keep them.
+    # They unpack as `left, right = result.value`, and `result.asNumpy()` views both as a single 2x4x4 float32 array.
+    #
     # @return The left & right 4x4 projection matrices (right-handed), and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
     def getProjectionMatricesRH(
         self, zNear: float, zFar: float
-    ) -> Result[Tuple[capi.Matrix44, capi.Matrix44]]:
-        lMat, rMat = capi.Matrix44(), capi.Matrix44()
-        err = capi.Headset_getProjectionMatricesRH(
-            self._headset, zNear, zFar, lMat, rMat
-        )
-        return Result((lMat, rMat), err)
+    ) -> Result[capi.Matrix44Pair]:
+        mats = self._buffers.projectionMatricesRHBufs
+        err = capi.Headset_getProjectionMatricesRH(self._headset, zNear, zFar, mats)
+        return Result(mats, err)
 
     # Gets values for the view frustum of both eyes at 1 unit away
     #
@@ -1233,6 +1992,8 @@ class Headset(object):
     # other struct, however setting both to `nullptr` is considered and error and the function will return
     # `Fove_ErrorCode::API_NullOutPointersOnly`.
     #
+    # The parameters are written into a buffer reused by the next call to this function, use `Result.copy` to keep them.
+    #
     # @return The left & right camera projection parameters, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
@@ -1240,22 +2001,25 @@ class Headset(object):
     def getRawProjectionValues(
         self,
     ) -> Result[Tuple[capi.ProjectionParams, capi.ProjectionParams]]:
-        lParams, rParams = capi.ProjectionParams(), capi.ProjectionParams()
-        err = capi.Headset_getRawProjectionValues(self._headset, lParams, rParams)
-        return Result((lParams, rParams), err)
+        params = self._buffers.rawProjectionValuesBufs
+        err = capi.Headset_getRawProjectionValues(self._headset, params[0], params[1])
+        return Result(params, err)
 
     # Gets the matrices to convert from eye- to head-space coordintes.
     #
     # This is simply a translation matrix that returns +/- IOD/2
     #
+    # The matrices are written into a buffer reused by the next call to this function, use `Result.copy` to keep them.
+    # They unpack as `left, right = result.value`, and `result.asNumpy()` views both as a single 2x4x4 float32 array.
+    #
     # @return The matrix describing left & right eye and right transforms data, and the call success status:
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def getEyeToHeadMatrices(self) -> Result[Tuple[capi.Matrix44, capi.Matrix44]]:
-        lMat, rMat = capi.Matrix44(), capi.Matrix44()
-        err = capi.Headset_getEyeToHeadMatrices(self._headset, lMat, rMat)
-        return Result((lMat, rMat), err)
+    def getEyeToHeadMatrices(self) -> Result[capi.Matrix44Pair]:
+        mats = self._buffers.eyeToHeadMatricesBufs
+        err = capi.Headset_getEyeToHeadMatrices(self._headset, mats)
+        return Result(mats, err)
 
     # Gets interocular distance in meters
     #
@@ -1268,10 +2032,7 @@ class Headset(object):
     # - capi.ErrorCode.None if the call succeeded
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # - capi.ErrorCode.Data_NoUpdate if no valid data has been returned by the service yet
-    def getRenderIOD(self) -> Result[float]:
-        iod = capi.Float(-1.0)
-        err = capi.Headset_getRenderIOD(self._headset, iod)
-        return Result(iod.val, err)
+    getRenderIOD = _fastGetter(_fast.Headset_getRenderIOD)
 
     # Creates a new profile
     #
@@ -1317,7 +2078,10 @@ class Headset(object):
 
     # Lists all existing profiles
     #
-    # @return The list of profile name existing, and the call success status:
+    # The names are returned as a `capi.ProfileList`, a sequence of str decoding each name only when it is accessed,
+    # which compares equal to a list of the same names: use `result.value.tolist()` for an actual list.
+    #
+    # @return The names of the existing profiles, and the call success status:
     # - capi.ErrorCode.None if the profile names were successfully listed
     # - capi.ErrorCode.Connect_NotConnected if not connected to the service
     # @see Headset.createProfile
@@ -1326,10 +2090,10 @@ class Headset(object):
     # @see Headset.setCurrentProfile
     # @see Headset.queryCurrentProfile
     # @see Headset.queryProfileDataPath
-    def listProfiles(self) -> Result[List[str]]:
-        err = capi.ErrorCode.UnknownError
-        list = capi.Headset_listProfiles(self._headset, err)
-        return Result(list, err)
+    def listProfiles(self) -> Result[capi.ProfileList]:
+        names = capi.ProfileList()
+        err = capi.Headset_listProfiles(self._headset, names)
+        return Result(names, err)
 
     # Sets the current profile
     #
@@ -1352,6 +2116,9 @@ class Headset(object):
     # @see Headset.queryProfileDataPath
     def setCurrentProfile(self, profileName: str) -> Result[None]:
         err = capi.Headset_setCurrentProfile(self._headset, profileName)
+        # the user measurements and the calibration state are those of the new profile from now on
+        self._measurementCache.clear()
+        self._status = None
         return Result(None, err)
 
     # Gets the current profile
@@ -1415,6 +2182,92 @@ class Headset(object):
     def createCompositor(self) -> Compositor:
         return Compositor(self._headset)
 
+    # Calls a getter of this headset on a background thread
+    #
+    # The calls are run one after the other by a worker thread owned by the headset, created on the first call,
+    # so that the current thread can go on with other work (e.g. preparing the next frame) while they wait on the service.
+    # The calls that block on the service release the GIL, and the worker has its own out-parameter buffers.
+    # Use `gather` to wait for several calls at once.
+    #
+    # @code
+    # futures = [headset.callAsync(headset.getPupilRadius, eye) for eye in (Eye.Left, Eye.Right)]
+    # ...
+    # pupilRadiusL, pupilRadiusR = gather(futures)
+    # @endcode
+    #
+    # @param getter The function to call, typically a bound method of this headset like `headset.getPupilRadius`
+    # @param args The arguments to pass to the getter
+    # @return A future of the result of the getter
+    def callAsync(self, getter: Callable[..., T], *args) -> Future[T]:
+        executor = self._executor
+        if executor is None:
+            executor = self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FoveHeadset")
+        return executor.submit(getter, *args)
+
+
+# Wraps a function returning a `Result` to return its value, or raise a `FoveError` if it failed
+def _raising(method):
+    def raisingMethod(self: Headset, *args, **kwargs):
+        value, err = method(self, *args, **kwargs)
+        if int(err) != _NO_ERROR:
+            raise FoveError(err)
+        return value
+
+    raisingMethod.__name__ = method.__name__
+    raisingMethod.__doc__ = method.__doc__
+    return raisingMethod
+
+
+# The public `Headset` functions returning a `Result`, wrapped by `_RaisingHeadset`
+#
+# A function added to `Headset` that returns a `Result` has to be listed here as well.
+_RESULT_METHODS = (
+    "isHardwareConnected", "isMotionReady", "checkSoftwareVersions", "querySoftwareVersions",
+    "queryLicenses", "queryLicensesInto", "queryHardwareInfo", "hasAccessToFeature",
+    "activateLicense", "deactivateLicense", "registerCapabilities", "registerPassiveCapabilities",
+    "unregisterCapabilities", "unregisterPassiveCapabilities", "waitForProcessedEyeFrame",
+    "fetchEyeTrackingData", "fetchEyesImage", "waitAndFetchFrame", "getEyeTrackingDataTimestamp",
+    "getEyesImageTimestamp", "getEyeFrameBundle", "writeGazeRow", "getGazeVector", "getGazeVectors",
+    "getGazeScreenPosition", "getGazeScreenPositionCombined", "getCombinedGazeRay",
+    "getCombinedGazeDepth", "isUserShiftingAttention", "getEyeState", "isEyeTrackingEnabled",
+    "isEyeTrackingCalibrated", "isEyeTrackingCalibrating", "isEyeTrackingCalibratedForGlasses",
+    "isHmdAdjustmentGuiVisible", "hasHmdAdjustmentGuiTimeout", "isEyeTrackingReady",
+    "isUserPresent", "getStatus", "getEyesImage", "getUserIPD", "getUserIOD", "getPupilRadius",
+    "getIrisRadius", "getEyeballRadius", "getEyeTorsion", "getEyeShape", "getPupilShape",
+    "startEyeTrackingCalibration", "stopEyeTrackingCalibration", "getEyeTrackingCalibrationState",
+    "tickEyeTrackingCalibration", "getGazedObjectId", "registerGazableObject",
+    "updateGazableObject", "removeGazableObject", "registerCameraObject", "updateCameraObject",
+    "removeCameraObject", "flushSceneUpdates", "tareOrientationSensor", "isPositionReady",
+    "tarePositionSensors", "fetchPoseData", "getPose", "getPositionImage",
+    "getProjectionMatricesLH", "getProjectionMatricesRH", "getRawProjectionValues",
+    "getEyeToHeadMatrices", "getRenderIOD", "createProfile", "renameProfile", "listProfiles",
+    "setCurrentProfile", "queryCurrentProfile", "queryProfileDataPath",
+)
+
+
+# The headset created by `Headset(..., raiseOnError=True)`
+#
+# Its functions returning a `Result` in `Headset` are wrapped once here, at import time,
+# so that the headsets not raising on errors do not pay for a check of the mode on each call.
+class _RaisingHeadset(Headset):
+    __slots__ = ()
+
+    for _name in _RESULT_METHODS:
+        vars()[_name] = _raising(vars(Headset)[_name])
+    del _name
+
+
+# Waits for the futures returned by `Headset.callAsync` and returns their results, in the same order
+#
+# @param futures The futures to wait for
+# @param timeout The maximum time to wait for all of them in seconds, or None to wait as long as needed
+# @exception concurrent.futures.TimeoutError When the results are not all available before the timeout
+def gather(futures: List[Future[T]], timeout: Optional[float] = None) -> List[T]:
+    if timeout is None:
+        return [future.result() for future in futures]
+    deadline = _monotonic() + timeout
+    return [future.result(max(0.0, deadline - _monotonic())) for future in futures]
+
 
 # Class that manages accesses to the compositor
 #
@@ -1451,8 +2304,12 @@ class Compositor(object):
     def __init__(self, headset: capi.Fove_Headset) -> None:
         # XXX this is perhaps ugly, but we cannot pass args to __enter__
         self._headset = headset
-        logger.debug("Creating compositor: headset: {}".format(self._headset))
+        logger.debug("Creating compositor: headset: %s", self._headset)
         self._compositor = capi.Fove_Compositor()
+        self._buffers = _CompositorOutBuffers()
+        # worker thread of `Compositor.startNextPose`, created on its first call, and its pending wait
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._nextPose: Optional[Future] = None
 
     # Creates a compositor interface to the given headset
     #
@@ -1481,12 +2338,20 @@ class Compositor(object):
         _e_val: Optional[Type[BaseException]],
         _traceback: Optional[TracebackType],
     ) -> bool:
-        if _e_type is not None:
-            logger.error("Headset: exception raised: {}".format(_e_val))
-        if self._compositor is not None:
-            capi.Compositor_destroy(self._compositor)
+        ok = _e_type is None
+        # lets a pending `Compositor.startNextPose` wait finish while the compositor is still alive
+        executor = self._executor
+        if executor is not None:
+            self._executor = None
+            self._nextPose = None
+            executor.shutdown(wait=True)
+        compositor = self._compositor
+        if compositor is not None:
+            capi.Compositor_destroy(compositor)
             logger.debug("Destroyed compositor")
-        return True if _e_type is None else False
+        if not ok:
+            logger.error("Compositor: exception raised: %s", _e_val)
+        return ok
 
     # Create a layer for this client
     #
@@ -1511,7 +2376,7 @@ class Compositor(object):
         layer = capi.CompositorLayer()
         err = capi.Compositor_createLayer(self._compositor, layerInfo, layer)
         if err != capi.ErrorCode.None_:
-            logger.error("compositor.createLayer() failed: {}".format(err))
+            logger.error("compositor.createLayer() failed: %s", err)
             return None
         return layer
 
@@ -1520,15 +2385,12 @@ class Compositor(object):
     # This function takes the feed from your game engine to the compositor for output.
     # @param submitInfo   An array of layerCount capi.CompositorLayerSubmitInfo structs, each of which provides texture data for a unique layer
     # @param layerCount   The number of layers you are submitting
-    # @return True if successfully submitted, or None in case of API failure
+    # @return The call success status
     def submit(
         self, submitInfo: capi.CompositorLayerSubmitInfo, layerCount: int
-    ) -> Optional[bool]:
+    ) -> Result[None]:
         err = capi.Compositor_submit(self._compositor, submitInfo, layerCount)
-        if err != capi.ErrorCode.None_:
-            logger.error("compositor.submit() failed: {}".format(err))
-            return None
-        return True
+        return Result(None, err)
 
     # Wait for the most recent pose for rendering purposes
     #
@@ -1572,73 +2434,141 @@ class Compositor(object):
         else:
             return None, True
 
+    # Starts waiting for the next render pose on a background thread
+    #
+    # This runs `Compositor.waitForRenderPose` on a worker thread owned by the compositor, created on the first call,
+    # so that the current thread can go on with the work of the current frame (e.g. submitting it, or fetching
+    # the eye tracking data) while the wait for the next frame is already in flight.
+    # The wait releases the GIL. Get its result with `Compositor.collectNextPose`.
+    # Calling this again before the pose is collected does not start another wait.
+    #
+    # @code
+    # # with compositor
+    # compositor.startNextPose()
+    # while True:
+    #    pose, err = compositor.collectNextPose()  # Wait for the frame, and get the pose
+    #    compositor.startNextPose()                # Start waiting for the next one already
+    #    if pose:
+    #        Draw(pose)
+    # @endcode
+    #
+    # @return A future of the result of `Compositor.waitForRenderPose`
+    # @see Compositor.collectNextPose
+    def startNextPose(self) -> Future[Tuple[Optional[capi.Pose], Optional[bool]]]:
+        future = self._nextPose
+        if future is None:
+            executor = self._executor
+            if executor is None:
+                executor = self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FoveCompositor")
+            future = self._nextPose = executor.submit(self.waitForRenderPose)
+        return future
+
+    # Gets the render pose waited for by `Compositor.startNextPose`
+    #
+    # Blocks until the wait started by `Compositor.startNextPose` is over,
+    # or waits for the pose right away if no wait was started.
+    #
+    # @param timeout How long to wait for the pending wait to finish, in seconds, None to wait for as long as it takes
+    # @return The same as `Compositor.waitForRenderPose`
+    # @see Compositor.startNextPose
+    def collectNextPose(self, timeout: Optional[float] = None) -> Tuple[Optional[capi.Pose], Optional[bool]]:
+        future = self._nextPose
+        if future is None:
+            return self.waitForRenderPose()
+        result = future.result(timeout)
+        self._nextPose = None
+        return result
+
     # Gets the last cached pose for rendering purposes, without waiting for a new frame to arrive.
     #
-    # @return Last cached pose, or None in case of API failure
-    def getLastRenderPose(self) -> Optional[capi.Pose]:
+    # @return Last cached pose, and the call success status
+    def getLastRenderPose(self) -> Result[capi.Pose]:
         pose = capi.Pose()
         err = capi.Compositor_getLastRenderPose(self._compositor, pose)
-        if err != capi.ErrorCode.None_:
-            logger.error("compositor.getLastRenderPose() failed: {}".format(err))
-            return None
-        return pose
+        return Result(pose, err)
 
     # Checks whether we are connected to a running compositor and ready to submit frames for composing
     #
-    # @return True if we are connected to a running compositor and ready to submit frames for compositing, False if not,
-    # or else None in case of API failure
-    def isReady(self) -> Optional[bool]:
-        b = capi.Bool(False)
+    # @return True if we are connected to a running compositor and ready to submit frames for compositing,
+    # False if not, and the call success status
+    def isReady(self) -> Result[bool]:
+        b = self._buffers.boolBuf
         err = capi.Compositor_isReady(self._compositor, b)
-        if err != capi.ErrorCode.None_:
-            logger.error("compositor.isReady() failed: {}".format(err))
-            return None
-        return b.val
+        return Result(b.val, err)
 
     # Returns the ID of the GPU currently attached to the headset
     #
     # For systems with multiple GPUs, submitted textures to the compositor must
     # come from the same GPU that the compositor is using.
     #
-    # @return The adapter ID, or None in case of API failure
-    def queryAdapterId(self) -> Optional[capi.AdapterId]:
+    # @return The adapter ID, and the call success status
+    def queryAdapterId(self) -> Result[capi.AdapterId]:
         adapterId = capi.AdapterId()
         err = capi.Compositor_queryAdapterId(self._compositor, adapterId)
-        if err != capi.ErrorCode.None_:
-            logger.error("compositor.queryAdapterId() failed: {}".format(err))
-            return None
-        return adapterId
+        return Result(adapterId, err)
+
+    # Checks whether the compositor is ready, and gets its adapter ID and last render pose if it is
+    #
+    # This does the work of `Compositor.isReady`, `Compositor.queryAdapterId` and `Compositor.getLastRenderPose`
+    # in a single call into the C API, for the loops polling the compositor until it can be used.
+    # It does not wait for a new frame, use `Compositor.waitForRenderPose` in the render loop.
+    #
+    # @return A tuple `(ready, adapterId, pose)`, and the call success status:
+    # `ready` is True if the compositor is ready to composite frames, in which case `adapterId` and `pose`
+    # are the adapter ID and last cached pose, and False if it is not ready, in which case they are None
+    def probe(
+        self,
+    ) -> Result[Tuple[bool, Optional[capi.AdapterId], Optional[capi.Pose]]]:
+        b = self._buffers.boolBuf
+        adapterId = capi.AdapterId()
+        pose = capi.Pose()
+        err = capi.Compositor_probe(self._compositor, b, adapterId, pose)
+        if int(err) != _NO_ERROR or not b.val:
+            return Result((False, None, None), err)
+        return Result((True, adapterId, pose), err)
 
 
-# Establishes a connection to the headset.
-# Call this once when start interacting with the headset.
-def connectToHeadset(headset: capi.Fove_Headset, caps: capi.ClientCapabilities) -> bool:
-    b = capi.Bool()
+# Fetches data with `fetch` until there is some, or until the `deadline` of `time.monotonic` is passed
+#
+# Between two attempts, this blocks in `wait` when given, and sleeps otherwise.
+# @return Whether data could be fetched before the deadline
+def _waitReady(headset: capi.Fove_Headset, fetch, wait, label: str, deadline: float) -> bool:
     t = capi.FrameTimestamp()
-    (iter, maxIter) = (0, 1000)
-
-    if caps & Headset.ET_CAPS:
-        while (
-            iter < maxIter
-            and capi.Headset_fetchEyeTrackingData(headset, t)
-            == capi.ErrorCode.Data_NoUpdate
-        ):
+    nextLog = time.monotonic() + 1.0
+    while fetch(headset, t) == capi.ErrorCode.Data_NoUpdate:
+        now = time.monotonic()
+        if now >= deadline:
+            return False
+        if now >= nextLog:
+            nextLog = now + 1.0
+            logger.debug("Waiting for %s data to become ready", label)
+        if wait is None:
             time.sleep(0.01)
-            iter += 1
-            if iter % 100 == 0:
-                logger.debug("Waiting for eye tracking data to become ready")
-
-    if caps & Headset.POS_CAPS:
-        while (
-            iter < maxIter
-            and capi.Headset_fetchPoseData(headset, t) == capi.ErrorCode.Data_NoUpdate
-        ):
+            continue
+        err = wait(headset)
+        if err != capi.ErrorCode.None_ and err != capi.ErrorCode.API_Timeout:
+            # the wait failed right away (e.g. not connected yet), do not spin on it
             time.sleep(0.01)
-            iter += 1
-            if iter % 100 == 0:
-                logger.debug("Waiting for pos tracking data to become ready")
+    return True
 
-    return iter < maxIter
+
+# Establishes a connection to the headset.
+# Call this once when start interacting with the headset.
+def connectToHeadset(headset: capi.Fove_Headset, caps: capi.ClientCapabilities) -> bool:
+    needEyeTracking = bool(caps & ET_CAPS)
+    needPose = bool(caps & POS_CAPS)
+    # same overall budget as the former 1000 polls of 10ms
+    deadline = time.monotonic() + 10.0
+
+    # the eye tracking data is waited for by blocking until the next eye frame is processed,
+    # while there is no blocking wait for the pose data, so it is polled
+    if needEyeTracking and not _waitReady(
+        headset, capi.Headset_fetchEyeTrackingData, capi.Headset_waitForProcessedEyeFrame, "eye tracking", deadline
+    ):
+        return False
+    if needPose and not _waitReady(headset, capi.Headset_fetchPoseData, None, "pos tracking", deadline):
+        return False
+    return True
 
 
 if __name__ == "__main__":
@@ -1649,30 +2579,44 @@ if __name__ == "__main__":
     logger.addHandler(handler)
     logger.setLevel(logging.DEBUG)
 
-    caps = capi.ClientCapabilities.EyeTracking + capi.ClientCapabilities.EyesImage
+    caps = (
+        capi.ClientCapabilities.EyeTracking
+        | capi.ClientCapabilities.EyesImage
+        | capi.ClientCapabilities.OrientationTracking
+    )
     with Headset(caps) as headset, headset.createCompositor() as compositor:
         connectToHeadset(headset._headset, headset._caps)
 
-        logger.info("Headset connected: {}".format(headset.isHardwareConnected()))
-        logger.info("Headset checkVersions: {}".format(headset.checkSoftwareVersions()))
-        logger.info("Versions: {}".format(headset.querySoftwareVersions()))
-        logger.info("Compositor ready: {}".format(compositor.isReady()))
+        logger.info("Headset connected: %s", headset.isHardwareConnected())
+        logger.info("Headset checkVersions: %s", headset.checkSoftwareVersions())
+        logger.info("Versions: %s", headset.querySoftwareVersions())
+        logger.info("Compositor ready: %s", compositor.isReady())
 
         # Wrappers of our capi always returns a Result[T].
         # One always has to check its validity either by checking Result[T].__bool__()
         # or more expclicitly Result[T].isValid() before extracting the value of T.
         r: Result[bool] = headset.isEyeTrackingEnabled()
         if not r:
-            logger.error("Eye tracking: {}".format(r.error))
+            logger.error("Eye tracking: %s", r.error)
         else:
-            logger.info("Tracking: {}".format(r.value))
+            logger.info("Tracking: %s", r.value)
 
         r = headset.isEyeTrackingCalibrated()
         # In a boolean context, r is a shorthand for r.isValid()
         if not r:
-            logger.error("Calibration error: {}".format(r.error))
+            logger.error("Calibration error: %s", r.error)
         else:
-            logger.info("Calibrated: {}".format(r.value))
+            logger.info("Calibrated: %s", r.value)
+
+        # The per-frame vectors are copied into arrays allocated once, rather than into new arrays on each frame:
+        # the rows of gazeVectors are the left and right gaze vectors, those of gazeRay the origin and direction
+        gazeVectors = np.zeros((2, 3), dtype=np.float32)
+        gazeRay = np.zeros((2, 3), dtype=np.float32)
+
+        # The eyes image is only written to disk every IMAGE_WRITE_PERIOD frames,
+        # so that the loop runs at the eye tracking frame rate rather than at the rate of the disk writes
+        IMAGE_WRITE_PERIOD = 30
+        frameCount = 0
 
         while True:
             # On each loop, one calls this blocking function to wait for eye tracking
@@ -1685,50 +2629,62 @@ if __name__ == "__main__":
                 if res.error == capi.ErrorCode.API_Timeout:
                     logger.warning("Wait for eye frame timed out")
                     continue
-                logger.error("Failed to sync eye frame: {}".format(res.error))
+                logger.error("Failed to sync eye frame: %s", res.error)
                 break
 
             # When the frame is available, explicitly fetch the data so that the
             # following calls to "getters" give the updated data
             timestamp: Result[capi.FrameTimestamp] = headset.fetchEyeTrackingData()
             if not timestamp:
-                logger.error(
-                    "Failed to fetch eye tracking data: {}".format(timestamp.error)
-                )
-            logger.debug("Data timestamp updated to: {}".format(timestamp.value))
+                logger.error("Failed to fetch eye tracking data: %s", timestamp.error)
+            logger.debug("Data timestamp updated to: %s", timestamp.value)
 
             # Fetch the latest eyes image
             timestamp2: Result[capi.FrameTimestamp] = headset.fetchEyesImage()
             if not timestamp2:
-                logger.error("Failed to fetch eye image: {}".format(timestamp2.error))
-            logger.debug("Eye image timestamp updated to: {}".format(timestamp2.value))
-
-            v: Result[capi.Vec3] = headset.getGazeVector(capi.Eye.Left)
+                logger.error("Failed to fetch eye image: %s", timestamp2.error)
+            logger.debug("Eye image timestamp updated to: %s", timestamp2.value)
+
+            poseTimestamp: Result[capi.FrameTimestamp] = headset.fetchPoseData()
+            if not poseTimestamp:
+                logger.error("Failed to fetch pose data: %s", poseTimestamp.error)
+
+            # Read the data of the whole frame with a single call to the FOVE API:
+            # until the next fetch, the getters below return their value from it without calling the API again
+            bundle: Result[capi.EyeFrameBundle] = headset.getEyeFrameBundle()
+            if not bundle:
+                logger.debug("Eye frame bundle: %s", bundle.error)
+            frame = bundle.value
+
+            # Both gaze vectors at once, with the error of the left eye first
+            v: Result[Tuple[capi.Vec3, capi.Vec3]] = headset.getGazeVectors()
             if not v:
-                logger.error("Failed to get left gaze vector: {}".format(v.error))
+                logger.error("Failed to get gaze vectors: %s", v.error)
             else:
-                lVec = np.array(v.value)
-                logger.debug("Left gaze vector:  {} ({})".format(lVec, v.error))
-
-            v = headset.getGazeVector(capi.Eye.Left)
-            if not v:
-                logger.error("Failed to get right gaze vector: {} ".format(v.error))
-            else:
-                rVec = np.array(v.value)
-                logger.debug("Right gaze vector: {} ({})".format(lVec, v.error))
+                gazeVectors[0], gazeVectors[1] = v.value
+                logger.debug("Gaze vectors: %s (%s)", gazeVectors, v.error)
 
             v2: Result[capi.Ray] = headset.getCombinedGazeRay()
             if not v2:
-                logger.error("Failed to get gaze ray: {}".format(v2.error))
+                logger.error("Failed to get gaze ray: %s", v2.error)
             else:
-                gazeRay = np.array(v2.value)
-                logger.debug("Gaze ray: {} ({})".format(gazeRay, v2.error))
+                gazeRay[...] = v2.asNumpy()
+                logger.debug("Gaze ray: %s (%s)", gazeRay, v2.error)
+
+            # The pose is part of the bundle as well, with its own error code
+            if frame.poseError != capi.ErrorCode.None_:
+                logger.error("Failed to get pose: %s", frame.poseError)
+            else:
+                logger.debug("Pose: %s at %s", frame.pose, frame.poseTimestamp)
+
+            frameCount += 1
+            if frameCount % IMAGE_WRITE_PERIOD != 0:
+                continue
 
             img: Result[capi.BitmapImage] = headset.getEyesImage()
             if not img:
-                logger.error("Failed to get eye images: {}".format(img.error))
+                logger.error("Failed to get eye images: %s", img.error)
             else:
-                arr = np.array(img.value.image)
+                # view the image buffer rather than copying it
                 with open("data.bmp", "wb") as fout:
-                    arr.tofile(fout)
-                    time.sleep(3)
+                    np.frombuffer(img.value.image, dtype=np.uint8).tofile(fout)